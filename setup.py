@@ -30,4 +30,8 @@ setuptools.setup(
     install_requires=[
         "typing_extensions",
     ],
+    extras_require={
+        "orjson": ["orjson"],
+        "simplejson": ["simplejson"],
+    },
 )
@@ -0,0 +1,92 @@
+""" Tests for `typing_json.limits` """
+# pylint: disable = line-too-long, invalid-name, missing-docstring
+
+# standard imports
+import io
+from typing import Union, List, NamedTuple, Optional, Tuple, Dict
+from decimal import Decimal
+
+# internal imports
+from typing_json import load, loads, dumps, DecodeLimits, DecodeLimitExceeded
+from typing_json.decoding import from_json_obj
+
+
+def _exceeded(f, limit):
+    try:
+        f()
+        assert False
+    except DecodeLimitExceeded as e:
+        assert e.limit == limit
+
+
+def test_no_limits():
+    assert from_json_obj([[1, 2], [3]], List[List[int]], limits=DecodeLimits()) == [[1, 2], [3]]
+    assert loads("[[1, 2], [3]]", List[List[int]], limits=DecodeLimits()) == [[1, 2], [3]]
+
+
+def test_max_depth():
+    obj = [[[1]]]
+    assert from_json_obj(obj, List[List[List[int]]], limits=DecodeLimits(max_depth=4)) == obj
+    _exceeded(lambda: from_json_obj(obj, List[List[List[int]]], limits=DecodeLimits(max_depth=3)), "max_depth")
+    # depth counts the nesting of JSON values, not of types: unions are not accounted for
+    t = Optional[List[Optional[List[Optional[int]]]]]
+    assert from_json_obj([[1]], t, limits=DecodeLimits(max_depth=3)) == [[1]]
+    _exceeded(lambda: from_json_obj([[1]], t, limits=DecodeLimits(max_depth=2)), "max_depth")
+
+
+def test_max_length():
+    assert loads("[1, 2, 3]", List[int], limits=DecodeLimits(max_length=3)) == [1, 2, 3]
+    _exceeded(lambda: loads("[1, 2, 3, 4]", List[int], limits=DecodeLimits(max_length=3)), "max_length")
+    _exceeded(lambda: loads('{"a": 1, "b": 2}', Dict[str, int], limits=DecodeLimits(max_length=1)), "max_length")
+
+
+def test_max_string_length():
+    assert loads('"abc"', str, limits=DecodeLimits(max_string_length=3)) == "abc"
+    _exceeded(lambda: loads('"abcd"', str, limits=DecodeLimits(max_string_length=3)), "max_string_length")
+    _exceeded(lambda: loads('{"abcd": 1}', Dict[str, int], limits=DecodeLimits(max_string_length=3)), "max_string_length")
+
+
+def test_max_nodes():
+    assert loads("[1, 2, 3]", List[int], limits=DecodeLimits(max_nodes=4)) == [1, 2, 3]
+    _exceeded(lambda: loads("[1, 2, 3]", List[int], limits=DecodeLimits(max_nodes=3)), "max_nodes")
+    # trial decodes of union members and stringified keys count towards the budget
+    t = Union[List[str], List[bool], List[int]]
+    assert loads("[1, 2, 3]", t, limits=DecodeLimits(max_nodes=8)) == [1, 2, 3]
+    _exceeded(lambda: loads("[1, 2, 3]", t, limits=DecodeLimits(max_nodes=7)), "max_nodes")
+    s = dumps({(1, 2): 0}, Dict[Tuple[int, int], int])
+    assert loads(s, Dict[Tuple[int, int], int], limits=DecodeLimits(max_nodes=5)) == {(1, 2): 0}
+    _exceeded(lambda: loads(s, Dict[Tuple[int, int], int], limits=DecodeLimits(max_nodes=4)), "max_nodes")
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+
+def test_max_nodes_records():
+    # namedtuple rows and columns count towards the budget
+    obj = [{"x": i, "y": i} for i in range(10)]
+    assert from_json_obj(obj, List[Point], limits=DecodeLimits(max_nodes=31)) == [Point(i, i) for i in range(10)]
+    _exceeded(lambda: from_json_obj(obj, List[Point], limits=DecodeLimits(max_nodes=30)), "max_nodes")
+    s = dumps([Point(i, i) for i in range(10)], List[Point], columnar=True)
+    assert loads(s, List[Point], columnar=True, limits=DecodeLimits(max_nodes=23, max_depth=3)) == [Point(i, i) for i in range(10)]
+    _exceeded(lambda: loads(s, List[Point], columnar=True, limits=DecodeLimits(max_nodes=22)), "max_nodes")
+    _exceeded(lambda: loads(s, List[Point], columnar=True, limits=DecodeLimits(max_depth=2)), "max_depth")
+    _exceeded(lambda: loads(s, List[Point], columnar=True, limits=DecodeLimits(max_length=9)), "max_length")
+
+
+def test_max_time():
+    _exceeded(lambda: loads("[1, 2, 3]", List[int], limits=DecodeLimits(max_time=0.0)), "max_time")
+
+
+def test_max_input_size():
+    _exceeded(lambda: loads("[1, 2, 3]", List[int], limits=DecodeLimits(max_input_size=8)), "max_input_size")
+    with io.StringIO("[1, 2, 3]") as f:
+        _exceeded(lambda: load(f, List[int], limits=DecodeLimits(max_input_size=8)), "max_input_size")
+    with io.StringIO("[1.5]") as f:
+        assert load(f, List[Decimal], limits=DecodeLimits(max_input_size=8)) == [Decimal("1.5")]
+
+
+def test_not_swallowed_by_union():
+    t = Union[List[List[int]], List[int]]
+    _exceeded(lambda: from_json_obj([[1]], t, limits=DecodeLimits(max_depth=2)), "max_depth")
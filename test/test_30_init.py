@@ -36,6 +36,7 @@ def test_basetypes():
             data = f.getvalue()
         with io.StringIO(data) as f:
             assert load(f, t) == val
+        assert loads(data.encode("utf-8"), t) == val
 
 def test_error():
     try:
@@ -0,0 +1,133 @@
+""" Tests for the type-directed parsing options of `typing_json.load` and `typing_json.loads`. """
+# pylint: disable = line-too-long, invalid-name, missing-docstring
+
+# standard imports
+import io
+from decimal import Decimal
+from collections import OrderedDict
+import json
+import typing
+from typing import Dict, List, Mapping, NamedTuple, Optional, Tuple, Union
+
+# external dependencies
+from typing_extensions import Literal, TypedDict
+
+# internal imports
+from typing_json import load, loads
+from typing_json.decoding import from_json_obj, typed_parse_float
+
+
+NUMBER_DOCUMENTS = [
+    ("1.5", float),
+    ("1.0", float),
+    ("1", float),
+    ("1.0", int),
+    ("1e400", int),
+    ("1.00000000000000000001", float),
+    ("[1.5, 2.0, 3]", List[float]),
+    ("[1.0, 2, 3.0]", List[int]),
+    ("[1.5, 2.0]", Tuple[float, int]),
+    ("{\"a\": 1.5, \"b\": null}", Dict[str, Optional[float]]),
+    ("1.5", Literal[1.5, 2]),
+    ("2.0", Literal[1.5, 2]),
+    ("2.0", Literal[1, 2]),
+    ("1.5", Union[int, float]),
+    ("1.5", Decimal),
+    ("[1.5, 1.50]", List[Union[float, Decimal]]),
+]
+
+
+def test_typed_parse_float():
+    assert typed_parse_float(List[Decimal]) is Decimal
+    assert typed_parse_float(Dict[str, Union[int, Decimal]]) is Decimal
+    assert typed_parse_float(List[float], cast_decimal=False) is Decimal
+    assert typed_parse_float(List[Literal[1.5, "a"]]) is Decimal
+    assert typed_parse_float(List[Literal[1, "a"]]) is not Decimal
+    parse_float = typed_parse_float(List[float])
+    assert parse_float is not Decimal
+    assert isinstance(parse_float("1.5"), float)
+    assert isinstance(parse_float("1.0"), Decimal)
+    assert isinstance(parse_float("1e400"), Decimal)
+
+
+def test_typed_numbers():
+    for s, t in NUMBER_DOCUMENTS:
+        expected = loads(s, t)
+        val = loads(s, t, typed_numbers=True)
+        assert val == expected
+        assert type(val) is type(expected) # pylint: disable = unidiomatic-typecheck
+        with io.StringIO(s) as f:
+            assert load(f, t, typed_numbers=True) == expected
+
+
+def test_typed_numbers_errors():
+    for s, t in [("1.5", int), ("[1.5]", List[int]), ("1.5", Literal[2])]:
+        try:
+            loads(s, t, typed_numbers=True)
+            assert False
+        except TypeError:
+            assert True
+
+
+class Item(NamedTuple):
+    name: str
+    price: float
+    tags: List[str] = []
+
+class Header(TypedDict, total=False):
+    id: int
+    labels: Dict[str, float]
+
+CONTAINER_DOCUMENTS = [
+    ("[1.5, 2, 3.0]", List[float]),
+    ("{\"a\": 1.5, \"b\": 2}", Dict[str, float]),
+    ("{\"a\": [1, 2], \"b\": []}", Mapping[str, List[int]]),
+    ("{\"[1, 2]\": 1.5}", Dict[Tuple[int, int], float]),
+    ("{\"b\": 1.5, \"a\": 2}", typing.OrderedDict[str, float]),
+    ("[{\"b\": 1, \"a\": 2}, {\"a\": 3}]", List[typing.OrderedDict[str, int]]),
+    ("[{\"name\": \"x\", \"price\": 1.5}, [\"y\", 2, [\"t\"]]]", List[Item]),
+    ("{\"id\": 1, \"labels\": {\"a\": 1.5}}", Header),
+    ("[[1.0, 2.5], [\"a\"]]", List[Union[List[int], List[float], List[str]]]),
+    ("[[1.0, 2.0]]", List[Union[List[List[int]], List[Decimal]]]),
+]
+
+
+def test_typed_containers():
+    for s, t in CONTAINER_DOCUMENTS:
+        expected = loads(s, t)
+        for typed_numbers in (False, True):
+            val = loads(s, t, typed_containers=True, typed_numbers=typed_numbers)
+            assert val == expected
+            assert type(val) is type(expected) # pylint: disable = unidiomatic-typecheck
+            if isinstance(val, OrderedDict):
+                assert list(val.keys()) == list(expected.keys())
+
+
+def test_typed_containers_reuse():
+    obj = json.loads("{\"a\": [1, 2], \"b\": [3]}")
+    val = from_json_obj(obj, Dict[str, List[int]], in_place=True)
+    assert val is obj
+    assert val["a"] is obj["a"]
+    obj = json.loads("[{\"id\": 1.0}]", parse_float=Decimal)
+    val = from_json_obj(obj, List[Header], in_place=True)
+    assert val is obj and val[0] is obj[0] and val[0]["id"] == 1 and isinstance(val[0]["id"], int)
+    obj = json.loads("[1, 2]")
+    assert from_json_obj(obj, List[int]) is not obj
+
+
+def test_typed_containers_ordered_dicts():
+    try:
+        from_json_obj({"a": 1}, typing.OrderedDict[str, int])
+        assert False
+    except TypeError:
+        assert True
+    assert from_json_obj({"a": 1}, typing.OrderedDict[str, int], in_place=True) == OrderedDict([("a", 1)])
+    for s, t, expected in [
+            ("{\"b\": 1, \"a\": 2}", Optional[typing.OrderedDict[str, int]], OrderedDict([("b", 1), ("a", 2)])),
+            ("null", Optional[typing.OrderedDict[str, int]], None),
+            ("[{\"b\": 1, \"a\": 2}, null]", List[Optional[typing.OrderedDict[str, int]]], [OrderedDict([("b", 1), ("a", 2)]), None]),
+            ("{\"k\": {\"b\": 1}}", Dict[str, Union[int, typing.OrderedDict[str, int]]], {"k": OrderedDict([("b", 1)])}),
+        ]:
+        # the containers are not reused within unions, but plain dictionaries are still accepted for ordered dictionaries
+        val = loads(s, t, typed_containers=True)
+        assert val == expected and loads(s, t) == expected and type(val) is type(expected) # pylint: disable = unidiomatic-typecheck
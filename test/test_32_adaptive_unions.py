@@ -0,0 +1,98 @@
+""" Tests for `typing_json.unions` """
+# pylint: disable = line-too-long, invalid-name, missing-docstring
+
+# standard imports
+from decimal import Decimal
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+# external dependencies
+from typing_extensions import Literal
+
+# internal imports
+from typing_json import dumps, loads, set_adaptive_unions, union_stats, reset_union_stats
+from typing_json.decoding import from_json_obj
+from typing_json.encoding import to_json_obj
+from typing_json.unions import UnionProfile, adaptive_unions_enabled
+
+
+class Pair(NamedTuple):
+    left: int
+    right: int
+
+
+def test_profile_order():
+    t = Union[int, float, str, List[int]]
+    profile = UnionProfile(t, encoding=True)
+    for _ in range(10):
+        profile.record(3)
+        profile.record(1)
+    profile.record(2)
+    profile.reorder()
+    # `float` cannot be tried before `int`, which overlaps with it
+    assert profile.order == (3, 2, 0, 1)
+    assert profile.stats().order == (List[int], str, int, float)
+    assert profile.stats().hits == {int: 0, float: 10, str: 1, List[int]: 10}
+
+
+def test_profile_order_overlaps():
+    profile = UnionProfile(Union[Tuple[int, int], Pair, None], encoding=True)
+    for _ in range(5):
+        profile.record(1)
+    profile.reorder()
+    assert profile.order == (0, 1, 2)
+    profile = UnionProfile(Union[Tuple[int, int], Pair, None], encoding=False)
+    for _ in range(5):
+        profile.record(1)
+    profile.reorder()
+    assert profile.order == (0, 1, 2)
+    profile = UnionProfile(Union[Literal["a", 1], Decimal, Dict[str, int], str], encoding=False)
+    for _ in range(5):
+        profile.record(3)
+        profile.record(2)
+        profile.record(2)
+    profile.reorder()
+    assert profile.order == (2, 0, 1, 3)
+
+
+UNION_VALUES = [
+    (Union[int, float, Decimal, str, List[int]], [1, 1.5, Decimal("2.5"), "a", [1, 2], Decimal("3")]),
+    (Union[Tuple[int, int], Pair, Optional[List[float]]], [(1, 2), Pair(1, 2), None, [1, 2.5]]),
+    (Union[bool, int, Literal["x", 2], str], [True, 2, "x", "y", 3]),
+]
+
+
+def test_adaptive_results():
+    reset_union_stats()
+    for t, values in UNION_VALUES:
+        for _ in range(100):
+            for val in reversed(values):
+                encoded = to_json_obj(val, t, adaptive_unions=True)
+                assert encoded == to_json_obj(val, t, adaptive_unions=False)
+                decoded = from_json_obj(encoded, t, adaptive_unions=True)
+                expected = from_json_obj(encoded, t, adaptive_unions=False)
+                assert decoded == expected and type(decoded) is type(expected) # pylint: disable = unidiomatic-typecheck
+    stats = union_stats(encoding=True)
+    t = UNION_VALUES[0][0]
+    assert stats[t].hits[List[int]] == 100
+    assert stats[t].order[:2] == (int, float) and stats[t].order[-1] is Decimal
+    assert sum(union_stats()[t].hits.values()) == 100*len(UNION_VALUES[0][1])
+    reset_union_stats()
+    assert union_stats() == {}
+
+
+def test_process_wide_setting():
+    reset_union_stats()
+    assert not adaptive_unions_enabled()
+    t = Union[str, List[int]]
+    assert loads(dumps([1], t), t) == [1]
+    assert union_stats() == {}
+    set_adaptive_unions(True)
+    try:
+        assert loads(dumps([1], t), t) == [1]
+        assert union_stats()[t].hits == {str: 0, List[int]: 1}
+        assert union_stats(encoding=True)[t].hits == {str: 0, List[int]: 1}
+        assert loads(dumps([1], t), t, adaptive_unions=False) == [1]
+        assert union_stats()[t].hits == {str: 0, List[int]: 1}
+    finally:
+        set_adaptive_unions(False)
+        reset_union_stats()
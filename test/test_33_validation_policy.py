@@ -0,0 +1,134 @@
+""" Tests for `typing_json.validation` """
+# pylint: disable = line-too-long, invalid-name, missing-docstring
+
+# standard imports
+from collections import deque, OrderedDict
+from decimal import Decimal
+from typing import Deque, Dict, List, NamedTuple, Set, Tuple, Union
+
+# external dependencies
+from typing_extensions import Literal
+
+# internal imports
+from typing_json import dumps, loads, is_instance, DecodeLimits
+from typing_json.decoding import from_json_obj
+from typing_json.encoding import to_json_obj
+from typing_json.validation import (FULL_VALIDATION, NO_VALIDATION, first_n_validation, get_validation_policy,
+                                    sampled_validation, set_validation_policy)
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+
+def test_policy_indices():
+    assert FULL_VALIDATION.indices(5) == range(5)
+    assert NO_VALIDATION.indices(5) == range(0)
+    assert first_n_validation(3).indices(5) == range(3)
+    assert first_n_validation(3).indices(2) == range(2)
+    policy = sampled_validation(0.1, seed=7)
+    r = policy.indices(1000)
+    assert len(r) == 100 and r.step == 10 and 0 <= r.start < 10
+    assert policy.indices(1000) == r
+    assert list(sampled_validation(0.25).elements(list(range(8)))) == list(sampled_validation(0.25).indices(8))
+    # the validated fraction is never below the rate, and the indices are evenly spaced within the collection
+    for rate in (0.01, 0.1, 0.3, 0.4, 0.5, 0.7, 1.0):
+        for n in range(0, 60):
+            for seed in range(3):
+                r = sampled_validation(rate, seed=seed).indices(n)
+                assert len(r) >= n*rate and all(0 <= i < n for i in r)
+    assert sampled_validation(0.4).indices(10).step == 2
+    assert sampled_validation(1.0).indices(7) == range(7)
+    for bad in (0, -1, 1.5):
+        try:
+            sampled_validation(bad)
+            assert False
+        except ValueError:
+            assert True
+    try:
+        first_n_validation(-1)
+        assert False
+    except ValueError:
+        assert True
+
+
+def test_is_instance_policies():
+    obj = [1, 2, "x"]
+    assert not is_instance(obj, List[int])
+    assert is_instance(obj, List[int], validation=first_n_validation(2))
+    assert not is_instance(obj, List[int], validation=first_n_validation(3))
+    assert is_instance(obj, List[int], validation=NO_VALIDATION)
+    assert is_instance({"a": 1, "b": "x"}, Dict[str, int], validation=first_n_validation(1))
+    assert is_instance(deque([1, "x"]), Deque[int], validation=first_n_validation(1))
+    # fixed-length tuples and namedtuples are always fully checked
+    assert not is_instance((1, "x"), Tuple[int, int], validation=NO_VALIDATION)
+    assert not is_instance(Point(1, "y"), Point, validation=NO_VALIDATION) # type: ignore
+    # classes are always checked
+    assert not is_instance((1, 2), List[int], validation=NO_VALIDATION)
+    # nested collections are subject to the same policy
+    assert is_instance([[1, "x"], [2]], List[List[int]], validation=first_n_validation(1))
+
+
+def test_process_wide_policy():
+    assert get_validation_policy() is FULL_VALIDATION
+    set_validation_policy(NO_VALIDATION)
+    try:
+        assert is_instance(["x"], List[int])
+        assert to_json_obj(["x"], List[int]) == ["x"]
+        assert not is_instance(["x"], List[int], validation=FULL_VALIDATION)
+    finally:
+        set_validation_policy(FULL_VALIDATION)
+    assert not is_instance(["x"], List[int])
+
+
+def test_decoding_policies():
+    obj = [1, Decimal("2"), "x"]
+    try:
+        from_json_obj(obj, List[int])
+        assert False
+    except TypeError:
+        assert True
+    assert from_json_obj(obj, List[int], validation=first_n_validation(2)) == [1, 2, "x"]
+    val = from_json_obj([1, Decimal("2.5")], List[float], validation=NO_VALIDATION)
+    assert val == [1.0, 2.5] and all(isinstance(x, float) for x in val)
+    assert loads("[1, 2.0, 3]", List[int], validation=first_n_validation(1)) == [1, 2, 3]
+    # skipped elements are not truncated to int
+    for policy in (first_n_validation(1), sampled_validation(0.1), NO_VALIDATION):
+        try:
+            loads("[1, 2.5, 3.7]", List[int], validation=policy)
+            assert False
+        except TypeError:
+            assert True
+    assert from_json_obj(["a", 1], Set[Literal["a", "b"]], validation=first_n_validation(1)) == {"a", 1}
+    assert from_json_obj(OrderedDict([("a", 1), ("b", "x")]), Dict[str, int], validation=first_n_validation(1)) == {"a": 1, "b": "x"}
+    # non-trusted element types are always decoded, hence validated
+    try:
+        from_json_obj([[1, 2], [1, "x"]], List[Point], validation=NO_VALIDATION)
+        assert False
+    except TypeError:
+        assert True
+    # resource limits force full validation
+    try:
+        from_json_obj([1, "x"], List[int], limits=DecodeLimits(max_depth=10), validation=NO_VALIDATION)
+        assert False
+    except TypeError:
+        assert True
+
+
+def test_sampled_round_trip():
+    t = Dict[str, List[float]]
+    obj = {"k%d"%i: [float(j) for j in range(50)] for i in range(20)}
+    policy = sampled_validation(0.1, seed=3)
+    assert loads(dumps(obj, t, validation=policy), t, validation=policy) == obj
+    assert loads(dumps(obj, t, validation=policy), t, typed_containers=True, validation=policy) == obj
+
+
+def test_unvalidated_union_elements():
+    t = List[Union[int, str]]
+    for policy in (first_n_validation(1), sampled_validation(0.5), NO_VALIDATION):
+        try:
+            to_json_obj([1, 2.5, 3, 2.5], t, validation=policy)
+            assert False
+        except TypeError:
+            assert True
@@ -0,0 +1,93 @@
+""" Tests for `typing_json.typechecking.mark_as_validated` and the registry of validated marks in `typing_json.validation`. """
+# pylint: disable = line-too-long, invalid-name, missing-docstring
+
+# standard imports
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+# internal imports
+from typing_json import dumps, loads, is_instance, mark_as_validated, clear_validated_marks
+from typing_json.decoding import from_json_obj
+from typing_json.encoding import to_json_obj
+from typing_json.validation import is_marked_validated, set_validated_marks_capacity, NO_VALIDATION
+
+
+def test_mark_immutable():
+    clear_validated_marks()
+    try:
+        obj = tuple([1, "x"])
+        assert mark_as_validated(obj, Tuple[int, str]) == 1
+        assert is_marked_validated(obj, Tuple[int, str])
+        assert not is_marked_validated(obj, Tuple[int, ...])
+        assert not is_marked_validated((1, "x"), Tuple[int, str])
+        # marks are trusted without checks
+        bad = tuple(["a", "b"])
+        mark_as_validated(bad, Tuple[int, int])
+        assert is_instance(bad, Tuple[int, int])
+        assert not is_instance(("a", "b"), Tuple[int, int])
+        # scalars are never marked
+        assert mark_as_validated(1, int) == 0
+    finally:
+        clear_validated_marks()
+    assert not is_marked_validated(obj, Tuple[int, str])
+
+
+def test_mark_mutable_parts():
+    clear_validated_marks()
+    try:
+        t = Dict[str, List[Optional[Tuple[int, ...]]]]
+        obj = {"a": [(1, 2), None, (3,)], "b": []}
+        assert mark_as_validated(obj, t) == 2
+        assert not is_marked_validated(obj, t)
+        assert is_marked_validated(obj["a"][0], Tuple[int, ...])
+        assert is_marked_validated(obj["a"][0], Optional[Tuple[int, ...]])
+        t2 = Set[FrozenSet[int]]
+        obj2 = {frozenset({1, 2})}
+        assert mark_as_validated(obj2, t2) == 1
+        assert mark_as_validated([[(1, 2)]], List[List[Tuple[int, int]]]) == 1
+        # tuples containing mutable values are descended into, not marked
+        assert mark_as_validated(([1], (2,)), Tuple[List[int], Tuple[int]]) == 1
+    finally:
+        clear_validated_marks()
+
+
+def test_decode_marks():
+    clear_validated_marks()
+    try:
+        t = List[Tuple[int, str]]
+        obj = loads(dumps([(1, "a"), (2, "b")], t), t, mark_validated=True)
+        assert all(is_marked_validated(x, Tuple[int, str]) for x in obj)
+        obj.append((3, "c"))
+        assert to_json_obj(obj, t) == [[1, "a"], [2, "b"], [3, "c"]]
+        obj.append(("d", 4))
+        try:
+            to_json_obj(obj, t)
+            assert False
+        except TypeError:
+            assert True
+        # no marks are set unless all elements were validated
+        clear_validated_marks()
+        obj = from_json_obj([[1, 2]], List[Tuple[int, ...]], validation=NO_VALIDATION, mark_validated=True)
+        assert not is_marked_validated(obj[0], Tuple[int, ...])
+    finally:
+        clear_validated_marks()
+
+
+def test_marks_capacity():
+    clear_validated_marks()
+    set_validated_marks_capacity(2)
+    try:
+        objs = [(i,) for i in range(3)]
+        for x in objs:
+            mark_as_validated(x, Tuple[int])
+        assert not is_marked_validated(objs[0], Tuple[int])
+        assert is_marked_validated(objs[1], Tuple[int]) and is_marked_validated(objs[2], Tuple[int])
+        set_validated_marks_capacity(1)
+        assert not is_marked_validated(objs[1], Tuple[int])
+        try:
+            set_validated_marks_capacity(-1)
+            assert False
+        except ValueError:
+            assert True
+    finally:
+        set_validated_marks_capacity(4096)
+        clear_validated_marks()
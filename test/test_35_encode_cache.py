@@ -0,0 +1,77 @@
+""" Tests for `typing_json.caching.EncodeCache` """
+# pylint: disable = line-too-long, invalid-name, missing-docstring
+
+# standard imports
+from decimal import Decimal
+from typing import Dict, FrozenSet, List, NamedTuple, Tuple
+
+# internal imports
+from typing_json import dumps, EncodeCache
+from typing_json.encoding import to_json_obj
+
+
+class Currency(NamedTuple):
+    code: str
+    rate: Decimal
+
+class Product(NamedTuple):
+    name: str
+    price: Decimal
+    currency: Currency
+
+class Basket(NamedTuple):
+    items: List[Product]
+
+
+def test_encode_cache_results():
+    eur = Currency("EUR", Decimal("1.1"))
+    products = [Product("p%d"%(i%3), Decimal(i), eur) for i in range(10)]
+    t = Dict[str, List[Product]]
+    obj = {"a": products, "b": products[:2]}
+    cache = EncodeCache()
+    for use_decimal in (False, True):
+        for namedtuples_as_lists in (False, True):
+            expected = to_json_obj(obj, t, use_decimal=use_decimal, namedtuples_as_lists=namedtuples_as_lists)
+            assert to_json_obj(obj, t, use_decimal=use_decimal, namedtuples_as_lists=namedtuples_as_lists, encode_cache=cache) == expected
+    assert dumps(obj, t, encode_cache=cache) == dumps(obj, t)
+
+
+def test_encode_cache_sharing():
+    eur = Currency("EUR", Decimal("1.1"))
+    products = [Product("p", Decimal(i), eur) for i in range(5)]
+    cache = EncodeCache()
+    encoded = to_json_obj(products, List[Product], encode_cache=cache)
+    assert all(x["currency"] is encoded[0]["currency"] for x in encoded)
+    stats = cache.stats()
+    assert stats.hits == 4 and stats.misses == 6 and stats.size == 6
+    again = to_json_obj(products, List[Product], encode_cache=cache)
+    assert all(x is y for x, y in zip(again, encoded))
+    cache.clear()
+    assert cache.stats() == (0, 0, 0)
+
+
+def test_encode_cache_immutable_only():
+    cache = EncodeCache()
+    basket = Basket([Product("p", Decimal(1), Currency("EUR", Decimal(1)))])
+    to_json_obj(basket, Basket, encode_cache=cache)
+    # the basket contains a list, so only the product (and its currency) are cached
+    assert len(cache) == 2
+    basket.items.append(Product("q", Decimal(2), Currency("USD", Decimal(1))))
+    assert to_json_obj(basket, Basket, encode_cache=cache) == to_json_obj(basket, Basket)
+    cache = EncodeCache()
+    val = (frozenset({1, 2}), (3, "x"))
+    t = Tuple[FrozenSet[int], Tuple[int, str]]
+    assert to_json_obj(val, t, encode_cache=cache) == to_json_obj(val, t)
+    assert len(cache) == 3
+
+
+def test_encode_cache_bounded():
+    cache = EncodeCache(maxsize=2)
+    values = [(i, "x") for i in range(5)]
+    to_json_obj(values, List[Tuple[int, str]], encode_cache=cache)
+    assert len(cache) == 2
+    try:
+        EncodeCache(maxsize=0)
+        assert False
+    except ValueError:
+        assert True
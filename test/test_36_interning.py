@@ -0,0 +1,61 @@
+""" Tests for `typing_json.caching.InternTable` """
+# pylint: disable = line-too-long, invalid-name, missing-docstring
+
+# standard imports
+from enum import Enum
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple, Union
+
+# internal imports
+from typing_json import dumps, loads, InternTable
+from typing_json.decoding import from_json_obj
+
+
+class Color(Enum):
+    RED = 1
+    BLUE = 2
+
+class Record(NamedTuple):
+    name: str
+    color: Color
+    tags: FrozenSet[str]
+
+class Priced(NamedTuple):
+    name: str
+    price: float
+
+
+def test_intern_strings_and_keys():
+    obj = from_json_obj([{"key": "value"}, {"key": "value"}], List[Dict[str, str]], intern=True)
+    assert obj[0]["key"] == "value"
+    k0, k1 = next(iter(obj[0])), next(iter(obj[1]))
+    assert k0 is k1
+    assert obj[0]["key"] is obj[1]["key"]
+    long_strings = from_json_obj(["x"*100, "x"*100], List[str], intern=InternTable(max_string_length=10))
+    assert long_strings[0] == long_strings[1]
+
+
+def test_hash_consing():
+    t = List[Record]
+    records = [Record("a", Color.RED, frozenset({"x", "y"})), Record("a", Color.RED, frozenset({"y", "x"})), Record("b", Color.BLUE, frozenset())]
+    decoded = loads(dumps(records, t), t, intern=True)
+    assert decoded == records
+    assert decoded[0] is decoded[1]
+    assert decoded[0] is not decoded[2]
+    assert loads(dumps(records, t), t)[0] is not loads(dumps(records, t), t)[1]
+    table = InternTable()
+    first = loads(dumps(records, t), t, intern=table)
+    second = loads(dumps(records, t), t, intern=table)
+    assert all(x is y for x, y in zip(first, second))
+    assert len(table) > 0
+    table.clear()
+    assert len(table) == 0
+
+
+def test_no_hash_consing_for_inexact_equality():
+    t = List[Tuple[Union[bool, int], str]]
+    decoded = from_json_obj([[True, "a"], [1, "a"]], t, intern=True)
+    assert decoded[0][0] is True and decoded[1][0] == 1 and decoded[1][0] is not True
+    decoded = from_json_obj([["a", 0.0], ["a", -0.0]], List[Priced], intern=True)
+    assert str(decoded[1].price) == "-0.0"
+    decoded = from_json_obj([[1, None], [1, None]], List[Tuple[int, Optional[str]]], intern=True)
+    assert decoded[0] is decoded[1]
@@ -0,0 +1,81 @@
+""" Tests for `typing_json.caching.DecodeCache` """
+# pylint: disable = line-too-long, invalid-name, missing-docstring
+
+# standard imports
+import io
+from typing import Dict, FrozenSet, List, Optional, Tuple, Union
+
+# external dependencies
+from typing_extensions import TypedDict
+
+# internal imports
+from typing_json import load, loads, DecodeCache
+
+
+class Flags(TypedDict):
+    enabled: List[str]
+    limits: Dict[str, Tuple[int, int]]
+
+
+def test_decode_cache_hits():
+    cache = DecodeCache()
+    s = "[[1, 2], [3, 4]]"
+    t = Tuple[Tuple[int, int], ...]
+    first = loads(s, t, decode_cache=cache)
+    second = loads(s, t, decode_cache=cache)
+    assert first == ((1, 2), (3, 4)) and second is first
+    assert cache.stats() == (1, 1, 1, len(s))
+    # different types and options are cached separately
+    assert loads(s, List[List[int]], decode_cache=cache) == [[1, 2], [3, 4]]
+    assert loads(s, t, typed_numbers=True, decode_cache=cache) == first
+    assert cache.stats().misses == 3
+    with io.StringIO(s) as f:
+        assert load(f, t, decode_cache=cache) is first
+    assert cache.stats().hits == 2
+    cache.clear()
+    assert cache.stats() == (0, 0, 0, 0)
+
+
+def test_decode_cache_defensive_copies():
+    cache = DecodeCache()
+    s = "{\"enabled\": [\"a\", \"b\"], \"limits\": {\"x\": [1, 2]}}"
+    first = loads(s, Flags, decode_cache=cache)
+    first["enabled"].append("c")
+    second = loads(s, Flags, decode_cache=cache)
+    assert second == {"enabled": ["a", "b"], "limits": {"x": (1, 2)}}
+    assert second["limits"]["x"] is first["limits"]["x"]
+    assert second["limits"] is not first["limits"]
+    t = List[Union[List[int], FrozenSet[int]]]
+    first = loads("[[1], [2]]", t, decode_cache=cache)
+    first[0].append(3)
+    assert loads("[[1], [2]]", t, decode_cache=cache) == [[1], [2]]
+    assert loads("null", Optional[List[int]], decode_cache=cache) is None
+
+
+def test_decode_cache_eviction():
+    cache = DecodeCache(max_bytes=10, max_entries=2)
+    loads("[1, 2, 3]", List[int], decode_cache=cache)
+    loads("[4, 5]", List[int], decode_cache=cache)
+    assert cache.stats().size == 1 and cache.stats().nbytes == 6
+    loads("[1]", List[int], decode_cache=cache)
+    loads("[2]", List[int], decode_cache=cache)
+    assert cache.stats().size == 2
+    loads("[1, 2, 3, 4, 5, 6]", List[int], decode_cache=cache)
+    assert cache.stats().size == 2
+    for kwargs in ({"max_bytes": 0}, {"max_entries": 0}):
+        try:
+            DecodeCache(**kwargs)
+            assert False
+        except ValueError:
+            assert True
+
+
+def test_decode_cache_errors_not_cached():
+    cache = DecodeCache()
+    for _ in range(2):
+        try:
+            loads("[\"x\"]", List[int], decode_cache=cache)
+            assert False
+        except TypeError:
+            assert True
+    assert cache.stats() == (0, 2, 0, 0)
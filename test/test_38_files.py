@@ -0,0 +1,109 @@
+""" Tests for `typing_json.files` """
+# pylint: disable = line-too-long, invalid-name, missing-docstring
+
+# standard imports
+import os
+import stat
+import tempfile
+import threading
+from typing import Dict, List, NamedTuple
+
+# internal imports
+from typing_json.files import atomic_dump, stat_signature, watch_load, TypedFileCache
+
+
+class Config(NamedTuple):
+    name: str
+    limits: Dict[str, int]
+
+
+def test_file_cache_reload():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "config.json")
+        cache = TypedFileCache()
+        cache.dump(Config("a", {"x": 1}), Config, path)
+        first = cache.load(path, Config)
+        assert first == Config("a", {"x": 1})
+        assert cache.load(path, Config) is first
+        signature = stat_signature(path)
+        cache.dump(Config("b", {"x": 2}), Config, path)
+        assert stat_signature(path) != signature
+        assert cache.load(path, Config) == Config("b", {"x": 2})
+        # external modifications are detected by signature
+        with open(path, "w") as f:
+            f.write("{\"name\": \"c\", \"limits\": {}}")
+        assert cache.load(path, Config) == Config("c", {})
+        assert watch_load(path, Config) is watch_load(path, Config)
+
+
+def test_file_cache_copies():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "values.json")
+        atomic_dump([1, 2], List[int], path)
+        cache = TypedFileCache(copies=True)
+        first = cache.load(path, List[int])
+        first.append(3)
+        assert cache.load(path, List[int]) == [1, 2]
+
+
+def test_file_cache_compression():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "config.json.gz")
+        cache = TypedFileCache()
+        cache.dump(Config("a", {"x": 1}), Config, path, compression="gzip")
+        first = cache.load(path, Config, compression="gzip")
+        assert first == Config("a", {"x": 1})
+        assert cache.load(path, Config, compression="gzip") is first
+        assert watch_load(path, Config, compression="gzip") == first
+        try:
+            cache.load(path, Config, compression="zip")
+            assert False
+        except ValueError:
+            assert True
+
+
+def test_atomic_dump_failure():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "values.json")
+        atomic_dump([1, 2], List[int], path)
+        try:
+            atomic_dump(["x"], List[int], path)
+            assert False
+        except TypeError:
+            assert True
+        assert os.listdir(directory) == ["values.json"]
+        assert TypedFileCache().load(path, List[int]) == [1, 2]
+
+
+def test_atomic_dump_permissions():
+    if os.name != "posix":
+        return
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "values.json")
+        umask = os.umask(0o027)
+        try:
+            atomic_dump([1, 2], List[int], path)
+        finally:
+            os.umask(umask)
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
+        os.chmod(path, 0o644)
+        atomic_dump([3], List[int], path)
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
+        assert TypedFileCache().load(path, List[int]) == [3]
+
+
+def test_file_cache_threads():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "values.json")
+        atomic_dump(list(range(100)), List[int], path)
+        cache = TypedFileCache()
+        results = []
+        def reader():
+            for _ in range(20):
+                results.append(cache.load(path, List[int]))
+        threads = [threading.Thread(target=reader) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(results) == 80 and all(r is results[0] for r in results)
@@ -0,0 +1,109 @@
+""" Tests for `typing_json.projection` """
+# pylint: disable = line-too-long, invalid-name, missing-docstring
+
+# standard imports
+from decimal import Decimal
+from enum import Enum
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# external dependencies
+from typing_extensions import TypedDict
+
+# internal imports
+from typing_json import dumps, loads, DecodeLimitExceeded, DecodeLimits
+from typing_json.projection import ALL, parse_path, project, selection_tree
+
+
+class Header(TypedDict, total=False):
+    id: int
+    route: str
+
+class Item(NamedTuple):
+    name: str
+    price: float
+    qty: int = 1
+
+class Envelope(NamedTuple):
+    header: Header
+    items: List[Item]
+    extra: Dict[str, Tuple[int, int]]
+    note: Optional[Item] = None
+
+class Color(Enum):
+    RED = 1
+    GREEN = 2
+
+class Pixel(NamedTuple):
+    x: int
+    color: Color = Color.RED
+    palette: Tuple[Color, ...] = (Color.GREEN, Color.RED)
+
+
+def test_parse_paths():
+    assert parse_path("header.id") == ("header", "id")
+    assert parse_path("items[*].price") == ("items", ALL, "price")
+    assert parse_path("items[3]") == ("items", 3)
+    assert parse_path("extra.*") == ("extra", ALL)
+    assert parse_path("a[0][1].b") == ("a", 0, 1, "b")
+    for bad in ("", "a..b", "a[x]", "a[-1]", "a]"):
+        try:
+            parse_path(bad)
+            assert False
+        except ValueError:
+            assert True
+    assert selection_tree(["a.b", "a", "c[*].d"]) == {"a": None, "c": {ALL: {"d": None}}}
+
+
+def test_projection():
+    env = Envelope({"id": 7, "route": "r"}, [Item("a", 1.5), Item("b", 2.0, 3)], {"x": (1, 2)})
+    s = dumps(env, Envelope)
+    assert loads(s, Envelope, select=["header.id"]) == {"header": {"id": 7}}
+    assert loads(s, Envelope, select=["header.id", "items[*].price"]) == {"header": {"id": 7}, "items": [{"price": 1.5}, {"price": 2.0}]}
+    assert loads(s, Envelope, select=["items[1]", "extra.x", "note"]) == {"items": {1: Item("b", 2.0, 3)}, "extra": {"x": (1, 2)}, "note": None}
+    assert loads(s, Envelope, select=["extra.*[0]"]) == {"extra": {"x": {0: 1}}}
+    # fields with defaults missing from the JSON object are projected from their default values
+    assert project([{"id": 1}, [["a", Decimal("1.5")]], {}], Envelope, ["items[*].qty", "note"]) == {"items": [{"qty": 1}], "note": None}
+    # non-total typed dicts omit missing fields
+    assert project([{}, [], {}], Envelope, ["header.route"]) == {"header": {}}
+
+
+def test_projection_skips_unselected():
+    # the unselected parts are not validated
+    obj = {"header": {"id": 1}, "items": "not a list", "extra": None}
+    assert project(obj, Envelope, ["header"]) == {"header": {"id": 1}}
+    for select in (["header.id"], ["header.id.x"], ["header.missing"], ["items[0]"], ["extra[0]"]):
+        try:
+            project({"header": {"id": "x"}, "items": [], "extra": {}}, Envelope, select)
+            assert False
+        except TypeError:
+            assert True
+
+
+def test_projection_shares_budget():
+    # the selected values are decoded with a single budget and intern table
+    s = dumps(Envelope({}, [Item("item", 1.0)]*100, {}), Envelope)
+    assert len(loads(s, Envelope, select=["items[*].price"], limits=DecodeLimits(max_nodes=100))["items"]) == 100
+    try:
+        loads(s, Envelope, select=["items[*].price"], limits=DecodeLimits(max_nodes=10))
+        assert False
+    except DecodeLimitExceeded as e:
+        assert e.limit == "max_nodes"
+    names = [item["name"] for item in loads(s, Envelope, select=["items[*].name"], intern=True)["items"]]
+    assert all(name is names[0] for name in names)
+
+
+def test_projection_defaults_and_columnar():
+    # missing fields are projected from their defaults, with the caller's decoding options
+    assert loads('{"x": 1}', Pixel, enum_encoding="value", select=["color", "palette[0]"]) == {"color": Color.RED, "palette": {0: Color.GREEN}}
+    assert loads('{"x": 1}', Pixel, select=["palette[*]"]) == {"palette": [Color.GREEN, Color.RED]}
+    # lists of records in columnar layout are projected as lists of records
+    pixels = [Pixel(1), Pixel(2, Color.GREEN)]
+    s = dumps(pixels, List[Pixel], columnar=True)
+    assert loads(s, List[Pixel], columnar=True, select=["[*].color"]) == [{"color": Color.RED}, {"color": Color.GREEN}]
+    assert loads(s, List[Pixel], columnar=True, select=["[1].x"]) == {1: {"x": 2}}
+    for bad in ('{"x": [1, 2], "color": ["RED"]}', '{"x": 1}', '{}'):
+        try:
+            loads(bad, List[Pixel], columnar=True, select=["[*].x"])
+            assert False
+        except TypeError:
+            assert True
@@ -0,0 +1,102 @@
+""" Tests for `typing_json.pointer` """
+# pylint: disable = line-too-long, invalid-name, missing-docstring
+
+# standard imports
+import json
+from decimal import Decimal
+from enum import Enum
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+# external dependencies
+from typing_extensions import TypedDict
+
+# internal imports
+from typing_json import dumps
+from typing_json.pointer import get_path, parse_pointer
+
+
+class Record(NamedTuple):
+    total: Decimal
+    lines: List[Tuple[str, int]]
+    note: str = "none"
+
+class Store(TypedDict):
+    orders: Dict[str, Record]
+    by_pair: Dict[Tuple[int, int], Optional[Record]]
+
+
+class Color(Enum):
+    RED = 1
+    GREEN = 2
+
+class Swatch(NamedTuple):
+    name: str
+    color: Color = Color.RED
+    palette: Tuple[Color, ...] = (Color.GREEN, Color.RED)
+
+
+STORE: Store = {
+    "orders": {"123": Record(Decimal("9.5"), [("a", 1), ("b\"]}", 2)]), "a/b": Record(Decimal(1), [])},
+    "by_pair": {(1, 2): Record(Decimal(2), [("c", 3)], "x"), (3, 4): None},
+}
+
+
+def test_parse_pointer():
+    assert parse_pointer("") == []
+    assert parse_pointer("/a~1b/~0c/0") == ["a/b", "~c", "0"]
+    try:
+        parse_pointer("a")
+        assert False
+    except ValueError:
+        assert True
+
+
+def test_get_path():
+    s = dumps(STORE, Store, indent=2)
+    assert get_path(s, Store, "/orders/123/total") == Decimal("9.5")
+    assert get_path(s, Store, "/orders/123/lines/1") == ("b\"]}", 2)
+    assert get_path(s, Store, "/orders/123/lines/1/1") == 2
+    assert get_path(s, Store, "/orders/a~1b") == Record(Decimal(1), [])
+    assert get_path(s, Store, "/orders/123/note") == "none"
+    assert get_path(s.encode("utf-8"), Store, "/by_pair/[1, 2]/note") == "x"
+    assert get_path(s, Store, "/by_pair/[1,2]/lines/0/0") == "c"
+    assert get_path(s, Store, "/by_pair/[3, 4]") is None
+    assert get_path(s, Store, "") == STORE
+    namedtuples_as_lists = json.dumps([str(Decimal(5)), [["z", 1]]])
+    assert get_path(namedtuples_as_lists, Record, "/lines/0/0") == "z"
+    assert get_path(namedtuples_as_lists, Record, "/note") == "none"
+
+
+def test_get_path_defaults_and_unions():
+    assert get_path('{"name": "a"}', Swatch, "/color", enum_encoding="value") is Color.RED
+    assert get_path('{"name": "a"}', Swatch, "/palette/0", enum_encoding="value") is Color.GREEN
+    assert get_path('{"name": "a"}', Swatch, "/palette/1") is Color.RED
+    # the pointer is missing for the dictionary type, but resolves to a default for the namedtuple type
+    assert get_path('{"name": "a"}', Union[Dict[str, str], Swatch], "/color") is Color.RED
+    assert get_path('{"name": "a"}', Union[Dict[str, str], Swatch], "/name") == "a"
+    try:
+        get_path('{"name": "a"}', Union[Dict[str, str], Store], "/orders")
+        assert False
+    except KeyError:
+        assert True
+
+
+def test_get_path_errors():
+    s = dumps(STORE, Store)
+    for pointer in ("/orders/999", "/orders/123/lines/5"):
+        try:
+            get_path(s, Store, pointer)
+            assert False
+        except KeyError:
+            assert True
+    for pointer in ("/missing", "/orders/123/total/x", "/orders/123/lines/x", "/orders/123/lines/0/2"):
+        try:
+            get_path(s, Store, pointer)
+            assert False
+        except TypeError:
+            assert True
+    try:
+        get_path("{\"orders\": {\"1\": [1, 2}", Store, "/orders/2")
+        assert False
+    except json.JSONDecodeError:
+        assert True
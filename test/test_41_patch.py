@@ -0,0 +1,104 @@
+""" Tests for `typing_json.patch` """
+# pylint: disable = line-too-long, invalid-name, missing-docstring
+
+# standard imports
+import copy
+import json
+import typing
+from collections import deque, OrderedDict
+from decimal import Decimal
+from typing import Deque, Dict, FrozenSet, List, NamedTuple, Optional, Set, Tuple, Union
+
+# external dependencies
+from typing_extensions import TypedDict
+
+# internal imports
+from typing_json.patch import apply_patch, diff
+
+
+class Meta(TypedDict, total=False):
+    owner: str
+    version: int
+
+class Account(NamedTuple):
+    balance: Decimal
+    tags: Set[str]
+    flags: FrozenSet[int]
+
+class State(NamedTuple):
+    accounts: Dict[str, Account]
+    history: List[Tuple[int, str]]
+    meta: Meta
+    by_pair: Dict[Tuple[int, int], Optional[float]]
+    choice: Union[int, str, List[int]]
+
+
+def make_state() -> State:
+    return State(
+        {"a": Account(Decimal("1.50"), {"x"}, frozenset({1})), "b": Account(Decimal(0), set(), frozenset())},
+        [(1, "one"), (2, "two")],
+        {"owner": "me"},
+        {(1, 2): 1.5, (3, 4): None},
+        [1, 2],
+    )
+
+
+def round_trip(old, new, t):
+    patch = diff(old, new, t)
+    assert json.loads(json.dumps(patch)) == patch
+    assert apply_patch(copy.deepcopy(old), patch, t) == new
+    return patch
+
+
+def test_diff_unchanged():
+    state = make_state()
+    assert diff(state, state, State) == {}
+    assert diff(state, make_state(), State) == {}
+
+
+def test_diff_fields_and_keys():
+    old = make_state()
+    accounts = dict(old.accounts)
+    accounts["a"] = old.accounts["a"]._replace(balance=Decimal("2.50"), tags={"x", "y"})
+    accounts["c"] = Account(Decimal(3), set(), frozenset({2}))
+    del accounts["b"]
+    new = old._replace(accounts=accounts, meta={"owner": "me", "version": 2})
+    patch = round_trip(old, new, State)
+    assert patch == {".": {
+        "accounts": {".": [["a", {".": {"balance": {"=": "2.50"}, "tags": {"+": ["y"]}}}], ["c", {"=": {"balance": "3", "tags": [], "flags": [2]}}]], "-": ["b"]},
+        "meta": {".": {"version": {"=": 2}}},
+    }}
+    new2 = old._replace(history=[(1, "one"), (2, "TWO")], by_pair={(1, 2): 2.5, (5, 6): None}, meta={})
+    patch = round_trip(old, new2, State)
+    assert patch["."]["history"] == {".": [[1, {".": [[1, {"=": "TWO"}]]}]]}
+    assert patch["."]["by_pair"] == {".": [[[1, 2], {"=": 2.5}], [[5, 6], {"=": None}]], "-": [[3, 4]]}
+    assert patch["."]["meta"] == {"-": ["owner"]}
+
+
+def test_diff_replacements():
+    old = make_state()
+    round_trip(old, old._replace(history=[]), State)
+    patch = round_trip(old, old._replace(choice=[1, 3]), State)
+    assert patch == {".": {"choice": {".": [[1, {"=": 3}]]}}}
+    patch = round_trip(old, old._replace(choice="x"), State)
+    assert patch == {".": {"choice": {"=": "x"}}}
+    assert diff(True, 1, Union[bool, int]) == {"=": 1}
+    assert diff(Decimal("1.0"), Decimal("1.00"), Decimal) == {"=": "1.00"}
+    round_trip(OrderedDict([("a", 1), ("b", 2)]), OrderedDict([("b", 2), ("a", 1)]), typing.OrderedDict[str, int])
+    round_trip(OrderedDict([("a", 1)]), OrderedDict([("a", 2), ("b", 2)]), typing.OrderedDict[str, int])
+    round_trip(deque([1, 2]), deque([1, 3]), Deque[int])
+
+
+def test_apply_validates_changes_only():
+    state = make_state()
+    try:
+        apply_patch(state, {".": {"history": {".": [[0, {"=": ["x", "y"]}]]}}}, State)
+        assert False
+    except TypeError:
+        assert True
+    for bad_patch in ({"?": 1}, {"=": 1, ".": {}}, {".": {"missing": {}}}, {".": {"meta": {"-": ["other"]}}}, {".": {"history": {".": [[5, {}]]}}}, {".": {"accounts": {".": [["z", {".": {}}]]}}}):
+        try:
+            apply_patch(make_state(), bad_patch, State)
+            assert False
+        except TypeError:
+            assert True
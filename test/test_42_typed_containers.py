@@ -0,0 +1,117 @@
+""" Tests for `typing_json.containers` """
+# pylint: disable = line-too-long, invalid-name, missing-docstring
+
+# standard imports
+import copy
+import pickle
+from collections import deque
+from typing import Deque, Dict, List, NamedTuple, Optional, Set
+
+# internal imports
+from typing_json import dumps, loads, TypedDeque, TypedList, TypedMap, TypedSet
+from typing_json.typechecking import is_instance
+from typing_json.encoding import to_json_obj
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+
+def _raises_type_error(f, *args):
+    try:
+        f(*args)
+        assert False
+    except TypeError:
+        assert True
+
+
+def test_validation_on_insertion():
+    tl = TypedList(Point, [Point(0, 0)])
+    tl.append(Point(1, 2))
+    tl.insert(0, Point(3, 4))
+    tl.extend([Point(5, 6)])
+    tl += [Point(7, 8)]
+    tl[0] = Point(9, 9)
+    tl[1:2] = [Point(0, 1)]
+    assert tl == [Point(9, 9), Point(0, 1), Point(1, 2), Point(5, 6), Point(7, 8)]
+    for f, args in [(tl.append, ((1, 2),)), (tl.insert, (0, "a")), (tl.extend, ([Point(0, 0), None],)), (tl.__setitem__, (0, 1)), (tl.__setitem__, (slice(0, 1), [1]))]:
+        _raises_type_error(f, *args)
+    assert len(tl) == 5
+    _raises_type_error(TypedList, int, [1, "a"])
+    tm = TypedMap(str, Optional[int], {"a": 1}, b=None)
+    tm["c"] = 2
+    tm.update({"d": 3})
+    assert tm.setdefault("e", 4) == 4
+    assert tm == {"a": 1, "b": None, "c": 2, "d": 3, "e": 4}
+    for f, args in [(tm.__setitem__, (1, 1)), (tm.__setitem__, ("x", "y")), (tm.update, ({"x": 1.5},)), (tm.setdefault, ("x", "y"))]:
+        _raises_type_error(f, *args)
+    assert "x" not in tm
+    ts = TypedSet(str, {"a"})
+    ts.add("b")
+    ts.update(["c"], {"d"})
+    ts ^= {"a"}
+    assert ts == {"b", "c", "d"}
+    for f, args in [(ts.add, (1,)), (ts.update, ([None],)), (ts.symmetric_difference_update, ([1],))]:
+        _raises_type_error(f, *args)
+    td = TypedDeque(int, [1, 2], maxlen=3)
+    td.append(3)
+    td.appendleft(0)
+    td.extendleft([5])
+    td[0] = 6
+    assert td == deque([6, 0, 1]) and td.maxlen == 3
+    for f, args in [(td.append, ("a",)), (td.appendleft, (None,)), (td.extend, ([1.5],)), (td.__setitem__, (0, "a"))]:
+        _raises_type_error(f, *args)
+    assert td + [7] == deque([0, 1, 7]) and isinstance(td + [7], TypedDeque)
+    _raises_type_error(td.__add__, ["a"])
+
+
+def test_is_instance_skips_immutable_elements():
+    tl = TypedList(int, [1, 2, 3])
+    assert is_instance(tl, List[int])
+    # bypass validation: the scan is skipped, since int elements cannot change after insertion
+    list.append(tl, "x")
+    assert is_instance(tl, List[int])
+    # types with different generic type arguments are still fully checked
+    assert not is_instance(tl, List[str])
+    tm = TypedMap(str, int, a=1)
+    dict.__setitem__(tm, "b", "x")
+    assert is_instance(tm, Dict[str, int])
+    ts = TypedSet(int, [1])
+    set.add(ts, "x")
+    assert is_instance(ts, Set[int])
+    td = TypedDeque(int, [1])
+    deque.append(td, "x")
+    assert is_instance(td, Deque[int])
+
+
+def test_is_instance_checks_mutable_elements():
+    tl = TypedList(List[int], [[1], [2]])
+    tl[0].append("x")
+    assert not is_instance(tl, List[List[int]])
+    tm = TypedMap(str, List[int], a=TypedList(int, [1]))
+    assert is_instance(tm, Dict[str, List[int]])
+    list.append(tm["a"], "x")
+    assert is_instance(tm, Dict[str, List[int]])
+    tm["b"] = [2]
+    tm["b"].append("x")
+    assert not is_instance(tm, Dict[str, List[int]])
+
+
+def test_encoding():
+    points = TypedList(Point, [Point(1, 2), Point(3, 4)])
+    assert to_json_obj(points, List[Point], namedtuples_as_lists=True) == [[1, 2], [3, 4]]
+    assert loads(dumps(points, List[Point]), List[Point]) == points
+    tm = TypedMap(str, List[int], a=TypedList(int, [1, 2]))
+    assert loads(dumps(tm, Dict[str, List[int]]), Dict[str, List[int]]) == {"a": [1, 2]}
+    assert loads(dumps(TypedSet(str, ["a"]), Set[str]), Set[str]) == {"a"}
+    assert loads(dumps(TypedDeque(int, [1, 2]), Deque[int]), Deque[int]) == deque([1, 2])
+
+
+def test_copies():
+    for tc in [TypedList(int, [1, 2]), TypedMap(str, int, a=1), TypedSet(int, [1, 2]), TypedDeque(int, [1, 2], maxlen=5)]:
+        for c in [tc.copy(), copy.copy(tc), copy.deepcopy(tc), pickle.loads(pickle.dumps(tc))]:
+            assert type(c) is type(tc) and c == tc and c is not tc # pylint: disable = unidiomatic-typecheck
+            assert c._typed_args == tc._typed_args # pylint: disable = protected-access
+        assert repr(tc).startswith(type(tc).__name__)
+    assert copy.deepcopy(TypedDeque(int, [1], maxlen=5)).maxlen == 5
@@ -0,0 +1,168 @@
+""" Tests for `typing_json.binary` """
+# pylint: disable = line-too-long, invalid-name, missing-docstring
+
+# standard imports
+import typing
+from collections import deque, OrderedDict
+from decimal import Decimal
+from enum import Enum
+from typing import Deque, Dict, FrozenSet, List, Mapping, NamedTuple, Optional, Set, Tuple, Union
+
+# external dependencies
+from typing_extensions import Literal, TypedDict
+
+# internal imports
+from typing_json import dumpb, dumps, loadb, loads, DecodeLimitExceeded, DecodeLimits
+
+
+class Colour(Enum):
+    RED = 0
+    GREEN = 1
+    CRIMSON = 0
+
+class Point(NamedTuple):
+    x: float
+    y: float
+    label: Optional[str] = None
+
+class Header(TypedDict):
+    id: int
+    colour: Colour
+
+class Reading(NamedTuple):
+    sensor: int
+    value: int
+    colour: Colour
+
+class Options(TypedDict, total=False):
+    verbose: bool
+    level: Literal["low", "high", 3]
+
+
+VALUES = [
+    (True, bool),
+    (0, int),
+    (-1, int),
+    (2**80, int),
+    (-2**80+1, int),
+    (1.5, float),
+    (3, float),
+    (-0.0, float),
+    ("", str),
+    ("héllo ☃", str),
+    (Decimal("1.10"), Decimal),
+    (Decimal("-123456789012345678901234567890.5e-40"), Decimal),
+    (Decimal("0E+7"), Decimal),
+    (Decimal("-Infinity"), Decimal),
+    (None, None),
+    (None, type(None)),
+    (Colour.GREEN, Colour),
+    (Colour.CRIMSON, Colour),
+    (Point(1.5, 2, "a"), Point),
+    (Point(0, 0), Point),
+    ({"id": 7, "colour": Colour.RED}, Header),
+    ({"verbose": False, "level": "high"}, Options),
+    ([1, 2, 300], List[int]),
+    ([1.5, -2.25, 1e300], List[float]),
+    ((1.5, 2.0), Tuple[float, ...]),
+    (deque([1.5]), Deque[float]),
+    ((1, "a", None), Tuple[int, str, None]),
+    ({"a", "b"}, Set[str]),
+    (frozenset({Point(1, 2)}), FrozenSet[Point]),
+    (deque([[1], []]), Deque[List[int]]),
+    ({"a": 1, "b": 2}, Dict[str, int]),
+    ({"a": [Decimal("1.5")]}, Mapping[str, List[Decimal]]),
+    (OrderedDict([("b", 1), ("a", 2)]), typing.OrderedDict[str, int]),
+    ({Colour.RED: 1}, Dict[Colour, int]),
+    ({(1, 2): "a"}, Dict[Tuple[int, int], str]),
+    ([1, "a", None, [1.5], Decimal("2.5")], List[Union[int, Decimal, str, None, List[float]]]),
+    ([1, 2.5], List[Union[float, int]]),
+    ([None, Point(1, 2)], List[Optional[Point]]),
+]
+
+
+def test_round_trip():
+    for obj, t in VALUES:
+        b = dumpb(obj, t)
+        assert isinstance(b, bytes)
+        decoded = loadb(b, t)
+        expected = loads(dumps(obj, t), t)
+        assert decoded == expected, (obj, t)
+        assert type(decoded) is type(expected), (obj, t) # pylint: disable = unidiomatic-typecheck
+        if isinstance(expected, OrderedDict):
+            assert list(decoded.keys()) == list(expected.keys())
+        assert loadb(bytearray(b), t) == expected
+        assert loadb(memoryview(b), t) == expected
+
+
+def test_exact_round_trip():
+    # values which the JSON encoding cannot round-trip are decoded exactly
+    t = Dict[int, Union[Decimal, str]]
+    obj = {1: "1", -2: Decimal("1")}
+    decoded = loadb(dumpb(obj, t), t)
+    assert decoded == obj and isinstance(decoded[1], str)
+    # non-total typed dicts with missing fields
+    for obj in [{}, {"level": 3}]:
+        assert loadb(dumpb(obj, Options), Options) == obj
+
+
+def test_compactness():
+    t = List[Reading]
+    obj = [Reading(i, -i, Colour.GREEN) for i in range(100)]
+    assert len(dumpb(obj, t))*3 < len(dumps(obj, t).encode("utf-8"))
+    assert dumpb(Colour.GREEN, Colour) == b"\x01"
+    assert dumpb(-1, int) == b"\x01"
+    assert dumpb(None, Optional[int]) == b"\x01"
+    assert dumpb({"x": 1}, Dict[str, int]) == b"\x01\x01x\x02"
+
+
+def test_errors():
+    for obj, t in [("a", int), ([1, "a"], List[int]), (Point(1, 2), Tuple[float, float])]:
+        try:
+            dumpb(obj, t)
+            assert False
+        except TypeError:
+            assert True
+    try:
+        dumpb(1, complex)
+        assert False
+    except TypeError:
+        assert True
+    for b, t in [(b"", int), (b"\x80", int), (b"\x00\x00", int), (b"\x02", bool), (b"\x03", Colour), (b"\x05ab", str), (b"\x02\xff\xfe", str),
+                 (b"\x03\x00", Literal[1, 2]), (b"\x02", Optional[int]), (b"\xff\xff\x7f", List[int]), (b"\x00\x00\x00", Point), (b"\x08", Options)]:
+        try:
+            loadb(b, t)
+            assert False, (b, t)
+        except ValueError:
+            assert True
+
+
+def test_zero_width_elements():
+    # elements with an empty encoding are not mistaken for a truncated payload
+    for obj, t in [([(None, None)]*3, List[Tuple[None, None]]), ({None: None}, Dict[None, None]), ([[None]*5, []], List[List[None]])]:
+        assert loadb(dumpb(obj, t), t) == obj
+    # but their counts are limited, as they are not bounded by the size of the payload
+    for b, t, limits in [(b"\xff\xff\xff\x03", List[None], None), (b"\x02\xff\xff\x3f\xff\xff\x3f", List[List[None]], None), (b"\x0b", List[None], DecodeLimits(max_nodes=10))]:
+        try:
+            loadb(b, t, limits=limits)
+            assert False
+        except DecodeLimitExceeded as e:
+            assert e.limit == "max_nodes"
+    assert loadb(b"\x0a", List[None], limits=DecodeLimits(max_nodes=10)) == [None]*10
+    for b, limits, limit in [(b"\x02\x01\x02", DecodeLimits(max_length=1), "max_length"), (b"\x01\x01", DecodeLimits(max_input_size=1), "max_input_size")]:
+        try:
+            loadb(b, List[int], limits=limits)
+            assert False
+        except DecodeLimitExceeded as e:
+            assert e.limit == limit
+
+
+def test_decimals_rejected_as_numbers():
+    # as with `dumps`, instances of `decimal.Decimal` are not encoded as `int` or `float`
+    for obj, t in [(Decimal("1.5"), float), (Decimal(1), int), ([Decimal("1.5")], List[float]), (Decimal("1.5"), Union[float, Decimal])]:
+        for encode in (dumps, dumpb):
+            try:
+                encode(obj, t)
+                assert False, (encode, obj, t)
+            except TypeError:
+                assert True
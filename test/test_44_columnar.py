@@ -0,0 +1,135 @@
+""" Tests for the columnar layout of `typing_json.encoding.to_json_obj` and `typing_json.decoding.from_json_obj`. """
+# pylint: disable = line-too-long, invalid-name, missing-docstring
+
+# standard imports
+from collections import deque, OrderedDict
+from decimal import Decimal
+from enum import Enum
+import json
+from typing import Deque, Dict, FrozenSet, List, NamedTuple, Optional, Tuple, Union
+
+# external dependencies
+from typing_extensions import TypedDict
+
+# internal imports
+from typing_json import dumps, loads
+from typing_json.caching import EncodeCache
+from typing_json.decoding import from_json_obj
+from typing_json.encoding import is_columnar_record, to_json_obj
+from typing_json.unions import reset_union_stats
+
+
+class Side(Enum):
+    BUY = 0
+    SELL = 1
+
+class Trade(NamedTuple):
+    price: Decimal
+    qty: int
+    side: Side
+    note: Optional[str] = None
+
+class Row(TypedDict):
+    x: float
+    tags: List[str]
+
+class PartialRow(TypedDict, total=False):
+    x: float
+
+class Book(NamedTuple):
+    name: str
+    trades: List[Trade]
+
+class Sample(TypedDict):
+    a: int
+
+
+def test_is_columnar_record():
+    assert is_columnar_record(Trade)
+    assert is_columnar_record(Row)
+    assert not is_columnar_record(PartialRow)
+    assert not is_columnar_record(Tuple[int, str])
+
+
+def test_encoding():
+    trades = [Trade(Decimal("1.5"), 2, Side.BUY), Trade(Decimal("2"), 1, Side.SELL, "x")]
+    encoded = to_json_obj(trades, List[Trade], columnar=True)
+    assert encoded == OrderedDict([("price", ["1.5", "2"]), ("qty", [2, 1]), ("side", ["BUY", "SELL"]), ("note", [None, "x"])])
+    assert list(encoded.keys()) == ["price", "qty", "side", "note"]
+    assert to_json_obj([], List[Trade], columnar=True) == {"price": [], "qty": [], "side": [], "note": []}
+    rows = [{"x": 1.5, "tags": ["a"]}, {"x": 2.0, "tags": []}]
+    assert to_json_obj(rows, List[Row], columnar=True) == {"x": [1.5, 2.0], "tags": [["a"], []]}
+    assert to_json_obj([{"x": 1.5}], List[PartialRow], columnar=True) == [{"x": 1.5}]
+    assert to_json_obj(frozenset(trades), FrozenSet[Trade], columnar=True) == to_json_obj(frozenset(trades), FrozenSet[Trade])
+    book = Book("b", trades)
+    assert to_json_obj(book, Book, columnar=True)["trades"] == encoded
+    assert to_json_obj(trades, List[Trade], columnar=True, encode_cache=EncodeCache()) == encoded
+
+
+ROUND_TRIPS = [
+    ([Trade(Decimal("1.5"), 2, Side.BUY), Trade(Decimal("2"), 1, Side.SELL, "x")], List[Trade]),
+    ([], List[Trade]),
+    (deque([Trade(Decimal("1"), 1, Side.BUY)]), Deque[Trade]),
+    (tuple([Trade(Decimal("1"), 1, Side.BUY)]), Tuple[Trade, ...]),
+    ([{"x": 1.5, "tags": ["a"]}, {"x": 2.0, "tags": []}], List[Row]),
+    ({"a": [{"x": 1.0, "tags": []}]}, Dict[str, List[Row]]),
+    (Book("b", [Trade(Decimal("1"), 1, Side.BUY)]), Book),
+    ([[Trade(Decimal("1"), 1, Side.BUY)], []], List[List[Trade]]),
+    (tuple([Trade(Decimal("1"), 1, Side.BUY), Trade(Decimal("2"), 2, Side.SELL)]), Tuple[Trade, Trade]),
+]
+
+
+def test_round_trip():
+    for obj, t in ROUND_TRIPS:
+        s = dumps(obj, t, columnar=True)
+        for typed_containers in (False, True):
+            assert loads(s, t, columnar=True, typed_containers=typed_containers) == obj
+        # row layout is still accepted
+        assert loads(dumps(obj, t), t, columnar=True) == obj
+
+
+def test_defaults_and_errors():
+    assert from_json_obj({"price": ["1"], "qty": [1], "side": ["BUY"]}, List[Trade], columnar=True) == [Trade(Decimal("1"), 1, Side.BUY)]
+    bad = [
+        {"price": ["1"], "qty": [1], "side": ["BUY"], "extra": [1]},
+        {"price": ["1"], "side": ["BUY"]},
+        {"price": ["1"], "qty": [1, 2], "side": ["BUY", "SELL"]},
+        {"price": "1", "qty": [1], "side": ["BUY"]},
+        {"price": ["1"], "qty": ["a"], "side": ["BUY"]},
+    ]
+    for obj in bad:
+        try:
+            from_json_obj(obj, List[Trade], columnar=True)
+            assert False, obj
+        except TypeError:
+            assert True
+    try:
+        from_json_obj({}, List[PartialRow], columnar=True)
+        assert False
+    except TypeError:
+        assert True
+    # without the option, the columnar layout is rejected
+    try:
+        loads(dumps([], List[Trade], columnar=True), List[Trade])
+        assert False
+    except TypeError:
+        assert True
+
+
+def test_size():
+    trades = [Trade(Decimal(i), i, Side.BUY) for i in range(100)]
+    assert len(dumps(trades, List[Trade], columnar=True))*2 < len(dumps(trades, List[Trade]))
+    assert json.loads(dumps(trades, List[Trade], columnar=True))["qty"] == list(range(100))
+
+
+def test_adaptive_unions():
+    # a dictionary of columns is also a valid dictionary: adaptive ordering must not try the list of records first
+    t = Union[Dict[str, List[int]], List[Sample]]
+    reset_union_stats()
+    try:
+        assert from_json_obj({"a": [1, 2]}, t, columnar=True) == {"a": [1, 2]}
+        for _ in range(300):
+            from_json_obj([{"a": 1}], t, columnar=True, adaptive_unions=True)
+        assert from_json_obj({"a": [1, 2]}, t, columnar=True, adaptive_unions=True) == {"a": [1, 2]}
+    finally:
+        reset_union_stats()
@@ -0,0 +1,56 @@
+""" Tests for the `omit_defaults` option of `typing_json.encoding.to_json_obj`. """
+# pylint: disable = line-too-long, invalid-name, missing-docstring
+
+# standard imports
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Optional, Union
+
+# external dependencies
+from typing_extensions import TypedDict
+
+# internal imports
+from typing_json import dumps, loads
+from typing_json.caching import EncodeCache
+from typing_json.encoding import to_json_obj
+
+
+class Settings(NamedTuple):
+    name: str
+    retries: int = 3
+    timeout: Optional[float] = None
+    tags: List[str] = []
+    flag: Union[bool, int] = 0
+
+class Patch(TypedDict, total=False):
+    owner: Optional[str]
+    size: int
+
+class Full(TypedDict):
+    owner: Optional[str]
+
+
+def test_namedtuples():
+    assert to_json_obj(Settings("a"), Settings, omit_defaults=True) == OrderedDict([("name", "a")])
+    assert to_json_obj(Settings("a", 4, tags=["x"]), Settings, omit_defaults=True) == OrderedDict([("name", "a"), ("retries", 4), ("tags", ["x"])])
+    # values equal to the default but of a different class are kept
+    assert to_json_obj(Settings("a", flag=False), Settings, omit_defaults=True) == OrderedDict([("name", "a"), ("flag", False)])
+    assert to_json_obj(Settings("a", 4), Settings, omit_defaults=True, namedtuples_as_lists=True) == ["a", 4]
+    assert to_json_obj(Settings("a", timeout=1.5), Settings, omit_defaults=True, namedtuples_as_lists=True) == ["a", 3, 1.5]
+    assert to_json_obj(Settings("a"), Settings) == OrderedDict([("name", "a"), ("retries", 3), ("timeout", None), ("tags", []), ("flag", 0)])
+    assert to_json_obj([Settings("a")], List[Settings], omit_defaults=True, encode_cache=EncodeCache()) == [OrderedDict([("name", "a")])]
+
+
+def test_typed_dicts():
+    assert to_json_obj({"owner": None, "size": 1}, Patch, omit_defaults=True) == {"size": 1}
+    assert to_json_obj({"owner": None, "size": 1}, Patch) == {"owner": None, "size": 1}
+    assert to_json_obj({"size": 1}, Patch) == {"size": 1}
+    assert to_json_obj({"owner": None}, Full, omit_defaults=True) == {"owner": None}
+
+
+def test_round_trip():
+    values = [Settings("a"), Settings("b", 5, 2.5, ["x"], True), Settings("c", flag=False)]
+    t = Dict[str, List[Settings]]
+    obj = {"x": values}
+    assert loads(dumps(obj, t, omit_defaults=True), t) == obj
+    assert len(dumps(obj, t, omit_defaults=True)) < len(dumps(obj, t))
+    assert loads(dumps({"owner": None, "size": 2}, Patch, omit_defaults=True), Patch) == {"size": 2}
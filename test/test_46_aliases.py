@@ -0,0 +1,119 @@
+""" Tests for `typing_json.aliases` """
+# pylint: disable = line-too-long, invalid-name, missing-docstring
+
+# standard imports
+from collections import OrderedDict
+import json
+from typing import List, NamedTuple, Optional
+
+# external dependencies
+from typing_extensions import TypedDict
+
+# internal imports
+from typing_json import DecodeCache, EncodeCache, dumps, json_aliases, loads, register_aliases, unregister_aliases
+from typing_json.aliases import alias_table, field_aliases
+from typing_json.decoding import from_json_obj
+from typing_json.encoding import to_json_obj
+from typing_json.pointer import get_path
+from typing_json.projection import project
+
+
+class Reading(NamedTuple):
+    sensor_identifier: str
+    measured_value: float
+    unit: str = "C"
+
+READING_ALIASES = {"sensor_identifier": "s", "measured_value": "v"}
+
+class Event(TypedDict, total=False):
+    event_timestamp: int
+    reading: Reading
+
+class Plain(NamedTuple):
+    first: int
+    second: Optional[int] = None
+
+
+def _raises_type_error(f, *args, **kwargs):
+    try:
+        f(*args, **kwargs)
+        assert False
+    except TypeError:
+        assert True
+
+
+def test_decorator():
+    assert json_aliases(READING_ALIASES)(Reading) is Reading
+    try:
+        r = Reading("a", 1.5)
+        assert to_json_obj(r, Reading) == OrderedDict([("s", "a"), ("v", 1.5), ("unit", "C")])
+        assert to_json_obj(r, Reading, omit_defaults=True) == OrderedDict([("s", "a"), ("v", 1.5)])
+        assert to_json_obj(r, Reading, namedtuples_as_lists=True) == ["a", 1.5, "C"]
+        assert to_json_obj([r], List[Reading], columnar=True) == OrderedDict([("s", ["a"]), ("v", [1.5]), ("unit", ["C"])])
+        assert from_json_obj({"s": "a", "v": 1.5}, Reading) == r
+        assert from_json_obj({"s": ["a"], "v": [1.5]}, List[Reading], columnar=True) == [r]
+        # field names are not accepted in place of wire keys
+        _raises_type_error(from_json_obj, {"sensor_identifier": "a", "v": 1.5}, Reading)
+        assert field_aliases(Reading) == READING_ALIASES
+        assert alias_table(Plain) is None
+    finally:
+        unregister_aliases(Reading)
+    assert to_json_obj(Reading("a", 1.5), Reading)["sensor_identifier"] == "a"
+
+
+def test_registry():
+    register_aliases(Reading, READING_ALIASES)
+    register_aliases(Event, {"event_timestamp": "t"})
+    register_aliases(Plain, {"first": "1"})
+    try:
+        e = {"event_timestamp": 3, "reading": Reading("a", 1.5)}
+        s = dumps(e, Event)
+        assert json.loads(s) == {"t": 3, "reading": {"s": "a", "v": 1.5, "unit": "C"}}
+        assert loads(s, Event) == e
+        assert loads(s, Event, typed_containers=True) == e
+        assert to_json_obj(Plain(1, 2), Plain) == OrderedDict([("1", 1), ("second", 2)])
+        # registering aliases again replaces the previous ones
+        register_aliases(Reading, {"unit": "u"})
+        assert to_json_obj(Reading("a", 1.5), Reading) == OrderedDict([("sensor_identifier", "a"), ("measured_value", 1.5), ("u", "C")])
+        register_aliases(Reading, READING_ALIASES)
+        assert to_json_obj(Reading("a", 1.5), Reading)["s"] == "a"
+        # paths and pointers use field names
+        assert project(json.loads(s), Event, ["event_timestamp", "reading.measured_value"]) == {"event_timestamp": 3, "reading": {"measured_value": 1.5}}
+        assert get_path(s, Event, "/reading/measured_value") == 1.5
+        assert get_path(s, Event, "/event_timestamp") == 3
+    finally:
+        unregister_aliases(Reading)
+        unregister_aliases(Event)
+        unregister_aliases(Plain)
+    assert to_json_obj(Plain(1, 2), Plain) == OrderedDict([("first", 1), ("second", 2)])
+
+
+def test_invalid_aliases():
+    _raises_type_error(register_aliases, Plain, {"third": "t"})
+    _raises_type_error(register_aliases, Plain, {"first": "second"})
+    _raises_type_error(register_aliases, Plain, {"first": "x", "second": "x"})
+    _raises_type_error(register_aliases, Plain, {"first": 1})
+    _raises_type_error(register_aliases, List[int], {})
+    _raises_type_error(json_aliases({"third": "t"}), Plain)
+    register_aliases(Plain, {"first": "second", "second": "first"})
+    try:
+        assert to_json_obj(Plain(1, 2), Plain) == OrderedDict([("second", 1), ("first", 2)])
+        assert from_json_obj({"second": 1, "first": 2}, Plain) == Plain(1, 2)
+    finally:
+        unregister_aliases(Plain)
+
+
+def test_caches():
+    encode_cache, decode_cache = EncodeCache(), DecodeCache()
+    r = Reading("a", 1.5)
+    s = '{"sensor_identifier": "a", "measured_value": 1.5, "unit": "C"}'
+    assert json.loads(dumps([r], List[Reading], encode_cache=encode_cache)) == [json.loads(s)]
+    assert loads(s, Reading, decode_cache=decode_cache) == r
+    register_aliases(Reading, READING_ALIASES)
+    try:
+        # entries cached before the aliases were registered are not reused
+        assert json.loads(dumps([r], List[Reading], encode_cache=encode_cache)) == [{"s": "a", "v": 1.5, "unit": "C"}]
+        _raises_type_error(loads, s, Reading, decode_cache=decode_cache)
+    finally:
+        unregister_aliases(Reading)
+    assert json.loads(dumps([r], List[Reading], encode_cache=encode_cache)) == [json.loads(s)]
@@ -0,0 +1,136 @@
+""" Tests for `typing_json.enums` """
+# pylint: disable = line-too-long, invalid-name, missing-docstring
+
+# standard imports
+from collections import OrderedDict
+from enum import Enum
+import json
+import typing
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+# internal imports
+from typing_json import DecodeCache, EncodeCache, dumps, loads, set_enum_encoding
+from typing_json.decoding import from_json_obj
+from typing_json.encoding import to_json_obj
+from typing_json.enums import enum_encoding, enum_table
+from typing_json.unions import reset_union_stats
+
+
+class Status(Enum):
+    ACTIVE_AND_RUNNING = "a"
+    STOPPED_BY_OPERATOR = "s"
+    RUNNING = "a"
+
+class Level(Enum):
+    LOW = 1
+    MEDIUM = 2.5
+    HIGH = "h"
+    __json_enum_encoding__ = "ordinal"
+
+class Switch(Enum):
+    ON = True
+    OFF = None
+
+class Shape(Enum):
+    SQUARE = (1, 1)
+    LINE = (1, 0)
+
+
+def _raises(exc, f, *args, **kwargs):
+    try:
+        f(*args, **kwargs)
+        assert False
+    except exc:
+        assert True
+
+
+def test_tables():
+    assert enum_table(Status, "ordinal").to_wire == {Status.ACTIVE_AND_RUNNING: 0, Status.STOPPED_BY_OPERATOR: 1}
+    assert enum_table(Status, "value").from_wire == {"a": Status.ACTIVE_AND_RUNNING, "s": Status.STOPPED_BY_OPERATOR}
+    assert enum_table(Status, "name").from_wire["RUNNING"] is Status.ACTIVE_AND_RUNNING
+    assert enum_encoding(Level) == "ordinal" and enum_encoding(Status, "value") == "value" and enum_encoding(Status) == "name"
+    _raises(ValueError, enum_table, Shape, "value")
+    _raises(ValueError, enum_table, Shape, "values")
+
+
+def test_encodings():
+    values = [Status.ACTIVE_AND_RUNNING, Status.STOPPED_BY_OPERATOR]
+    t = List[Status]
+    assert to_json_obj(values, t) == ["ACTIVE_AND_RUNNING", "STOPPED_BY_OPERATOR"]
+    assert to_json_obj(values, t, enum_encoding="value") == ["a", "s"]
+    assert to_json_obj(values, t, enum_encoding="ordinal") == [0, 1]
+    assert to_json_obj(Status.RUNNING, Status, enum_encoding="ordinal") == 0
+    for encoding in (None, "name", "value", "ordinal"):
+        assert loads(dumps(values, t, enum_encoding=encoding), t, enum_encoding=encoding) == values
+        assert from_json_obj(to_json_obj(values[1], Status, enum_encoding=encoding), Status, enum_encoding=encoding) is values[1]
+    # types with their own encoding ignore the per-call encoding
+    assert to_json_obj([Level.LOW, Level.HIGH], List[Level], enum_encoding="value") == [0, 2]
+    assert to_json_obj(Level.MEDIUM, Level) == 1
+    assert from_json_obj(2, Level) is Level.HIGH
+    _raises(ValueError, to_json_obj, values, t, enum_encoding="values")
+    _raises(ValueError, from_json_obj, [], t, enum_encoding="values")
+
+
+def test_value_decoding():
+    set_enum_encoding(Level, "value")
+    try:
+        assert to_json_obj([Level.LOW, Level.MEDIUM, Level.HIGH], List[Level]) == [1, 2.5, "h"]
+        assert loads("[1, 2.5, \"h\", 1.0]", List[Level]) == [Level.LOW, Level.MEDIUM, Level.HIGH, Level.LOW]
+        _raises(TypeError, from_json_obj, 3, Level)
+        _raises(TypeError, from_json_obj, True, Level)
+        _raises(TypeError, from_json_obj, "LOW", Level)
+        _raises(TypeError, from_json_obj, [1], Level)
+    finally:
+        set_enum_encoding(Level, None)
+    _raises(TypeError, from_json_obj, True, Level)
+    _raises(TypeError, from_json_obj, 1.0, Level)
+    _raises(TypeError, from_json_obj, 3, Level)
+    assert loads("[true, null]", List[Switch], enum_encoding="value") == [Switch.ON, Switch.OFF]
+    _raises(TypeError, from_json_obj, 1, Switch, enum_encoding="value")
+    _raises(TypeError, set_enum_encoding, int, "value")
+    _raises(ValueError, set_enum_encoding, Shape, "value")
+
+
+def test_dict_keys():
+    obj = {Level.LOW: 1, Level.HIGH: 2}
+    for t in (Dict[Level, int], typing.OrderedDict[Level, int]):
+        val = OrderedDict(obj) if t is not Dict[Level, int] else obj
+        s = dumps(val, t)
+        assert json.loads(s) == {"0": 1, "2": 2}
+        assert loads(s, t) == val
+    set_enum_encoding(Level, "value")
+    try:
+        s = dumps({Level.MEDIUM: 1, Level.HIGH: 2}, Dict[Level, int])
+        assert json.loads(s) == {"2.5": 1, "h": 2}
+        assert loads(s, Dict[Level, int]) == {Level.MEDIUM: 1, Level.HIGH: 2}
+    finally:
+        set_enum_encoding(Level, None)
+    s = dumps({Status.STOPPED_BY_OPERATOR: [1]}, Dict[Status, List[int]], enum_encoding="value")
+    assert s == '{"s": [1]}'
+    assert loads(s, Dict[Status, List[int]], enum_encoding="value") == {Status.STOPPED_BY_OPERATOR: [1]}
+    _raises(TypeError, from_json_obj, {"x": 1}, Dict[Level, int])
+
+
+def test_unions():
+    reset_union_stats()
+    t = List[Union[Level, Optional[Set[int]]]]
+    obj = [Level.MEDIUM, None, {1}]
+    for adaptive_unions in (False, True):
+        assert loads(dumps(obj, t), t, adaptive_unions=adaptive_unions) == obj
+    reset_union_stats()
+
+
+def test_caches():
+    encode_cache, decode_cache = EncodeCache(), DecodeCache()
+    pair = (Status.ACTIVE_AND_RUNNING, 1)
+    t = List[Tuple[Status, int]]
+    assert json.loads(dumps([pair], t, encode_cache=encode_cache)) == [["ACTIVE_AND_RUNNING", 1]]
+    assert loads('[["a", 1]]', t, decode_cache=decode_cache, enum_encoding="value") == [pair]
+    set_enum_encoding(Status, "ordinal")
+    try:
+        # entries cached before the encoding was set are not reused
+        assert json.loads(dumps([pair], t, encode_cache=encode_cache)) == [[0, 1]]
+        _raises(TypeError, loads, '[["a", 1]]', t, decode_cache=decode_cache, enum_encoding="value")
+    finally:
+        set_enum_encoding(Status, None)
+    assert json.loads(dumps([pair], t, encode_cache=encode_cache)) == [["ACTIVE_AND_RUNNING", 1]]
@@ -0,0 +1,137 @@
+""" Tests for `typing_json.backends` """
+# pylint: disable = line-too-long, invalid-name, missing-docstring
+
+# standard imports
+from collections import OrderedDict
+from decimal import Decimal
+from enum import Enum
+import io
+import json
+import typing
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+# external dependencies
+from typing_extensions import Literal, TypedDict
+
+# internal imports
+from typing_json import dump, dumps, load, loads, available_backends, register_backend, set_default_backend
+from typing_json.backends import JSONBackend, STDLIB_BACKEND, get_backend, negotiate_backend, negotiate_dumps, negotiate_loads
+from typing_json.caching import DecodeCache
+
+
+class Color(Enum):
+    RED = "r"
+    GREEN = "g"
+
+class Reading(TypedDict):
+    sensor: str
+    value: float
+    tags: List[str]
+
+class Item(TypedDict):
+    name: str
+    count: int
+    price: Decimal
+    color: Color
+    flag: Literal["a", 1]
+
+
+class CountingBackend(JSONBackend):
+    """ A minimal backend without capabilities, counting its calls. """
+
+    name = "counting"
+
+    def __init__(self):
+        self.calls = 0
+
+    def dumps(self, obj, **kw):
+        assert not kw
+        self.calls += 1
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+    def loads(self, s, **kw):
+        assert not kw and isinstance(s, str)
+        self.calls += 1
+        return json.loads(s)
+
+
+COUNTING = CountingBackend()
+register_backend(COUNTING)
+
+CASES = [
+    ({"sensor": "é", "value": 1.5, "tags": ["x"]}, Reading),
+    ([{"sensor": "a", "value": 2.0, "tags": []}], List[Reading]),
+    ({"name": "n", "count": 2**70, "price": Decimal("0.1"), "color": Color.GREEN, "flag": 1}, Item),
+    (OrderedDict([("b", 1.25), ("a", -0.5)]), typing.OrderedDict[str, float]),
+    ({Color.RED: [1, 2]}, Dict[Color, List[int]]),
+    ({"x", "y"}, Set[str]),
+    ((1.5, None, "s"), Tuple[float, Optional[int], str]),
+    ([Decimal("1.10"), 3, "z"], List[Union[Decimal, int, str]]),
+    (float("inf"), float),
+]
+
+
+def test_conformance():
+    # every registered backend round-trips with the same typed semantics as the standard library
+    assert available_backends()[0] == "json" and "counting" in available_backends()
+    for backend in available_backends():
+        for obj, t in CASES:
+            s = dumps(obj, t, backend=backend)
+            assert loads(s, t, backend=backend) == obj == loads(s, t)
+            assert loads(dumps(obj, t), t, backend=backend) == obj
+            assert loads(s.encode("utf-8"), t, backend=backend) == obj
+            fp = io.StringIO()
+            dump(obj, t, fp, backend=backend)
+            fp.seek(0)
+            assert load(fp, t, backend=backend) == obj
+        for bad in ("[1, 2", "{\"sensor\": 1, \"value\": 1.0, \"tags\": []}"):
+            try:
+                loads(bad, Reading, backend=backend)
+                assert False
+            except (TypeError, ValueError):
+                pass
+
+
+def test_negotiation():
+    # exact numbers, bytes input, hooks and non-finite floats defer to the standard library
+    assert negotiate_loads("counting", "[]", List[str], Decimal, ordered=True, hooks=False) is COUNTING
+    assert negotiate_loads("counting", "[]", List[float], Decimal, ordered=True, hooks=False) is COUNTING
+    assert negotiate_loads("counting", "[]", List[int], Decimal, ordered=True, hooks=False) is STDLIB_BACKEND
+    assert negotiate_loads("counting", "[]", List[int], float, ordered=True, hooks=False) is COUNTING
+    assert negotiate_loads("counting", "[]", List[Color], Decimal, ordered=True, hooks=False) is STDLIB_BACKEND
+    assert negotiate_loads("counting", b"[]", List[str], Decimal, ordered=True, hooks=False) is STDLIB_BACKEND
+    assert negotiate_loads("counting", "[]", List[str], Decimal, ordered=False, hooks=True) is STDLIB_BACKEND
+    assert negotiate_loads("counting", "{}", typing.OrderedDict[str, str], Decimal, ordered=True, hooks=False) is STDLIB_BACKEND
+    assert negotiate_loads("counting", "{}", typing.OrderedDict[str, str], Decimal, ordered=False, hooks=False) is COUNTING
+    assert negotiate_dumps("counting", List[str], hooks=False) is COUNTING
+    assert negotiate_dumps("counting", List[Optional[float]], hooks=False) is STDLIB_BACKEND
+    assert negotiate_dumps("counting", List[str], hooks=True) is STDLIB_BACKEND
+    assert negotiate_backend(STDLIB_BACKEND, decimal=True, bytes_input=True, hooks=True) is STDLIB_BACKEND
+    calls = COUNTING.calls
+    assert dumps(["é"], List[str], backend="counting") == "[\"é\"]"
+    assert dumps(["é"], List[str], indent=2, backend="counting") == json.dumps(["é"], indent=2)
+    assert loads("{\"sensor\": \"a\", \"value\": 1.5, \"tags\": []}", Reading, backend="counting")["value"] == 1.5
+    assert loads("[1, 2]", List[int], backend="counting") == [1, 2]
+    assert COUNTING.calls == calls+2
+
+
+def test_registry():
+    assert get_backend(None) is STDLIB_BACKEND and get_backend(COUNTING) is COUNTING
+    for exc, f, args in [(ValueError, get_backend, ("missing",)), (TypeError, register_backend, (json,)), (ValueError, register_backend, (STDLIB_BACKEND,))]:
+        try:
+            f(*args)
+            assert False
+        except exc:
+            pass
+    calls = COUNTING.calls
+    set_default_backend("counting")
+    try:
+        assert loads(dumps(["a"], List[str]), List[str]) == ["a"]
+        assert COUNTING.calls == calls+2
+    finally:
+        set_default_backend(None)
+    assert get_backend(None) is STDLIB_BACKEND
+    # decode caches are shared across backends
+    cache = DecodeCache(max_entries=4)
+    assert loads("[\"a\"]", List[str], decode_cache=cache, backend="counting") == loads("[\"a\"]", List[str], decode_cache=cache) == ["a"]
+    assert cache.stats().hits == 1
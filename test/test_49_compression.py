@@ -0,0 +1,104 @@
+""" Tests for `typing_json.compression` and `typing_json.lines` """
+# pylint: disable = line-too-long, invalid-name, missing-docstring
+
+# standard imports
+from decimal import Decimal
+import gzip
+import io
+import os
+import tempfile
+from typing import Dict, List, Optional
+
+# external dependencies
+from typing_extensions import TypedDict
+
+# internal imports
+from typing_json import dump, load
+from typing_json.compression import COMPRESSIONS, compressed_text
+from typing_json.files import atomic_dump
+from typing_json.limits import DecodeLimitExceeded, DecodeLimits
+from typing_json.lines import dump_lines, load_lines
+
+
+class Record(TypedDict):
+    id: int
+    name: str
+    score: Optional[Decimal]
+
+
+RECORDS = [{"id": i, "name": "é%d"%i, "score": None if i%3 == 0 else Decimal("%d.25"%i)} for i in range(2000)]
+
+
+def _raises(exc, f, *args, **kwargs):
+    try:
+        f(*args, **kwargs)
+        assert False
+    except exc as e:
+        return e
+
+
+def test_dump_load():
+    t = Dict[str, List[Record]]
+    obj = {"a": RECORDS, "b": []}
+    plain = io.StringIO()
+    dump(obj, t, plain)
+    for compression in COMPRESSIONS:
+        fp = io.BytesIO()
+        dump(obj, t, fp, compression=compression)
+        assert not fp.closed and len(fp.getvalue()) < len(plain.getvalue())//4
+        fp.seek(0)
+        assert load(fp, t, compression=compression) == obj
+        fp.seek(0)
+        with compressed_text(fp, compression, "r") as text:
+            assert text.read() == plain.getvalue()
+    fp = io.BytesIO()
+    dump(obj, t, fp, compression="gzip", indent=2)
+    assert gzip.decompress(fp.getvalue()).decode("utf-8").startswith("{\n  \"a\": [\n")
+    _raises(ValueError, dump, obj, t, io.BytesIO(), compression="zip")
+    _raises(ValueError, load, io.BytesIO(), t, compression="zip")
+
+
+def test_input_size_limit():
+    fp = io.BytesIO()
+    dump(["x"*100000], List[str], fp, compression="zlib")
+    fp.seek(0)
+    e = _raises(DecodeLimitExceeded, load, fp, List[str], compression="zlib", limits=DecodeLimits(max_input_size=1000))
+    assert e.limit == "max_input_size"
+    fp.seek(0)
+    assert load(fp, List[str], compression="zlib", limits=DecodeLimits(max_input_size=100004)) == ["x"*100000]
+    truncated = io.BytesIO(fp.getvalue()[:-4])
+    _raises(EOFError, load, truncated, List[str], compression="zlib")
+
+
+def test_lines():
+    for compression in (None,)+COMPRESSIONS:
+        fp = io.StringIO() if compression is None else io.BytesIO()
+        assert dump_lines(iter(RECORDS[:300]), Record, fp, compression=compression) == 300
+        fp.seek(0)
+        assert list(load_lines(fp, Record, compression=compression)) == RECORDS[:300]
+    fp = io.StringIO()
+    dump_lines(RECORDS[:3], Record, fp, separators=(",", ":"))
+    lines = fp.getvalue().split("\n")
+    assert len(lines) == 4 and lines[0] == "{\"id\":0,\"name\":\"\\u00e90\",\"score\":null}" and lines[3] == ""
+    assert list(load_lines(io.BytesIO(b"\n[1]\r\n\n[2, 3]\n"), List[int])) == [[1], [2, 3]]
+    _raises(ValueError, dump_lines, RECORDS, Record, io.StringIO(), indent=2)
+    _raises(TypeError, load_lines, io.StringIO(), object)
+
+
+def test_line_errors():
+    decoded = []
+    e = _raises(TypeError, decoded.extend, load_lines(io.StringIO("[1]\n\n[\"a\"]\n[3]\n"), List[int]))
+    assert decoded == [[1]] and str(e).startswith("Line 3: ")
+    e = _raises(ValueError, list, load_lines(io.StringIO("[1]\n[2\n"), List[int]))
+    assert str(e).startswith("Line 2: ")
+    e = _raises(DecodeLimitExceeded, list, load_lines(io.StringIO("[1]\n[1, 2, 3]\n"), List[int], limits=DecodeLimits(max_input_size=5)))
+    assert e.limit == "max_input_size"
+
+
+def test_atomic_dump():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "snapshot.json.gz")
+        atomic_dump(RECORDS, List[Record], path, compression="gzip")
+        with open(path, "rb") as f:
+            assert load(f, List[Record], compression="gzip") == RECORDS
+        assert os.listdir(directory) == ["snapshot.json.gz"]
@@ -0,0 +1,95 @@
+""" Tests for `typing_json.indexing` """
+# pylint: disable = line-too-long, invalid-name, missing-docstring
+
+# standard imports
+from decimal import Decimal
+import os
+import tempfile
+from typing import List, Tuple
+
+# external dependencies
+from typing_extensions import TypedDict
+
+# internal imports
+from typing_json.aliases import json_aliases
+from typing_json.indexing import INDEX_SUFFIX, IndexedLines, LineIndex
+from typing_json.lines import dump_lines
+
+
+@json_aliases({"id": "i/d"})
+class Event(TypedDict):
+    id: Tuple[str, int]
+    payload: List[Decimal]
+
+
+def _event(i: int, version: int = 0) -> Event:
+    return {"id": ("e", i), "payload": [Decimal(version), Decimal("%d.5"%i)]}
+
+
+def _raises(exc, f, *args, **kwargs):
+    try:
+        f(*args, **kwargs)
+        assert False
+    except exc as e:
+        return e
+
+
+def test_index_and_reader():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "events.ndjson")
+        with open(path, "w", encoding="utf-8") as f:
+            dump_lines([_event(i) for i in range(100)], Event, f)
+            f.write("\n")
+        index = LineIndex(path, Event, key="id")
+        assert index.update() == 100 and len(index) == 100 and index.size == os.path.getsize(path)
+        assert index.keys[("e", 42)] == 42
+        index.save()
+        with IndexedLines(path, Event, key="id") as reader:
+            assert len(reader) == 100 and reader[0] == _event(0) and reader[-1] == _event(99)
+            assert reader.get(("e", 7)) == _event(7) and reader.get(("e", 100), "missing") == "missing"
+            assert list(reader)[50] == _event(50)
+            _raises(IndexError, reader.__getitem__, 100)
+            # appended records are indexed incrementally, half-written lines are not
+            with open(path, "a", encoding="utf-8") as f:
+                dump_lines([_event(100), _event(7, version=1)], Event, f)
+                f.write("{\"i/d\": [\"e\", 101]")
+            assert reader.refresh() == 2 and len(reader) == 102
+            assert reader.get(("e", 7)) == _event(7, version=1) and reader[100] == _event(100)
+            reader.index.save()
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(", \"payload\": []}\n")
+        index = LineIndex.load(path, Event, key="id")
+        assert len(index) == 103 and index.keys[("e", 101)] == 102
+        # an index saved without key is rebuilt when a key is requested, and vice versa
+        assert len(LineIndex.load(path, Event)) == 103
+        assert os.path.exists(path+INDEX_SUFFIX)
+
+
+def test_rewrite_and_errors():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "events.ndjson")
+        with open(path, "w", encoding="utf-8") as f:
+            dump_lines([_event(i) for i in range(10)], Event, f)
+        index = LineIndex(path, Event, key="id")
+        index.update()
+        with open(path, "w", encoding="utf-8") as f:
+            dump_lines([_event(i) for i in range(3)], Event, f)
+        assert index.update() == 3 and len(index) == 3 and set(index.keys) == {("e", 0), ("e", 1), ("e", 2)}
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("{\"i/d\": [\"e\", \"x\"], \"payload\": []}\n")
+        assert str(_raises(TypeError, index.update)).startswith("Record 3: ")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("{\"payload\": []}\n")
+        assert str(_raises(TypeError, LineIndex.load, path, Event, "id")).startswith("Record 0: ")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("{\"i/d\": [\"e\", 0], \"payload\": [\"x\"]}\n")
+        with IndexedLines(path, Event, key="id") as reader:
+            assert str(_raises(TypeError, reader.get, ("e", 0))).startswith("Record 0: ")
+        with IndexedLines(path, Event) as reader:
+            _raises(TypeError, reader.get, ("e", 0))
+        open(path, "w").close()
+        with IndexedLines(path, Event) as reader:
+            assert len(reader) == 0 and list(reader) == []
+    _raises(TypeError, LineIndex, path, Event, "name")
+    _raises(TypeError, LineIndex, path, Event, "payload")
+    _raises(TypeError, LineIndex, path, List[int], "id")
@@ -0,0 +1,112 @@
+""" Tests for `typing_json.lines.load_lines_parallel` """
+# pylint: disable = line-too-long, invalid-name, missing-docstring
+
+# standard imports
+from decimal import Decimal
+import os
+import subprocess
+import sys
+import tempfile
+from typing import List
+
+# external dependencies
+from typing_extensions import TypedDict
+
+# internal imports
+from typing_json.limits import DecodeLimitExceeded, DecodeLimits
+from typing_json.lines import dump_lines, line_ranges, load_lines, load_lines_parallel
+
+
+class Record(TypedDict):
+    id: int
+    data: List[Decimal]
+
+
+RECORDS = [{"id": i, "data": [Decimal(i), Decimal("0.%d"%i)]} for i in range(500)]
+
+
+def _raises(exc, f, *args, **kwargs):
+    try:
+        f(*args, **kwargs)
+        assert False
+    except exc as e:
+        return e
+
+
+def _write(directory: str, text: str) -> str:
+    path = os.path.join(directory, "records.ndjson")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    return path
+
+
+def test_line_ranges():
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write(directory, "[1]\n[22]\n\n[333]\n[4]")
+        assert line_ranges(path, 1) == [(0, 4), (4, 9), (9, 10), (10, 16), (16, 19)]
+        assert line_ranges(path, 6) == [(0, 9), (9, 16), (16, 19)]
+        assert line_ranges(path, 100) == [(0, 19)]
+        assert line_ranges(_write(directory, ""), 10) == []
+        _raises(ValueError, line_ranges, path, 0)
+
+
+def test_parallel():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "records.ndjson")
+        with open(path, "w", encoding="utf-8") as f:
+            dump_lines(RECORDS, Record, f)
+            f.write("\n")
+        with open(path, "r", encoding="utf-8") as f:
+            assert list(load_lines(f, Record)) == RECORDS
+        for workers in (1, 3):
+            assert list(load_lines_parallel(path, Record, workers=workers, range_size=1000)) == RECORDS
+            unordered = list(load_lines_parallel(path, Record, workers=workers, ordered=False, range_size=1000))
+            assert sorted(unordered, key=lambda r: r["id"]) == RECORDS
+        decoded = load_lines_parallel(path, Record, workers=2, range_size=100)
+        assert [next(decoded) for _ in range(3)] == RECORDS[:3]
+        decoded.close()
+        assert list(load_lines_parallel(_write(directory, ""), Record, workers=2)) == []
+        _raises(ValueError, load_lines_parallel, path, Record, workers=0)
+        _raises(TypeError, load_lines_parallel, path, object)
+
+
+def test_errors():
+    with tempfile.TemporaryDirectory() as directory:
+        text = "".join("[%d]\n"%i for i in range(300))+"\n[\"x\"]\n[301]\n[302\n"
+        path = _write(directory, text)
+        for workers in (1, 2):
+            decoded: list = []
+            e = _raises(TypeError, decoded.extend, load_lines_parallel(path, List[int], workers=workers, range_size=64))
+            assert str(e).startswith("Line 302: ") and decoded == [[i] for i in range(300)]
+        path = _write(directory, "[1]\n\n[2\n")
+        e = _raises(ValueError, list, load_lines_parallel(path, List[int], workers=2, range_size=4))
+        assert str(e).startswith("Line 3: ")
+        e = _raises(DecodeLimitExceeded, list, load_lines_parallel(path, List[int], workers=2, limits=DecodeLimits(max_input_size=2)))
+        assert e.limit == "max_input_size"
+
+
+_SHUTDOWN_SCRIPT = """
+import sys
+from typing import List
+from typing_json.lines import load_lines_parallel
+for _ in range(10):
+    for workers in (2, 3):
+        decoded = []
+        try:
+            decoded.extend(load_lines_parallel(sys.argv[1], List[int], workers=workers, range_size=16))
+        except TypeError as e:
+            assert str(e).startswith("Line 6: ") and decoded == [[i] for i in range(5)]
+        else:
+            assert False
+        stream = load_lines_parallel(sys.argv[1], List[int], workers=workers, range_size=16, errors="skip")
+        assert next(stream) == [0]
+        stream.close()
+"""
+
+
+def test_error_shutdown():
+    # the workers are stopped when an error is raised or the stream is closed early, instead of waiting for them (which can deadlock)
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write(directory, "".join("[%d]\n"%i if i != 5 else "[\"x\"]\n" for i in range(200)))
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([os.path.dirname(os.path.dirname(os.path.abspath(__file__))), os.environ.get("PYTHONPATH", "")]))
+        subprocess.run([sys.executable, "-c", _SHUTDOWN_SCRIPT, path], env=env, timeout=60, check=True)
@@ -0,0 +1,68 @@
+""" Tests for `typing_json.parallel` """
+# pylint: disable = line-too-long, invalid-name, missing-docstring
+
+# standard imports
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+import typing
+from typing import Deque, Dict, List, Mapping, Optional, Tuple
+
+# external dependencies
+from typing_extensions import TypedDict
+
+# internal imports
+from typing_json import dumps
+from typing_json.parallel import dumps_parallel
+
+
+class Record(TypedDict):
+    id: int
+    name: str
+    price: Optional[Decimal]
+
+
+RECORDS = [{"id": i, "name": "ré%d"%i, "price": None if i%2 else Decimal("%d.5"%i)} for i in range(103)]
+
+FORMATS = [{}, {"indent": 2}, {"indent": "\t"}, {"indent": 0}, {"separators": (",", ":")}, {"indent": 1, "separators": (" ,", ": ")}, {"ensure_ascii": False, "sort_keys": True}]
+
+
+def _raises(exc, f, *args, **kwargs):
+    try:
+        f(*args, **kwargs)
+        assert False
+    except exc as e:
+        return e
+
+
+def test_identical_output():
+    by_name = {r["name"]: r for r in reversed(RECORDS)}
+    cases = [
+        (RECORDS, List[Record]),
+        (tuple(RECORDS), Tuple[Record, ...]),
+        (deque(RECORDS), Deque[Record]),
+        (by_name, Dict[str, Record]),
+        (by_name, Mapping[str, Record]),
+        (OrderedDict(by_name), typing.OrderedDict[str, Record]),
+        ({(i, -i): str(i) for i in range(50)}, Dict[Tuple[int, int], str]),
+        (RECORDS[0], Record),
+        ([], List[Record]),
+    ]
+    for obj, t in cases:
+        for kwargs in FORMATS:
+            expected = dumps(obj, t, **kwargs)
+            for chunk_size in (None, 7):
+                assert dumps_parallel(obj, t, workers=3, chunk_size=chunk_size, **kwargs) == expected
+    assert dumps_parallel(RECORDS, List[Record], executor="process", workers=2, indent=2) == dumps(RECORDS, List[Record], indent=2)
+    with ThreadPoolExecutor(2) as executor:
+        assert dumps_parallel(by_name, Dict[str, Record], executor=executor, chunk_size=10) == dumps(by_name, Dict[str, Record])
+    assert dumps_parallel(RECORDS, List[Record], workers=2, columnar=True) == dumps(RECORDS, List[Record], columnar=True)
+
+
+def test_errors():
+    _raises(TypeError, dumps_parallel, RECORDS, Deque[Record], workers=2)
+    _raises(TypeError, dumps_parallel, RECORDS+[{"id": "x", "name": "", "price": None}], List[Record], workers=2, chunk_size=10)
+    _raises(TypeError, dumps_parallel, RECORDS, object)
+    _raises(ValueError, dumps_parallel, RECORDS, List[Record], executor="fiber")
+    _raises(ValueError, dumps_parallel, RECORDS, List[Record], workers=0)
+    _raises(ValueError, dumps_parallel, RECORDS, List[Record], chunk_size=0)
@@ -0,0 +1,118 @@
+""" Tests for checkpoints and error policies of `typing_json.lines` """
+# pylint: disable = line-too-long, invalid-name, missing-docstring
+
+# standard imports
+import io
+import os
+import subprocess
+import sys
+import tempfile
+from typing import List
+
+# internal imports
+from typing_json.compression import compressed_text
+from typing_json.lines import Checkpoint, RecordError, START, load_lines, load_lines_parallel
+
+
+LINES = ["[%d]"%i if i%10 != 7 else "[\"bad %d\"]"%i for i in range(60)]
+TEXT = "\n".join(LINES[:20])+"\n\n"+"\n".join(LINES[20:])+"\n"
+GOOD = [[i] for i in range(60) if i%10 != 7]
+BAD_LINES = [i+1 if i < 20 else i+2 for i in range(60) if i%10 == 7]
+
+
+def _raises(exc, f, *args, **kwargs):
+    try:
+        f(*args, **kwargs)
+        assert False
+    except exc as e:
+        return e
+
+
+def test_error_policies():
+    stream = load_lines(io.StringIO(TEXT), List[int], errors="collect")
+    assert list(stream) == GOOD
+    assert [e.line for e in stream.errors] == BAD_LINES and all(isinstance(e, RecordError) and isinstance(e.error, TypeError) for e in stream.errors)
+    assert str(stream.errors[0].error).startswith("Line 8: ") and stream.errors[0].offset == TEXT.index("[\"bad 7\"]")
+    assert stream.checkpoint == Checkpoint(len(TEXT), len(GOOD), 61)
+    stream = load_lines(io.BytesIO(TEXT.encode("utf-8")), List[int], errors="skip")
+    assert list(stream) == GOOD and stream.errors == []
+    _raises(ValueError, load_lines, io.StringIO(TEXT), List[int], errors="ignore")
+
+
+def test_abort_and_resume():
+    for source in ("text", "binary", "gzip"):
+        def open_source():
+            if source == "text":
+                return io.StringIO(TEXT), None
+            if source == "binary":
+                return io.BytesIO(TEXT.encode("utf-8")), None
+            fp = io.BytesIO()
+            with compressed_text(fp, "gzip", "w") as text:
+                text.write(TEXT)
+            fp.seek(0)
+            return fp, "gzip"
+        fp, compression = open_source()
+        decoded: list = []
+        stream = load_lines(fp, List[int], compression=compression)
+        e = _raises(TypeError, decoded.extend, stream)
+        assert str(e).startswith("Line 8: ") and decoded == GOOD[:7]
+        assert stream.checkpoint == Checkpoint(len("\n".join(LINES[:7]))+1, 7, 7)
+        # resuming with the skip policy continues past the bad record, without re-reading the prefix
+        checkpoint = stream.checkpoint
+        fp, compression = open_source()
+        stream = load_lines(fp, List[int], compression=compression, errors="collect", resume=checkpoint)
+        first = [next(stream) for _ in range(5)]
+        assert first == GOOD[7:12] and [e.line for e in stream.errors] == [8]
+        checkpoint = stream.checkpoint
+        stream.close()
+        fp, compression = open_source()
+        stream = load_lines(fp, List[int], compression=compression, errors="skip", resume=checkpoint)
+        assert decoded+first+list(stream) == GOOD and stream.checkpoint == Checkpoint(len(TEXT), len(GOOD), 61)
+
+
+_ABORT_SCRIPT = """
+import sys
+from typing import List
+sys.path.insert(0, sys.argv[2])
+from test_53_checkpoints import BAD_LINES, GOOD, LINES, _raises
+from typing_json.lines import Checkpoint, load_lines, load_lines_parallel
+path = sys.argv[1]
+for workers in (1, 2):
+    collected = load_lines_parallel(path, List[int], workers=workers, range_size=16, errors="collect")
+    list(collected)
+    decoded = []
+    stream = load_lines_parallel(path, List[int], workers=workers, range_size=16)
+    e = _raises(TypeError, decoded.extend, stream)
+    # the aborting error is the one collected as a record error under the "collect" policy
+    assert collected.errors[0].line == 8 and str(e) == str(collected.errors[0].error) and str(e).startswith("Line 8: ")
+    assert decoded == GOOD[:7] and stream.checkpoint == Checkpoint(len("\\n".join(LINES[:7]))+1, 7, 7)
+    # checkpoints of sequential and parallel streams are interchangeable
+    stream = load_lines_parallel(path, List[int], workers=workers, range_size=16, errors="skip", resume=stream.checkpoint)
+    first = [next(stream) for _ in range(20)]
+    checkpoint = stream.checkpoint
+    stream.close()
+    with open(path, "rb") as f:
+        rest = load_lines(f, List[int], errors="collect", resume=checkpoint)
+        assert decoded+first+list(rest) == GOOD and [e.line for e in rest.errors] == BAD_LINES[3:]
+"""
+
+
+def test_parallel():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "records.ndjson")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(TEXT)
+        for workers in (1, 2):
+            stream = load_lines_parallel(path, List[int], workers=workers, range_size=16, errors="collect")
+            assert list(stream) == GOOD and [e.line for e in stream.errors] == BAD_LINES
+            assert [e.offset for e in stream.errors] == [TEXT.index("[\"bad %d\"]"%(i if i < 20 else i-1)) for i in [l-1 for l in BAD_LINES]]
+            assert stream.checkpoint == Checkpoint(len(TEXT), len(GOOD), 61)
+            stream = load_lines_parallel(path, List[int], workers=workers, range_size=16, errors="collect", ordered=False)
+            assert sorted(stream) == sorted(GOOD) and sorted(e.line for e in stream.errors) == BAD_LINES
+            assert stream.checkpoint == Checkpoint(len(TEXT), len(GOOD), 61)
+        # the abort path stops the workers, so it must complete in bounded time (run in a subprocess, so that a deadlock fails the test)
+        test_dir = os.path.dirname(os.path.abspath(__file__))
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([os.path.dirname(test_dir), os.environ.get("PYTHONPATH", "")]))
+        subprocess.run([sys.executable, "-c", _ABORT_SCRIPT, path, test_dir], env=env, timeout=60, check=True)
+        assert list(load_lines_parallel(path, List[int], workers=2, errors="skip", resume=Checkpoint(len(TEXT), 0, 61))) == []
+        assert START == Checkpoint(0, 0, 0)
@@ -21,6 +21,35 @@
     which are not deemed of type `int`, and on integral instances of `decimal.Decimal`, which are deemed of type `int` if the optional parameter
     `cast_decimal` is set to `True` (its default value).
 
+    The functions `typing_json.load`, `typing_json.loads` and `typing_json.decoding.from_json_obj` accept an optional `limits` parameter,
+    a `typing_json.limits.DecodeLimits` instance specifying resource limits for the decoding of untrusted payloads:
+    if any of the limits is exceeded, `typing_json.limits.DecodeLimitExceeded` is raised.
+
+    Union types are encoded/decoded by trying their generic type arguments one after the other.
+    The function `typing_json.unions.set_adaptive_unions` (or the `adaptive_unions` parameter of the encoding/decoding functions)
+    can be used to enable adaptive ordering of these trials, based on hit statistics which can be inspected with `typing_json.unions.union_stats`.
+
+    The elements of collections validated by `typing_json.typechecking.is_instance` and by the encoding/decoding functions can be restricted
+    by a `typing_json.validation.ValidationPolicy`, set process-wide with `typing_json.validation.set_validation_policy`
+    or per call with the `validation` parameter (e.g. `typing_json.validation.sampled_validation(0.01)` validates about one element in a hundred).
+
+    Immutable parts of decoded objects can be marked as validated (cf.&nbsp;`typing_json.typechecking.mark_as_validated` and the `mark_validated` parameter
+    of the decoding functions), so that re-encoding them with `typecheck=True` skips the redundant validation.
+
+    A `typing_json.caching.EncodeCache` can be passed to the encoding functions to memoise the encoding of immutable values (e.g. namedtuples)
+    which appear many times in the encoded objects.
+
+    A `typing_json.caching.DecodeCache` can be passed to `typing_json.load` and `typing_json.loads` to cache decoded objects by payload digest.
+    Decoded objects can be deduplicated by passing `intern=True` (or a shared `typing_json.caching.InternTable`) to the decoding functions.
+
+    The parameter `select` of `typing_json.load` and `typing_json.loads` restricts decoding to selected paths (cf.&nbsp;`typing_json.projection`).
+
+    The parameter `backend` of `typing_json.dump`, `typing_json.dumps`, `typing_json.load` and `typing_json.loads` selects a JSON parser/serializer
+    backend other than the standard library `json` module (cf.&nbsp;`typing_json.backends`).
+
+    The parameter `compression` of `typing_json.dump` and `typing_json.load` streams the JSON text through a compressor (cf.&nbsp;`typing_json.compression`).
+    Newline-delimited JSON is encoded and decoded by the functions of `typing_json.lines`.
+
     (Version: 0.1.1)
 """
 
@@ -28,64 +57,160 @@
 import collections
 from decimal import Decimal
 import json
-from typing import Any, List, Tuple, Type
+import time
+from typing import Any, List, Optional, Sequence, Tuple, Type, Union
 
 # internal imports
-from typing_json.decoding import from_json_obj
+from typing_json.aliases import aliases_version, json_aliases, register_aliases, unregister_aliases
+from typing_json.backends import JSONBackend, STDLIB_BACKEND, available_backends, backend_loads, negotiate_dumps, negotiate_loads, register_backend, set_default_backend
+from typing_json.binary import dumpb, loadb
+from typing_json.caching import CacheStats, DecodeCache, DecodeCacheStats, EncodeCache, InternTable
+from typing_json.compression import check_compression, compressed_text
+from typing_json.containers import TypedDeque, TypedList, TypedMap, TypedSet
+from typing_json.decoding import from_json_obj, typed_parse_float
 from typing_json.encoding import is_json_encodable, to_json_obj
-from typing_json.typechecking import is_instance, is_keyable, is_namedtuple, is_typecheckable
+from typing_json.enums import enum_encodings_version, set_enum_encoding
+from typing_json.limits import DecodeBudget, DecodeLimitExceeded, DecodeLimits
+from typing_json.projection import project
+from typing_json.typechecking import is_instance, is_keyable, is_namedtuple, is_typecheckable, mark_as_validated
+from typing_json.unions import reset_union_stats, set_adaptive_unions, union_stats
+from typing_json.validation import ValidationPolicy, FULL_VALIDATION, NO_VALIDATION, clear_validated_marks, first_n_validation, sampled_validation, set_validation_policy
+
+
+def _has_dumps_options(skipkeys, ensure_ascii, check_circular, allow_nan, cls, indent, separators, default, sort_keys, kw) -> bool:
+    # pylint: disable = too-many-arguments
+    """ Whether any of the options of `json.dumps` differs from its default value. """
+    return (skipkeys, ensure_ascii, check_circular, allow_nan, cls, indent, separators, default, sort_keys) != (False, True, True, True, None, None, None, None, False) or bool(kw)
 
 
 name: str = "typing_json"
 __version__: str = "0.1.2"
 
-def dump(obj: Any, encoded_type: Type, fp, skipkeys=False, ensure_ascii=True, check_circular=True, allow_nan=True, cls=None, indent=None, separators=None, default=None, sort_keys=False, **kw) -> None:
+def dump(obj: Any, encoded_type: Type, fp, skipkeys=False, ensure_ascii=True, check_circular=True, allow_nan=True, cls=None, indent=None, separators=None, default=None, sort_keys=False, adaptive_unions: Optional[bool] = None, validation: Optional[ValidationPolicy] = None, encode_cache: Optional[EncodeCache] = None, columnar: bool = False, omit_defaults: bool = False, enum_encoding: Optional[str] = None, backend: Union[None, str, JSONBackend] = None, compression: Optional[str] = None, **kw) -> None:
     # pylint: disable = too-many-arguments
     """
         Encodes `obj` as a JSON object using `encoded_type` as a type hint, then calls `json.dump`.
 
+        The optional parameters `adaptive_unions`, `validation`, `encode_cache`, `columnar`, `omit_defaults` and `enum_encoding` are passed to `typing_json.encoding.to_json_obj`.
+
+        The optional parameter `backend` selects the JSON serializer backend (cf.&nbsp;`typing_json.backends.negotiate_dumps`), writing the string it returns to `fp`.
+
+        If the optional parameter `compression` is set (to one of `"gzip"`, `"bz2"`, `"lzma"` or `"zlib"`), `fp` must be a binary file object,
+        to which the JSON text is written through the compressor in chunks, as it is produced by the encoder (cf.&nbsp;`typing_json.compression`).
+
         Raises `TypeError` is `encoded_type` is not JSON-encodable according to `typing_json.encoding.is_json_encodable`.
     """
     if not is_json_encodable(encoded_type):
         raise TypeError("Type %s is not json-encodable."%str(encoded_type))
-    json_obj = to_json_obj(obj, encoded_type)
+    if compression is not None:
+        with compressed_text(fp, compression, "w") as text:
+            return dump(obj, encoded_type, text, skipkeys=skipkeys, ensure_ascii=ensure_ascii, check_circular=check_circular, allow_nan=allow_nan, cls=cls, indent=indent, separators=separators, default=default, sort_keys=sort_keys,
+                        adaptive_unions=adaptive_unions, validation=validation, encode_cache=encode_cache, columnar=columnar, omit_defaults=omit_defaults, enum_encoding=enum_encoding, backend=backend, **kw)
+    json_obj = to_json_obj(obj, encoded_type, adaptive_unions=adaptive_unions, validation=validation, encode_cache=encode_cache, columnar=columnar, omit_defaults=omit_defaults, enum_encoding=enum_encoding)
+    selected = negotiate_dumps(backend, encoded_type, _has_dumps_options(skipkeys, ensure_ascii, check_circular, allow_nan, cls, indent, separators, default, sort_keys, kw))
+    if selected is not STDLIB_BACKEND:
+        fp.write(selected.dumps(json_obj))
+        return None
     return json.dump(json_obj, fp, skipkeys=skipkeys, ensure_ascii=ensure_ascii, check_circular=check_circular, allow_nan=allow_nan, cls=cls, indent=indent, separators=separators, default=default, sort_keys=sort_keys, **kw)
 
 
-def dumps(obj: Any, encoded_type: Type, skipkeys=False, ensure_ascii=True, check_circular=True, allow_nan=True, cls=None, indent=None, separators=None, default=None, sort_keys=False, **kw) -> str:
+def dumps(obj: Any, encoded_type: Type, skipkeys=False, ensure_ascii=True, check_circular=True, allow_nan=True, cls=None, indent=None, separators=None, default=None, sort_keys=False, adaptive_unions: Optional[bool] = None, validation: Optional[ValidationPolicy] = None, encode_cache: Optional[EncodeCache] = None, columnar: bool = False, omit_defaults: bool = False, enum_encoding: Optional[str] = None, backend: Union[None, str, JSONBackend] = None, **kw) -> str:
     # pylint: disable = too-many-arguments
     """
         Encodes `obj` as a JSON object using `encoded_type` as a type hint, then calls `json.dumps`.
 
+        The optional parameters `adaptive_unions`, `validation`, `encode_cache`, `columnar`, `omit_defaults` and `enum_encoding` are passed to `typing_json.encoding.to_json_obj`.
+
+        The optional parameter `backend` selects the JSON serializer backend used in place of `json.dumps` (cf.&nbsp;`typing_json.backends.negotiate_dumps`).
+
         Raises `TypeError` is `encoded_type` is not JSON-encodable according to `typing_json.encoding.is_json_encodable`.
     """
     if not is_json_encodable(encoded_type):
         raise TypeError("Type %s is not json-encodable."%str(encoded_type))
-    json_obj = to_json_obj(obj, encoded_type)
+    json_obj = to_json_obj(obj, encoded_type, adaptive_unions=adaptive_unions, validation=validation, encode_cache=encode_cache, columnar=columnar, omit_defaults=omit_defaults, enum_encoding=enum_encoding)
+    selected = negotiate_dumps(backend, encoded_type, _has_dumps_options(skipkeys, ensure_ascii, check_circular, allow_nan, cls, indent, separators, default, sort_keys, kw))
+    if selected is not STDLIB_BACKEND:
+        return selected.dumps(json_obj)
     return json.dumps(json_obj, skipkeys=skipkeys, ensure_ascii=ensure_ascii, check_circular=check_circular, allow_nan=allow_nan, cls=cls, indent=indent, separators=separators, default=default, sort_keys=sort_keys, **kw)
 
 
-def load(fp, decoded_type: Type, cast_decimal: bool = True, cls=None, parse_float=Decimal, parse_int=None, parse_constant=None, **kw) -> Any:
+def load(fp, decoded_type: Type, cast_decimal: bool = True, cls=None, parse_float=Decimal, parse_int=None, parse_constant=None, limits: Optional[DecodeLimits] = None, typed_numbers: bool = False, typed_containers: bool = False, adaptive_unions: Optional[bool] = None, validation: Optional[ValidationPolicy] = None, mark_validated: bool = False, intern: Union[bool, InternTable] = False, decode_cache: Optional[DecodeCache] = None, select: Optional[Sequence[str]] = None, columnar: bool = False, enum_encoding: Optional[str] = None, backend: Union[None, str, JSONBackend] = None, compression: Optional[str] = None, **kw) -> Any:
     # pylint: disable = too-many-arguments
     """
         Calls `json.load`, then decodes `obj` from the resulting JSON object using `decoded_type` as a type hint.
 
-        Raises `TypeError` is `decoded_type` is not JSON-encodable according to `typing_json.encoding.is_json_encodable`.
-    """
-    if not is_json_encodable(decoded_type):
-        raise TypeError("Type %s is not json-encodable."%str(decoded_type))
-    obj = json.load(fp, cls=cls, parse_float=parse_float, parse_int=parse_int, parse_constant=parse_constant, object_pairs_hook=collections.OrderedDict, **kw)
-    return from_json_obj(obj, decoded_type, cast_decimal=cast_decimal)
+        The contents of `fp` are read and then passed to `typing_json.loads`, together with all other parameters:
+        see the documentation of `typing_json.loads` for the optional parameters `limits`, `typed_numbers`, `typed_containers`, `adaptive_unions`, `validation`, `mark_validated`, `intern`, `decode_cache`, `select`, `columnar`, `enum_encoding` and `backend`.
 
+        If the optional parameter `compression` is set (to one of `"gzip"`, `"bz2"`, `"lzma"` or `"zlib"`), `fp` must be a binary file object,
+        whose contents are decompressed in chunks as they are read (cf.&nbsp;`typing_json.compression`): only the decompressed text is held in memory,
+        and at most `limits.max_input_size+1` characters of it are read, if an input size limit is set.
 
-def loads(s: str, decoded_type: Type, cast_decimal: bool = True, cls=None, parse_float=Decimal, parse_int=None, parse_constant=None, **kw) -> Any:
+        Raises `TypeError` is `decoded_type` is not JSON-encodable according to `typing_json.encoding.is_json_encodable`.
+    """
+    check_compression(compression)
+    if compression is None:
+        s = fp.read()
+    else:
+        with compressed_text(fp, compression, "r") as text:
+            # reading stops just past the input size limit, if any, so that highly compressed payloads are never fully expanded
+            s = text.read(-1 if limits is None or limits.max_input_size is None else limits.max_input_size+1)
+    return loads(s, decoded_type, cast_decimal=cast_decimal, cls=cls, parse_float=parse_float, parse_int=parse_int, parse_constant=parse_constant,
+                 limits=limits, typed_numbers=typed_numbers, typed_containers=typed_containers, adaptive_unions=adaptive_unions, validation=validation, mark_validated=mark_validated, intern=intern, decode_cache=decode_cache, select=select, columnar=columnar, enum_encoding=enum_encoding, backend=backend, **kw)
+
+
+def loads(s: Union[str, bytes], decoded_type: Type, cast_decimal: bool = True, cls=None, parse_float=Decimal, parse_int=None, parse_constant=None, limits: Optional[DecodeLimits] = None, typed_numbers: bool = False, typed_containers: bool = False, adaptive_unions: Optional[bool] = None, validation: Optional[ValidationPolicy] = None, mark_validated: bool = False, intern: Union[bool, InternTable] = False, decode_cache: Optional[DecodeCache] = None, select: Optional[Sequence[str]] = None, columnar: bool = False, enum_encoding: Optional[str] = None, backend: Union[None, str, JSONBackend] = None, **kw) -> Any:
     # pylint: disable = too-many-arguments
     """
         Calls `json.load`, then decodes `obj` from the resulting JSON object using `decoded_type` as a type hint.
+        As for `json.loads`, the document `s` can be a `str` or UTF-8/16/32 encoded `bytes` (e.g. lines read from a binary file).
+
+        The optional parameter `limits` can be used to pass a `typing_json.limits.DecodeLimits` instance, specifying resource limits
+        for parsing and decoding: if any of the limits is exceeded, `typing_json.limits.DecodeLimitExceeded` is raised.
+        The input size limit is checked before parsing, while all other limits (except for the time limit) are checked during decoding.
+
+        If the optional parameter `typed_numbers` is `True`, the `parse_float` parameter is replaced by `typing_json.decoding.typed_parse_float(decoded_type, cast_decimal)`,
+        parsing float literals straight into `float` whenever `decoded_type` does not involve `decimal.Decimal`.
+
+        If the optional parameter `typed_containers` is `True`, JSON objects are parsed into plain dictionaries rather than ordered dictionaries,
+        and the parsed lists and dictionaries are reused in place by `typing_json.decoding.from_json_obj` wherever possible (cf. its `in_place` parameter):
+        ordered dictionaries are only created where `decoded_type` requires a `typing.OrderedDict`.
+
+        The optional parameters `adaptive_unions`, `validation`, `mark_validated`, `intern`, `columnar` and `enum_encoding` are passed to `typing_json.decoding.from_json_obj`.
+
+        The optional parameter `decode_cache` can be used to pass a `typing_json.caching.DecodeCache`, caching the decoded object by digest of `s`,
+        `decoded_type` and all other parameters (which must be hashable for caching to take place): a later call with the same payload and parameters
+        returns the cached object (or a copy of it, if `decoded_type` is mutable) without parsing or decoding.
+
+        The optional parameter `backend` selects the JSON parser backend used in place of `json.loads` (cf.&nbsp;`typing_json.backends.negotiate_loads`):
+        backends without the capabilities required by the call (e.g. exact number parsing, when `decoded_type` involves `int`) defer to `json.loads`.
+
+        If the optional parameter `select` is a list of paths (e.g. `["header.id", "items[*].price"]`), only the selected paths are decoded and validated,
+        and a partial object is returned instead (cf.&nbsp;`typing_json.projection.project`, to which the decoding parameters are passed).
 
         Raises `TypeError` is `decoded_type` is not JSON-encodable according to `typing_json.encoding.is_json_encodable`.
     """
     if not is_json_encodable(decoded_type):
         raise TypeError("Type %s is not json-encodable."%str(decoded_type))
-    obj = json.loads(s, cls=cls, parse_float=parse_float, parse_int=parse_int, parse_constant=parse_constant, object_pairs_hook=collections.OrderedDict, **kw)
-    return from_json_obj(obj, decoded_type, cast_decimal=cast_decimal)
+    if decode_cache is not None:
+        options = (cast_decimal, cls, parse_float, parse_int, parse_constant, limits, typed_numbers, typed_containers, adaptive_unions, validation, mark_validated, intern,
+                   None if select is None else tuple(select), columnar, enum_encoding, aliases_version(), enum_encodings_version(), tuple(sorted(kw.items())))
+        # the backend is not part of the options, as the decoded object does not depend on it
+        return decode_cache.decode(s, decoded_type, options, lambda: loads(s, decoded_type, cast_decimal=cast_decimal, cls=cls, parse_float=parse_float, parse_int=parse_int, parse_constant=parse_constant,
+                                                                          limits=limits, typed_numbers=typed_numbers, typed_containers=typed_containers, adaptive_unions=adaptive_unions,
+                                                                          validation=validation, mark_validated=mark_validated, intern=intern, select=select, columnar=columnar, enum_encoding=enum_encoding, backend=backend, **kw))
+    if typed_numbers:
+        parse_float = typed_parse_float(decoded_type, cast_decimal)
+    object_pairs_hook = None if typed_containers else collections.OrderedDict
+    if limits is not None:
+        budget = DecodeBudget(limits)
+        budget.check_input_size(s)
+    selected = negotiate_loads(backend, s, decoded_type, parse_float, ordered=object_pairs_hook is not None, hooks=cls is not None or parse_int is not None or parse_constant is not None or bool(kw))
+    obj = backend_loads(selected, s, parse_float, cls=cls, parse_int=parse_int, parse_constant=parse_constant, object_pairs_hook=object_pairs_hook, **kw)
+    if limits is not None and budget.deadline is not None:
+        # the time spent parsing is deducted from the time limit available for decoding
+        budget.check_time()
+        limits = limits._replace(max_time=budget.deadline-time.monotonic())
+    if select is not None:
+        return project(obj, decoded_type, select, cast_decimal=cast_decimal, limits=limits, in_place=typed_containers, adaptive_unions=adaptive_unions, validation=validation, mark_validated=mark_validated, intern=intern, columnar=columnar, enum_encoding=enum_encoding)
+    return from_json_obj(obj, decoded_type, cast_decimal=cast_decimal, limits=limits, in_place=typed_containers, adaptive_unions=adaptive_unions, validation=validation, mark_validated=mark_validated, intern=intern, columnar=columnar, enum_encoding=enum_encoding)
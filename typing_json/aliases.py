@@ -0,0 +1,161 @@
+#pylint:disable = line-too-long, invalid-name
+"""
+    The `typing_json.aliases` module provides field-name aliasing for namedtuples and typed dicts, mapping fields to (shorter) keys on the wire.
+
+    Aliases for a type are registered with `typing_json.aliases.register_aliases`, mapping field names to wire keys (e.g. for types defined elsewhere),
+    or declared alongside the type with the `typing_json.aliases.json_aliases` class decorator:
+
+    ```python
+    @json_aliases({"sensor_identifier": "s", "measured_value": "v"})
+    class Reading(NamedTuple):
+        sensor_identifier: str
+        measured_value: float
+    ```
+
+    Fields without an alias use their name as wire key.
+
+    Aliases are used by `typing_json.encoding.to_json_obj` (including in columnar layout) and `typing_json.decoding.from_json_obj`,
+    and hence by `typing_json.dump`, `typing_json.dumps`, `typing_json.load` and `typing_json.loads`: objects of aliased types are decoded from wire keys only.
+    Paths for `typing_json.projection.project` and pointers for `typing_json.pointer.get_path` still use field names, which are looked up by wire key.
+    The binary encoding of `typing_json.binary` is positional and unaffected.
+
+    The lookup tables for a type are built once, on first use, and cached until aliases are next registered or unregistered.
+    Entries of a `typing_json.caching.EncodeCache` or `typing_json.caching.DecodeCache` stored before aliases are registered or unregistered are not reused afterwards.
+
+    (Version: 0.1.3)
+"""
+
+# standard imports
+import threading
+from typing import Any, Callable, Dict, Mapping, NamedTuple, Optional, Type, TypeVar
+
+# internal imports
+from typing_json.typechecking import is_namedtuple, is_typed_dict
+
+
+class AliasTable(NamedTuple):
+    """
+        Lookup tables for the aliases of a namedtuple or typed dict type:
+
+        - `to_wire` maps every field name to its wire key (the field name itself, for fields without alias);
+        - `from_wire` maps every wire key to the corresponding field name.
+    """
+    to_wire: Dict[str, str]
+    from_wire: Dict[str, str]
+
+
+_lock = threading.Lock()
+_registry: Dict[Any, Dict[str, str]] = {}
+""" Centrally registered aliases, by type. """
+
+_tables: Dict[Any, Optional[AliasTable]] = {}
+""" Cached lookup tables, by type (`None` for types without aliases). """
+
+_version: int = 0
+""" Number of changes to the registry, used in the keys of caches of encoded and decoded objects (cf.&nbsp;`typing_json.aliases.aliases_version`). """
+
+_T = TypeVar("_T", bound=type)
+
+
+def _field_names(t: Type) -> Any:
+    """ The field names of the namedtuple or typed dict `t`. """
+    if is_namedtuple(t):
+        return getattr(t, "_fields")
+    return tuple(getattr(t, "__annotations__"))
+
+
+def _check_aliases(t: Type, aliases: Mapping[str, str]) -> None:
+    """ Raises `TypeError` if `aliases` is not a valid alias map for the namedtuple or typed dict `t`. """
+    if not is_namedtuple(t) and not is_typed_dict(t):
+        raise TypeError("Type %s is neither a namedtuple nor a typed dict."%str(t))
+    fields = _field_names(t)
+    for field, key in aliases.items():
+        if field not in fields:
+            raise TypeError("Aliased field %s is not a field of type %s."%(field, str(t)))
+        if not isinstance(key, str):
+            raise TypeError("Alias %s of field %s is not a string (t=%s)."%(repr(key), field, str(t)))
+    keys = [aliases.get(field, field) for field in fields]
+    if len(set(keys)) != len(keys):
+        raise TypeError("Aliases %s give the same wire key to distinct fields of type %s."%(str(dict(aliases)), str(t)))
+
+
+def register_aliases(t: Type, aliases: Mapping[str, str]) -> None:
+    """
+        Registers `aliases`, a mapping of field names to wire keys, for the namedtuple or typed dict `t` (replacing any aliases previously registered for `t`).
+        Raises `TypeError` if some aliased field is not a field of `t`, or if two fields would have the same wire key.
+    """
+    global _version # pylint: disable = global-statement
+    _check_aliases(t, aliases)
+    with _lock:
+        _registry[t] = dict(aliases)
+        _tables.clear()
+        _version += 1
+
+
+def json_aliases(aliases: Mapping[str, str]) -> Callable[[_T], _T]:
+    """
+        Class decorator registering `aliases`, a mapping of field names to wire keys, for the decorated namedtuple or typed dict
+        (cf.&nbsp;`typing_json.aliases.register_aliases`), and returning the class unchanged.
+    """
+    def decorator(t: _T) -> _T:
+        register_aliases(t, aliases)
+        return t
+    return decorator
+
+
+def unregister_aliases(t: Type) -> None:
+    """ Discards the aliases registered for `t` by `typing_json.aliases.register_aliases` or `typing_json.aliases.json_aliases`. """
+    global _version # pylint: disable = global-statement
+    with _lock:
+        _registry.pop(t, None)
+        _tables.clear()
+        _version += 1
+
+
+def aliases_version() -> int:
+    """
+        The number of times aliases have been registered or unregistered: caches of encoded or decoded objects include it in their keys,
+        so that entries cached before a change to the aliases are not reused.
+    """
+    return _version
+
+
+def field_aliases(t: Type) -> Dict[str, str]:
+    """ The aliases registered for `t`, as a mapping of field names to wire keys (empty if `t` has no aliases). """
+    return dict(_registry.get(t, {}))
+
+
+def alias_table(t: Type) -> Optional[AliasTable]:
+    """ Returns the lookup tables for the aliases of the namedtuple or typed dict `t`, or `None` if `t` has no aliases. """
+    try:
+        return _tables[t]
+    except KeyError:
+        pass
+    aliases = field_aliases(t)
+    table: Optional[AliasTable] = None
+    if aliases:
+        to_wire = {field: aliases.get(field, field) for field in _field_names(t)}
+        table = AliasTable(to_wire, {key: field for field, key in to_wire.items()})
+    with _lock:
+        _tables[t] = table
+    return table
+
+
+def wire_key(t: Type, field: str) -> str:
+    """ The wire key for field `field` of the namedtuple or typed dict `t`. """
+    table = alias_table(t)
+    if table is None:
+        return field
+    return table.to_wire[field]
+
+
+def fields_from_wire(obj: Mapping[str, Any], t: Type, table: AliasTable) -> Dict[str, Any]:
+    """ Returns a copy of the JSON object `obj` with wire keys replaced by field names, raising `TypeError` if some key is not a wire key of `t`. """
+    from_wire = table.from_wire
+    renamed = {}
+    for key, value in obj.items():
+        field = from_wire.get(key)
+        if field is None:
+            raise TypeError("Key %s of object is not a wire key of type %s (wire keys: %s)."%(repr(key), str(t), str(list(from_wire))))
+        renamed[field] = value
+    return renamed
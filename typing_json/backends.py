@@ -0,0 +1,265 @@
+#pylint:disable = line-too-long, invalid-name
+"""
+    The `typing_json.backends` module provides pluggable JSON parser/serializer backends for `typing_json.dump`, `typing_json.dumps`,
+    `typing_json.load` and `typing_json.loads`.
+
+    A backend is an instance of a subclass of `typing_json.backends.JSONBackend`, registered by name with `typing_json.backends.register_backend`.
+    The standard library `json` module is always available as backend `"json"`, and is the default. Backends for the following third-party libraries
+    are registered automatically when the libraries are installed:
+
+    - `"orjson"`, using [orjson](https://github.com/ijl/orjson), which accepts bytes input but supports neither decimals nor parsing hooks;
+    - `"simplejson"`, using [simplejson](https://github.com/simplejson/simplejson), which supports decimals and all the hooks of the `json` module.
+
+    Backends declare their capabilities, and each call negotiates the backend actually used (cf.&nbsp;`typing_json.backends.negotiate_backend`):
+    if the requested backend lacks a capability which the call requires, the standard library backend is used instead, so that typed semantics are
+    identical whichever backend is requested. In particular, third-party backends without decimal support are only used to parse payloads whose decoded type
+    cannot contain numbers which must be parsed exactly (i.e. types without `int`, `decimal.Decimal` or literal types).
+
+    Likewise, backends without hooks support are only used for serialization without formatting options (`indent`, `separators`, `sort_keys`, etc),
+    and of types whose encoding cannot contain non-finite floats; their output may otherwise differ from that of `json.dumps` (e.g. in whitespace
+    or in the escaping of non-ASCII characters), but always decodes to the same object.
+
+    The backend can be selected per call (by the `backend` parameter) or process-wide (by `typing_json.backends.set_default_backend`).
+    Stringified dictionary keys are always encoded and parsed by the standard library, so that the encoded keys do not depend on the backend.
+
+    (Version: 0.1.3)
+"""
+
+# standard imports
+from collections import OrderedDict
+from decimal import Decimal
+from enum import EnumMeta
+from functools import lru_cache
+import json
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Tuple, Type, Union, cast
+
+# external dependencies
+from typing_extensions import Literal
+
+# internal imports
+from typing_json.decoding import parse_float_as_float
+from typing_json.typechecking import contains_type
+
+
+class JSONBackend:
+    """
+        Base class for JSON backends. Subclasses set the `name` of the backend, declare its capabilities and implement `dumps` and `loads`:
+
+        - `decimal`, whether `loads` can parse float literals into `decimal.Decimal` (via `parse_float=decimal.Decimal`);
+        - `bytes_input`, whether `loads` accepts `bytes` as well as `str`;
+        - `hooks`, whether `loads` and `dumps` accept all keyword arguments of `json.loads` and `json.dumps` (`cls`, `parse_float`, `parse_int`,
+          `parse_constant`, `object_pairs_hook`, `indent`, `separators`, `sort_keys`, etc) with the same semantics.
+
+        Backends without `hooks` are only called without keyword arguments: `loads` must then parse floats as `float` and JSON objects as `dict`,
+        while `dumps` may use any formatting.
+    """
+
+    name: str = "abstract"
+    decimal: bool = False
+    bytes_input: bool = False
+    hooks: bool = False
+
+    def dumps(self, obj: Any, **kw) -> str:
+        """ Serializes the JSON object `obj` to a string. """
+        raise NotImplementedError()
+
+    def loads(self, s: Union[str, bytes], **kw) -> Any:
+        """ Parses a JSON object from the string (or bytes, if `bytes_input` is `True`) `s`, raising `ValueError` if `s` is not valid JSON. """
+        raise NotImplementedError()
+
+    def __repr__(self) -> str:
+        return "<JSON backend %s>"%repr(self.name)
+
+
+class StdlibBackend(JSONBackend):
+    """ The standard library `json` module, supporting all capabilities. """
+
+    name = "json"
+    decimal = True
+    bytes_input = True
+    hooks = True
+
+    def dumps(self, obj: Any, **kw) -> str:
+        return json.dumps(obj, **kw)
+
+    def loads(self, s: Union[str, bytes], **kw) -> Any:
+        return json.loads(s, **kw)
+
+
+class OrjsonBackend(JSONBackend):
+    """ The third-party `orjson` library, accepting bytes input; integers beyond 64 bits are handled by falling back to the standard library. """
+
+    name = "orjson"
+    bytes_input = True
+
+    def __init__(self):
+        import orjson # type: ignore # pylint: disable = import-outside-toplevel, import-error
+        self._orjson = orjson
+
+    def dumps(self, obj: Any, **kw) -> str:
+        try:
+            return self._orjson.dumps(obj).decode("utf-8")
+        except self._orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits, not supported by orjson
+            return json.dumps(obj)
+
+    def loads(self, s: Union[str, bytes], **kw) -> Any:
+        try:
+            return self._orjson.loads(s)
+        except self._orjson.JSONDecodeError:
+            # e.g. integers beyond 64 bits, not supported by orjson: the standard library parses them or raises the same error as for the default backend
+            return json.loads(s)
+
+
+class SimplejsonBackend(JSONBackend):
+    """ The third-party `simplejson` library, supporting decimals and all hooks of the `json` module. """
+
+    name = "simplejson"
+    decimal = True
+    bytes_input = True
+    hooks = True
+
+    def __init__(self):
+        import simplejson # type: ignore # pylint: disable = import-outside-toplevel, import-error
+        self._simplejson = simplejson
+
+    def dumps(self, obj: Any, **kw) -> str:
+        # decimals are encoded natively by simplejson, as they are (via `float`) by the standard library
+        return self._simplejson.dumps(obj, **kw)
+
+    def loads(self, s: Union[str, bytes], **kw) -> Any:
+        return self._simplejson.loads(s, **kw)
+
+
+STDLIB_BACKEND: JSONBackend = StdlibBackend()
+""" The standard library backend, always available. """
+
+_lock = threading.Lock()
+_backends: Dict[str, JSONBackend] = {STDLIB_BACKEND.name: STDLIB_BACKEND}
+_default_backend: JSONBackend = STDLIB_BACKEND
+
+
+def register_backend(backend: JSONBackend) -> None:
+    """ Registers `backend` under its name, replacing any backend previously registered with the same name (except for the standard library backend). """
+    if not isinstance(backend, JSONBackend):
+        raise TypeError("Backend %s is not an instance of JSONBackend."%repr(backend))
+    if backend.name == STDLIB_BACKEND.name:
+        raise ValueError("The standard library backend %s cannot be replaced."%repr(STDLIB_BACKEND.name))
+    with _lock:
+        _backends[backend.name] = backend
+
+
+def available_backends() -> List[str]:
+    """ The names of all registered backends, starting with the standard library backend. """
+    return list(_backends)
+
+
+def get_backend(backend: Union[None, str, JSONBackend]) -> JSONBackend:
+    """
+        Returns the backend registered with name `backend`, or `backend` itself if it is a `typing_json.backends.JSONBackend`,
+        or the process-wide default backend if `backend` is `None`. Raises `ValueError` if no backend is registered with the given name.
+    """
+    if backend is None:
+        return _default_backend
+    if isinstance(backend, JSONBackend):
+        return backend
+    if backend not in _backends:
+        raise ValueError("No JSON backend registered with name %s, available backends: %s."%(repr(backend), str(available_backends())))
+    return _backends[backend]
+
+
+def set_default_backend(backend: Union[None, str, JSONBackend]) -> None:
+    """ Sets the process-wide default backend, used by all calls which do not explicitly set the `backend` parameter (`None` restores the standard library backend). """
+    global _default_backend # pylint: disable = global-statement
+    _default_backend = STDLIB_BACKEND if backend is None else get_backend(backend)
+
+
+def negotiate_backend(backend: Union[None, str, JSONBackend], decimal: bool = False, bytes_input: bool = False, hooks: bool = False) -> JSONBackend:
+    """
+        Returns the backend to be used for a call requesting `backend` (cf.&nbsp;`typing_json.backends.get_backend`) and requiring the given capabilities:
+        the requested backend if it has all the capabilities required, otherwise the standard library backend.
+    """
+    selected = get_backend(backend)
+    if (decimal and not selected.decimal) or (bytes_input and not selected.bytes_input) or (hooks and not selected.hooks):
+        return STDLIB_BACKEND
+    return selected
+
+
+def _requires_exact_numbers(t: Type) -> bool:
+    """ Whether decoding into `t` depends on the exact parsing of numbers (as `decimal.Decimal`), rather than on their parsing as `float`. """
+    if t in (int, Decimal) or isinstance(t, EnumMeta):
+        return True
+    return hasattr(t, "__origin__") and t.__origin__ is Literal
+
+
+def _requires_nonfinite(t: Type) -> bool:
+    """ Whether the JSON encoding of instances of `t` can contain non-finite floats. """
+    if t is float:
+        return True
+    return hasattr(t, "__origin__") and t.__origin__ is Literal and any(isinstance(s, float) for s in t.__args__)
+
+
+def _is_ordered_dict(t: Type) -> bool:
+    """ Whether `t` is `typing.OrderedDict`. """
+    return hasattr(t, "__origin__") and t.__origin__ is OrderedDict
+
+
+@lru_cache(maxsize=None)
+def _type_requirements(t: Type) -> Tuple[bool, bool, bool]:
+    """ Whether `t` involves types requiring exact numbers, whether it involves `typing.OrderedDict` and whether its encoding can contain non-finite floats. """
+    return (contains_type(t, _requires_exact_numbers), contains_type(t, _is_ordered_dict), contains_type(t, _requires_nonfinite))
+
+
+def negotiate_loads(backend: Union[None, str, JSONBackend], s: Union[str, bytes], t: Type, parse_float: Callable[[str], Any], ordered: bool, hooks: bool) -> JSONBackend:
+    """
+        Returns the backend to be used to parse `s` before decoding it into `t`, where `parse_float` is the function used to parse float literals,
+        `ordered` indicates whether JSON objects are to be parsed into ordered dictionaries and `hooks` whether other parsing hooks are set:
+
+        - decimal support is required if `parse_float` is not `float` and decoding into `t` depends on the exact parsing of numbers
+          (i.e. if `t` involves `int`, `decimal.Decimal`, enum types or literal types);
+        - bytes input support is required if `s` is not a string;
+        - hooks support is required if `hooks` is `True`, if `parse_float` is a custom function, or if `ordered` is `True` and `t` involves `typing.OrderedDict`.
+    """
+    selected = get_backend(backend)
+    if selected is STDLIB_BACKEND:
+        # the standard library backend has all capabilities, no need to inspect `t`
+        return selected
+    decimal = parse_float is not float and _type_requirements(cast(Hashable, t))[0]
+    hooks = hooks or parse_float not in (float, Decimal, parse_float_as_float) or (ordered and _type_requirements(cast(Hashable, t))[1])
+    return negotiate_backend(selected, decimal=decimal, bytes_input=not isinstance(s, str), hooks=hooks)
+
+
+def negotiate_dumps(backend: Union[None, str, JSONBackend], t: Type, hooks: bool) -> JSONBackend:
+    """
+        Returns the backend to be used to serialize the JSON encoding of an instance of `t`, where `hooks` indicates whether any serialization options are set.
+        Backends without hooks support are only used for types whose encoding cannot contain non-finite floats, which they might not serialize as `json.dumps` does.
+    """
+    selected = get_backend(backend)
+    if selected is STDLIB_BACKEND:
+        return selected
+    return negotiate_backend(selected, hooks=hooks or _type_requirements(cast(Hashable, t))[2])
+
+
+def backend_loads(selected: JSONBackend, s: Union[str, bytes], parse_float: Callable[[str], Any], **kw) -> Any:
+    """
+        Parses `s` with the backend `selected` (as returned by `typing_json.backends.negotiate_loads`), passing `parse_float` and the keyword arguments `kw`
+        to backends supporting hooks and `parse_float` alone to backends supporting decimals.
+    """
+    if selected.hooks:
+        return selected.loads(s, parse_float=parse_float, **kw)
+    if selected.decimal and parse_float is not float:
+        return selected.loads(s, parse_float=parse_float)
+    return selected.loads(s)
+
+
+def _register_installed_backends() -> None:
+    """ Registers the backends for the supported third-party libraries which are installed. """
+    for backend_class in (OrjsonBackend, SimplejsonBackend):
+        try:
+            register_backend(backend_class())
+        except ImportError:
+            pass
+
+
+_register_installed_backends()
@@ -0,0 +1,537 @@
+#pylint:disable = line-too-long, invalid-name
+"""
+    The `typing_json.binary` module provides a compact binary encoding for instances of JSON-encodable types (cf.&nbsp;`typing_json.encoding.is_json_encodable`).
+
+    Since the type is known at both ends, `typing_json.binary.dumpb` and `typing_json.binary.loadb` leave out all information which the type already determines:
+
+    - integers are encoded as zig-zag varints, floats as 8-byte IEEE 754 doubles and strings as length-prefixed UTF-8;
+    - instances of `decimal.Decimal` are encoded exactly, as sign, exponent and integer coefficient (rather than as strings);
+    - enum values are encoded by their ordinal (rather than by name), and literal values by their index in the literal type;
+    - namedtuples, total typed dicts and fixed-length tuples are encoded positionally, without field names
+      (non-total typed dicts carry a bitmap of the fields present);
+    - values of union types are encoded with a varint tag, the index of the generic type argument used to encode them;
+    - lists, sets, frozensets, deques, variadic tuples and dictionaries are encoded as a varint count followed by the elements (keys are never stringified).
+
+    Encoders and decoders are compiled once per type, by the same analysis of the type used by `typing_json.encoding.to_json_obj`
+    and `typing_json.decoding.from_json_obj`, and then reused by all later calls.
+    Decoding the binary encoding of a value gives the same result as JSON-encoding and decoding it
+    (e.g. `loadb(dumpb(obj, t), t) == loads(dumps(obj, t), t)`), with the exception of the values which the JSON encoding cannot round-trip
+    (e.g. a string `"1"` in a `Union[decimal.Decimal, str]`, or dictionaries with integer keys): these are decoded exactly.
+
+    Malformed payloads (truncated, with trailing bytes, or with out-of-range tags) raise `ValueError`.
+    Collections of elements with an empty encoding (e.g. `List[None]`) have counts which are not bounded by the size of the payload:
+    the total number of such elements decoded by `typing_json.binary.loadb` is limited (cf.&nbsp;`typing_json.binary.MAX_ZERO_WIDTH_ELEMENTS`).
+
+    (Version: 0.1.3)
+"""
+
+# standard imports
+from collections import deque, OrderedDict
+from collections.abc import Mapping
+from decimal import Decimal
+from enum import EnumMeta
+from itertools import repeat
+import struct
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple, Type, Union
+
+# external dependencies
+from typing_extensions import Literal
+
+# internal imports
+from typing_json.encoding import is_json_encodable
+from typing_json.limits import DecodeLimitExceeded, DecodeLimits
+from typing_json.typechecking import is_instance, is_namedtuple, is_typed_dict, short_str
+from typing_json.validation import FULL_VALIDATION
+
+
+_Encoder = Callable[[Any, bytearray], None]
+_Decoder = Callable[[bytes, int], Tuple[Any, int]]
+
+_DOUBLE = struct.Struct(">d")
+
+_UNREACHABLE_ERROR_MSG = "Should never reach this point, please open an issue on GitHub."
+
+MAX_ZERO_WIDTH_ELEMENTS = 1 << 20
+""" The default limit on the total number of elements with an empty encoding (e.g. `None`) in the collections of a payload decoded by `typing_json.binary.loadb`. """
+
+
+def _write_varint(n: int, out: bytearray) -> None:
+    """ Appends the unsigned LEB128 encoding of the non-negative integer `n` to `out`. """
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _read_varint(buf: bytes, pos: int) -> Tuple[int, int]:
+    """ Reads an unsigned LEB128 integer from `buf` at `pos`, returning the integer and the position after it. """
+    result = 0
+    shift = 0
+    while True:
+        if pos >= len(buf):
+            raise ValueError("Binary payload is truncated.")
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _write_int(n: int, out: bytearray) -> None:
+    """ Appends the zig-zag varint encoding of the integer `n` to `out`. """
+    _write_varint(n << 1 if n >= 0 else ((-n) << 1)-1, out)
+
+
+def _read_int(buf: bytes, pos: int) -> Tuple[int, int]:
+    """ Reads a zig-zag varint from `buf` at `pos`. """
+    n, pos = _read_varint(buf, pos)
+    return (n >> 1 if not n & 1 else -((n+1) >> 1)), pos
+
+
+def _read_bytes(buf: bytes, pos: int, n: int) -> Tuple[bytes, int]:
+    """ Reads `n` raw bytes from `buf` at `pos`. """
+    end = pos+n
+    if end > len(buf):
+        raise ValueError("Binary payload is truncated.")
+    return buf[pos:end], end
+
+
+def _read_tag(buf: bytes, pos: int, n: int) -> Tuple[int, int]:
+    """ Reads a varint tag from `buf` at `pos`, checking that it is in `range(n)`. """
+    tag, pos = _read_varint(buf, pos)
+    if tag >= n:
+        raise ValueError("Invalid tag %d in binary payload, expected one of %d."%(tag, n))
+    return tag, pos
+
+
+# Decimal flags: bit 0 is the sign, bits 1-2 distinguish finite (0), infinite (1), quiet NaN (2) and signalling NaN (3) values.
+_DECIMAL_SPECIAL = {"F": 1, "n": 2, "N": 3}
+_DECIMAL_SPECIAL_EXPONENTS = {1: "F", 2: "n", 3: "N"}
+
+
+def _encode_decimal(obj: Decimal, out: bytearray) -> None:
+    """ Appends the exact encoding of `obj` (sign, exponent, coefficient) to `out`. """
+    sign, digits, exponent = obj.as_tuple()
+    coefficient = int("".join(map(str, digits))) if digits else 0
+    if isinstance(exponent, int):
+        out.append(sign)
+        _write_int(exponent, out)
+    else:
+        out.append(sign | _DECIMAL_SPECIAL[exponent] << 1)
+    _write_varint(coefficient, out)
+
+
+def _decode_decimal(buf: bytes, pos: int) -> Tuple[Decimal, int]:
+    """ Reads a `decimal.Decimal` encoded by `_encode_decimal`. """
+    if pos >= len(buf):
+        raise ValueError("Binary payload is truncated.")
+    flags = buf[pos]
+    if flags > 7:
+        raise ValueError("Invalid decimal flags %d in binary payload."%flags)
+    pos += 1
+    exponent: Any # special exponents are strings, which the `decimal.Decimal` stubs do not allow in tuples
+    if flags >> 1:
+        exponent = _DECIMAL_SPECIAL_EXPONENTS[flags >> 1]
+    else:
+        exponent, pos = _read_int(buf, pos)
+    coefficient, pos = _read_varint(buf, pos)
+    digits = tuple(int(d) for d in str(coefficient)) if coefficient or exponent not in ("n", "N") else ()
+    return Decimal((flags & 1, digits, exponent)), pos
+
+
+def _encode_bool(obj: Any, out: bytearray) -> None:
+    out.append(1 if obj else 0)
+
+
+def _decode_bool(buf: bytes, pos: int) -> Tuple[bool, int]:
+    if pos >= len(buf):
+        raise ValueError("Binary payload is truncated.")
+    if buf[pos] > 1:
+        raise ValueError("Invalid boolean byte %d in binary payload."%buf[pos])
+    return buf[pos] == 1, pos+1
+
+
+def _check_not_decimal(obj: Any) -> None:
+    """
+        Raises `TypeError` if `obj` is an instance of `decimal.Decimal`: such instances are deemed to be instances of `int`/`float`
+        by `typing_json.typechecking.is_instance`, but cannot be serialised as such by `json.dumps` (and hence by `typing_json.dumps`).
+    """
+    if isinstance(obj, Decimal):
+        raise TypeError("Object %s of type decimal.Decimal is not JSON serializable as int or float."%short_str(obj))
+
+
+def _encode_int(obj: Any, out: bytearray) -> None:
+    if obj.__class__ is not int:
+        _check_not_decimal(obj)
+    _write_int(int(obj), out)
+
+
+def _encode_float(obj: Any, out: bytearray) -> None:
+    if obj.__class__ is not float:
+        _check_not_decimal(obj)
+    out += _DOUBLE.pack(obj)
+
+
+def _decode_float(buf: bytes, pos: int) -> Tuple[float, int]:
+    raw, pos = _read_bytes(buf, pos, 8)
+    return _DOUBLE.unpack(raw)[0], pos
+
+
+def _encode_str(obj: str, out: bytearray) -> None:
+    raw = obj.encode("utf-8")
+    _write_varint(len(raw), out)
+    out += raw
+
+
+def _decode_str(buf: bytes, pos: int) -> Tuple[str, int]:
+    n, pos = _read_varint(buf, pos)
+    raw, pos = _read_bytes(buf, pos, n)
+    try:
+        return raw.decode("utf-8"), pos
+    except UnicodeDecodeError as e:
+        raise ValueError("Invalid UTF-8 string in binary payload.") from e
+
+
+def _encode_none(obj: Any, out: bytearray) -> None: # pylint: disable = unused-argument
+    return
+
+
+def _decode_none(buf: bytes, pos: int) -> Tuple[None, int]: # pylint: disable = unused-argument
+    return None, pos
+
+
+class _DecodeState(threading.local):
+    """ Per-thread state of the ongoing `typing_json.binary.loadb` call, shared by the compiled decoders. """
+    # pylint: disable = too-few-public-methods
+    max_length: Optional[int] = None
+    zero_width_left: int = MAX_ZERO_WIDTH_ELEMENTS
+    zero_width_limit: str = "max_nodes"
+
+
+_decode_state = _DecodeState()
+
+
+def _read_count(buf: bytes, pos: int, width: int) -> Tuple[int, int]:
+    """
+        Reads the count of a collection whose elements are encoded in at least `width` bytes each, checking it against the limits of the ongoing decoding
+        and (for elements with a non-empty encoding) against the size of the payload.
+    """
+    n, pos = _read_varint(buf, pos)
+    state = _decode_state
+    if state.max_length is not None and n > state.max_length:
+        raise DecodeLimitExceeded("max_length", "Collection of length %d exceeds limit max_length=%d."%(n, state.max_length))
+    if width:
+        if n*width > len(buf)-pos:
+            raise ValueError("Binary payload is truncated.")
+    else:
+        # elements with an empty encoding can be decoded in any number from a few bytes: their total number is limited
+        left = state.zero_width_left-n
+        if left < 0:
+            raise DecodeLimitExceeded("max_nodes", "Number of elements with empty encoding exceeds limit %s."%state.zero_width_limit)
+        state.zero_width_left = left
+    return n, pos
+
+
+_encoders_lock = threading.Lock()
+_encoders: Dict[Any, _Encoder] = {
+    bool: _encode_bool,
+    int: _encode_int,
+    float: _encode_float,
+    str: _encode_str,
+    Decimal: lambda obj, out: _encode_decimal(Decimal(obj), out),
+    None: _encode_none,
+    type(None): _encode_none,
+}
+""" Compiled encoders, by type. """
+
+_decoders_lock = threading.Lock()
+_decoders: Dict[Any, _Decoder] = {
+    bool: _decode_bool,
+    int: _read_int,
+    float: _decode_float,
+    str: _decode_str,
+    Decimal: _decode_decimal,
+    None: _decode_none,
+    type(None): _decode_none,
+}
+""" Compiled decoders, by type. """
+
+
+def _encoder(t: Type) -> _Encoder:
+    """ Returns the encoder for the JSON-encodable type `t`, compiling it if necessary. """
+    encode = _encoders.get(t)
+    if encode is None:
+        encode = _compile_encoder(t)
+        with _encoders_lock:
+            _encoders[t] = encode
+    return encode
+
+
+def _decoder(t: Type) -> _Decoder:
+    """ Returns the decoder for the JSON-encodable type `t`, compiling it if necessary. """
+    decode = _decoders.get(t)
+    if decode is None:
+        decode = _compile_decoder(t)
+        with _decoders_lock:
+            _decoders[t] = decode
+    return decode
+
+
+def _literal_index(obj: Any, values: Tuple[Any, ...]) -> int:
+    """ Index of `obj` amongst the literal `values`, preferring values of the same class (e.g. `1` rather than `True` in `Literal[True, 1]`). """
+    for i, v in enumerate(values):
+        if v.__class__ is obj.__class__ and v == obj:
+            return i
+    for i, v in enumerate(values):
+        if v == obj:
+            return i
+    raise AssertionError(_UNREACHABLE_ERROR_MSG) # pragma: no cover
+
+
+def _compile_encoder(t: Type) -> _Encoder:
+    """ Compiles the encoder for the JSON-encodable type `t`, assuming that the values encoded are instances of `t`. """
+    # pylint: disable = too-many-return-statements, too-many-branches, too-many-locals
+    if isinstance(t, EnumMeta):
+        # Enum values are encoded by their ordinal.
+        ordinals = {member: i for i, member in enumerate(t)} # type: ignore
+        return lambda obj, out: _write_varint(ordinals[obj], out)
+    if is_namedtuple(t):
+        # Namedtuples are encoded positionally.
+        field_encoders = tuple(_encoder(s) for s in getattr(t, "_field_types").values())
+        def encode_namedtuple(obj, out):
+            for encode, x in zip(field_encoders, obj):
+                encode(x, out)
+        return encode_namedtuple
+    if is_typed_dict(t):
+        # Total typed dicts are encoded positionally, non-total typed dicts are prefixed by a bitmap of the fields present.
+        items = tuple((field, _encoder(s)) for field, s in getattr(t, "__annotations__").items())
+        if getattr(t, "__total__"):
+            def encode_total_typed_dict(obj, out):
+                for field, encode in items:
+                    encode(obj[field], out)
+            return encode_total_typed_dict
+        def encode_typed_dict(obj, out):
+            _write_varint(sum(1 << i for i, (field, _) in enumerate(items) if field in obj), out)
+            for field, encode in items:
+                if field in obj:
+                    encode(obj[field], out)
+        return encode_typed_dict
+    if hasattr(t, "__origin__") and hasattr(t, "__args__"):
+        if t.__origin__ is Union:
+            # Values of union types are tagged by the index of the first generic type argument they are an instance of.
+            members = tuple((s, _encoder(s)) for s in t.__args__)
+            def encode_union(obj, out):
+                for i, (s, encode) in enumerate(members):
+                    if is_instance(obj, s, validation=FULL_VALIDATION):
+                        _write_varint(i, out)
+                        encode(obj, out)
+                        return
+                raise AssertionError(_UNREACHABLE_ERROR_MSG) # pragma: no cover
+            return encode_union
+        if t.__origin__ is Literal:
+            # Literal values are encoded by their index in the literal type.
+            values = t.__args__
+            return lambda obj, out: _write_varint(_literal_index(obj, values), out)
+        if t.__origin__ is tuple and not (len(t.__args__) == 2 and t.__args__[1] is ...):
+            # Fixed-length tuples are encoded positionally.
+            element_encoders = tuple(_encoder(s) for s in t.__args__)
+            def encode_tuple(obj, out):
+                for encode, x in zip(element_encoders, obj):
+                    encode(x, out)
+            return encode_tuple
+        if t.__origin__ in (list, tuple, set, frozenset, deque):
+            # Homogeneous collections are encoded as a count followed by the elements (floats are packed in bulk).
+            if t.__args__[0] is float:
+                def encode_floats(obj, out):
+                    if any(map(isinstance, obj, repeat(Decimal))):
+                        for x in obj:
+                            _check_not_decimal(x)
+                    _write_varint(len(obj), out)
+                    out += struct.pack(">%dd"%len(obj), *obj)
+                return encode_floats
+            encode_element = _encoder(t.__args__[0])
+            def encode_collection(obj, out):
+                _write_varint(len(obj), out)
+                for x in obj:
+                    encode_element(x, out)
+            return encode_collection
+        if t.__origin__ in (dict, OrderedDict, Mapping):
+            # Dictionaries are encoded as a count followed by the key-value pairs, with keys encoded by their type.
+            encode_key = _encoder(t.__args__[0])
+            encode_value = _encoder(t.__args__[1])
+            def encode_dict(obj, out):
+                _write_varint(len(obj), out)
+                for key, value in obj.items():
+                    encode_key(key, out)
+                    encode_value(value, out)
+            return encode_dict
+    raise AssertionError(_UNREACHABLE_ERROR_MSG) # pragma: no cover
+
+
+def _min_width(t: Type) -> int:
+    """ The minimum number of bytes in the encoding of an instance of the JSON-encodable type `t` (zero for `None`, empty tuples, etc). """
+    # pylint: disable = too-many-return-statements
+    if t in (None, type(None)):
+        return 0
+    if t is float:
+        return 8
+    if t is Decimal:
+        return 2
+    if is_namedtuple(t):
+        return sum(_min_width(s) for s in getattr(t, "_field_types").values())
+    if is_typed_dict(t):
+        if getattr(t, "__total__"):
+            return sum(_min_width(s) for s in getattr(t, "__annotations__").values())
+        return 1
+    if hasattr(t, "__origin__") and hasattr(t, "__args__") and t.__origin__ is tuple and not (len(t.__args__) == 2 and t.__args__[1] is ...):
+        return sum(_min_width(s) for s in t.__args__)
+    # booleans, integers, strings, enums, literals, unions and collections take at least one byte (value, tag or count)
+    return 1
+
+
+def _compile_decoder(t: Type) -> _Decoder:
+    """ Compiles the decoder for the JSON-encodable type `t`. """
+    # pylint: disable = too-many-return-statements, too-many-branches, too-many-locals
+    if isinstance(t, EnumMeta):
+        # Enum values are decoded from their ordinal.
+        members = tuple(t) # type: ignore
+        def decode_enum(buf, pos):
+            i, pos = _read_tag(buf, pos, len(members))
+            return members[i], pos
+        return decode_enum
+    if is_namedtuple(t):
+        # Namedtuples are decoded positionally.
+        field_decoders = tuple(_decoder(s) for s in getattr(t, "_field_types").values())
+        def decode_namedtuple(buf, pos):
+            values = []
+            for decode in field_decoders:
+                x, pos = decode(buf, pos)
+                values.append(x)
+            return t(*values), pos
+        return decode_namedtuple
+    if is_typed_dict(t):
+        # Total typed dicts are decoded positionally, non-total typed dicts from a bitmap of the fields present.
+        items = tuple((field, _decoder(s)) for field, s in getattr(t, "__annotations__").items())
+        total = getattr(t, "__total__")
+        def decode_typed_dict(buf, pos):
+            if total:
+                present = (1 << len(items))-1
+            else:
+                present, pos = _read_varint(buf, pos)
+                if present >> len(items):
+                    raise ValueError("Invalid field bitmap %d in binary payload (t=%s)."%(present, str(t)))
+            obj = {}
+            for i, (field, decode) in enumerate(items):
+                if present >> i & 1:
+                    obj[field], pos = decode(buf, pos)
+            return obj, pos
+        return decode_typed_dict
+    if hasattr(t, "__origin__") and hasattr(t, "__args__"):
+        if t.__origin__ is Union:
+            # Values of union types are decoded by the generic type argument selected by their tag.
+            member_decoders = tuple(_decoder(s) for s in t.__args__)
+            def decode_union(buf, pos):
+                i, pos = _read_tag(buf, pos, len(member_decoders))
+                return member_decoders[i](buf, pos)
+            return decode_union
+        if t.__origin__ is Literal:
+            # Literal values are decoded from their index in the literal type.
+            values = t.__args__
+            def decode_literal(buf, pos):
+                i, pos = _read_tag(buf, pos, len(values))
+                return values[i], pos
+            return decode_literal
+        if t.__origin__ is tuple and not (len(t.__args__) == 2 and t.__args__[1] is ...):
+            # Fixed-length tuples are decoded positionally.
+            element_decoders = tuple(_decoder(s) for s in t.__args__)
+            def decode_tuple(buf, pos):
+                values = []
+                for decode in element_decoders:
+                    x, pos = decode(buf, pos)
+                    values.append(x)
+                return tuple(values), pos
+            return decode_tuple
+        if t.__origin__ in (list, tuple, set, frozenset, deque):
+            # Homogeneous collections are decoded from a count followed by the elements.
+            collection = t.__origin__
+            if t.__args__[0] is float:
+                def decode_floats(buf, pos):
+                    n, pos = _read_count(buf, pos, 8)
+                    raw, pos = _read_bytes(buf, pos, 8*n)
+                    values = struct.unpack(">%dd"%n, raw)
+                    return (list(values) if collection is list else collection(values)), pos
+                return decode_floats
+            decode_element = _decoder(t.__args__[0])
+            element_width = _min_width(t.__args__[0])
+            def decode_collection(buf, pos):
+                n, pos = _read_count(buf, pos, element_width)
+                values = []
+                for _ in range(n):
+                    x, pos = decode_element(buf, pos)
+                    values.append(x)
+                return (values if collection is list else collection(values)), pos
+            return decode_collection
+        if t.__origin__ in (dict, OrderedDict, Mapping):
+            # Dictionaries are decoded from a count followed by the key-value pairs.
+            mapping = OrderedDict if t.__origin__ is OrderedDict else dict
+            decode_key = _decoder(t.__args__[0])
+            decode_value = _decoder(t.__args__[1])
+            item_width = _min_width(t.__args__[0])+_min_width(t.__args__[1])
+            def decode_dict(buf, pos):
+                n, pos = _read_count(buf, pos, item_width)
+                obj = mapping()
+                for _ in range(n):
+                    key, pos = decode_key(buf, pos)
+                    obj[key], pos = decode_value(buf, pos)
+                return obj, pos
+            return decode_dict
+    raise AssertionError(_UNREACHABLE_ERROR_MSG) # pragma: no cover
+
+
+def dumpb(obj: Any, t: Type, typecheck: bool = True) -> bytes:
+    """
+        Encodes `obj` into the compact binary encoding for type `t` (cf.&nbsp;`typing_json.binary`).
+
+        Raises `TypeError` if `t` is not JSON-encodable according to `typing_json.encoding.is_json_encodable`,
+        or if `typecheck` is `True` (default) and `obj` is not an instance of `t` according to `typing_json.typechecking.is_instance`.
+    """
+    if not is_json_encodable(t):
+        raise TypeError("Type %s is not json-encodable."%str(t))
+    if typecheck and not is_instance(obj, t):
+        raise TypeError("Object %s is not of type %s."%(short_str(obj), str(t)))
+    out = bytearray()
+    _encoder(t)(obj, out)
+    return bytes(out)
+
+
+def loadb(b: Union[bytes, bytearray, memoryview], t: Type, limits: Optional[DecodeLimits] = None) -> Any:
+    """
+        Decodes an instance of type `t` from its compact binary encoding `b` (cf.&nbsp;`typing_json.binary.dumpb`).
+
+        The optional parameter `limits` can be used to pass a `typing_json.limits.DecodeLimits` instance: `max_input_size` limits the size of `b`,
+        `max_length` the count of every collection, and `max_nodes` the total number of elements with an empty encoding (e.g. `None` elements of a `List[None]`),
+        which is otherwise limited by `typing_json.binary.MAX_ZERO_WIDTH_ELEMENTS` (the number of all other elements is bounded by the size of `b`).
+        If any of the limits is exceeded, `typing_json.limits.DecodeLimitExceeded` is raised.
+
+        Raises `TypeError` if `t` is not JSON-encodable according to `typing_json.encoding.is_json_encodable`,
+        and `ValueError` if `b` is not a valid binary encoding for type `t`.
+    """
+    if not is_json_encodable(t):
+        raise TypeError("Type %s is not json-encodable."%str(t))
+    if limits is not None and limits.max_input_size is not None and len(b) > limits.max_input_size:
+        raise DecodeLimitExceeded("max_input_size", "Input of size %d exceeds limit max_input_size=%d."%(len(b), limits.max_input_size))
+    state = _decode_state
+    state.max_length = None if limits is None else limits.max_length
+    if limits is not None and limits.max_nodes is not None:
+        state.zero_width_left = limits.max_nodes
+        state.zero_width_limit = "max_nodes=%d"%limits.max_nodes
+    else:
+        state.zero_width_left = MAX_ZERO_WIDTH_ELEMENTS
+        state.zero_width_limit = "MAX_ZERO_WIDTH_ELEMENTS=%d"%MAX_ZERO_WIDTH_ELEMENTS
+    buf = bytes(b)
+    obj, pos = _decoder(t)(buf, 0)
+    if pos != len(buf):
+        raise ValueError("Found %d trailing bytes in binary payload (t=%s)."%(len(buf)-pos, str(t)))
+    return obj
@@ -0,0 +1,278 @@
+#pylint:disable = line-too-long, invalid-name
+"""
+    The `typing_json.caching` module provides caches which can be shared across calls to the encoding/decoding functions.
+
+    A `typing_json.caching.EncodeCache` can be passed to `typing_json.encoding.to_json_obj` (and to `typing_json.dump` and `typing_json.dumps`)
+    via the optional `encode_cache` parameter, memoising the JSON encoding of deeply immutable values (namedtuples, tuples and frozensets
+    whose types only involve immutable values, cf.&nbsp;`typing_json.typechecking.is_deeply_immutable`) by identity:
+    values which appear many times in the same object, or across objects encoded with the same cache, are only encoded once.
+
+    A `typing_json.caching.InternTable` can be passed to `typing_json.decoding.from_json_obj` (and to `typing_json.load` and `typing_json.loads`)
+    via the optional `intern` parameter, deduplicating the decoded objects: short strings (including dictionary keys) are interned,
+    and equal immutable values (namedtuples, tuples and frozensets) are hash-consed, so that all occurrences share a single instance.
+
+    A `typing_json.caching.DecodeCache` can be passed to `typing_json.load` and `typing_json.loads` via the optional `decode_cache` parameter,
+    caching decoded objects by digest of the raw payload, decoded type and decoding options: repeated payloads then cost a hash instead of a full decode.
+
+    (Version: 0.1.3)
+"""
+
+# standard imports
+from collections import deque, OrderedDict
+from collections.abc import Mapping
+import copy
+from enum import EnumMeta
+from functools import lru_cache
+import hashlib
+import threading
+from typing import Any, Callable, Dict, Hashable, NamedTuple, Optional, Type, Union, cast
+
+# external dependencies
+from typing_extensions import Literal
+
+# internal imports
+from typing_json.typechecking import is_deeply_immutable, is_namedtuple, is_typed_dict
+
+
+class CacheStats(NamedTuple):
+    """ Statistics for a cache: number of hits and misses since creation (or since the last call to `clear`), and current number of entries. """
+    hits: int
+    misses: int
+    size: int
+
+
+class EncodeCache:
+    """
+        A bounded cache of JSON encodings for deeply immutable values, keyed by identity of the value, by its type and by the encoding options (including the field aliases and enum encodings in effect, cf.&nbsp;`typing_json.aliases` and `typing_json.enums`).
+
+        Cached entries hold a reference to the encoded value, so that its identity cannot be reused while the entry is in the cache.
+        When more than `maxsize` entries are stored, the least recently used entries are evicted.
+
+        The JSON objects returned by `typing_json.encoding.to_json_obj` when an encode cache is used can share cached fragments,
+        which must not be modified.
+    """
+
+    __slots__ = ("maxsize", "_entries", "_lock", "_hits", "_misses")
+
+    def __init__(self, maxsize: int = 1024):
+        if maxsize <= 0:
+            raise ValueError("Cache size must be positive, found %d instead."%maxsize)
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable, obj: Any) -> Optional[Any]:
+        """ Returns the JSON fragment cached for `obj` under `key`, or `None` if no fragment is cached. """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] is not obj:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, obj: Any, fragment: Any) -> None:
+        """ Caches the JSON fragment `fragment` for `obj` under `key`, evicting the least recently used entry if the cache is full. """
+        with self._lock:
+            self._entries[key] = (obj, fragment)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """ Discards all entries and resets the statistics. """
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> CacheStats:
+        """ Returns the current statistics for the cache. """
+        with self._lock:
+            return CacheStats(self._hits, self._misses, len(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@lru_cache(maxsize=None)
+def _is_internable(t: Type) -> bool:
+    """
+        Whether equal instances of type `t` are indistinguishable, so that they can be hash-consed.
+        This excludes types involving `float` and `decimal.Decimal` (e.g. `0.0 == -0.0` and `Decimal("1.0") == Decimal("1.00")`),
+        as well as unions and literals admitting values of different classes which compare equal (e.g. `True == 1`).
+    """
+    # pylint: disable = too-many-return-statements
+    if t in (bool, int, str, None, type(None)) or isinstance(t, EnumMeta):
+        return True
+    if is_namedtuple(t):
+        return all(_is_internable(s) for s in getattr(t, "_field_types").values())
+    if hasattr(t, "__origin__") and hasattr(t, "__args__"):
+        if t.__origin__ is Literal:
+            return all(isinstance(s, str) or s is None for s in t.__args__)
+        if t.__origin__ is Union:
+            # only optional types: `None` does not compare equal to values of any other class
+            non_none_args = [s for s in t.__args__ if s not in (None, type(None))]
+            return len(non_none_args) == 1 and _is_internable(non_none_args[0])
+        if t.__origin__ is frozenset:
+            return _is_internable(t.__args__[0])
+        if t.__origin__ is tuple:
+            return all(s is ... or _is_internable(s) for s in t.__args__)
+    return False
+
+
+class InternTable:
+    """
+        A table of canonical instances for decoded values:
+
+        - strings of length at most `max_string_length` (including dictionary keys) are interned;
+        - namedtuples, tuples and frozensets are hash-consed, i.e. equal values of the same type are replaced by a single canonical instance,
+          as long as equality is exact for their type (types involving `float`, `decimal.Decimal` or unions of different classes are excluded).
+
+        Tables can be used for a single call or shared across calls (e.g. by long-lived in-process caches), in which case they keep growing
+        until `clear` is called: all canonical instances are referenced by the table.
+    """
+
+    __slots__ = ("max_string_length", "_strings", "_values")
+
+    def __init__(self, max_string_length: int = 64):
+        self.max_string_length = max_string_length
+        self._strings: Dict[str, str] = {}
+        self._values: Dict[Any, Any] = {}
+
+    def intern(self, obj: Any, t: Type) -> Any:
+        """ Returns the canonical instance for the decoded value `obj` of type `t` (`obj` itself if it is not deduplicated). """
+        if obj.__class__ is str:
+            if len(obj) <= self.max_string_length:
+                return self._strings.setdefault(obj, obj)
+            return obj
+        if isinstance(obj, (tuple, frozenset)) and _is_internable(cast(Hashable, t)):
+            return self._values.setdefault((t, obj), obj)
+        return obj
+
+    def clear(self) -> None:
+        """ Discards all canonical instances. """
+        self._strings.clear()
+        self._values.clear()
+
+    def __len__(self) -> int:
+        return len(self._strings)+len(self._values)
+
+
+class DecodeCacheStats(NamedTuple):
+    """
+        Statistics for a decode cache: number of hits and misses since creation (or since the last call to `clear`),
+        current number of entries and current total size of the cached payloads in bytes.
+    """
+    hits: int
+    misses: int
+    size: int
+    nbytes: int
+
+
+def copy_decoded(obj: Any, t: Type) -> Any:
+    """ Copies the decoded instance `obj` of type `t`, sharing its deeply immutable parts (cf. `typing_json.typechecking.is_deeply_immutable`). """
+    # pylint: disable = too-many-return-statements
+    if is_deeply_immutable(cast(Hashable, t)):
+        return obj
+    if is_typed_dict(t):
+        field_types = getattr(t, "__annotations__")
+        return {field: copy_decoded(val, field_types[field]) for field, val in obj.items()}
+    if is_namedtuple(t):
+        field_types = getattr(t, "_field_types")
+        return t(*(copy_decoded(getattr(obj, field), field_type) for field, field_type in field_types.items()))
+    if hasattr(t, "__origin__") and hasattr(t, "__args__"):
+        if t.__origin__ in (list, deque):
+            return t.__origin__(copy_decoded(x, t.__args__[0]) for x in obj)
+        if t.__origin__ in (set, frozenset):
+            # elements are hashable, hence shared
+            return t.__origin__(obj)
+        if t.__origin__ is tuple:
+            if len(t.__args__) == 2 and t.__args__[1] is ...:
+                return tuple(copy_decoded(x, t.__args__[0]) for x in obj)
+            return tuple(copy_decoded(x, s) for x, s in zip(obj, t.__args__))
+        if t.__origin__ in (dict, OrderedDict, Mapping):
+            return obj.__class__((k, copy_decoded(v, t.__args__[1])) for k, v in obj.items())
+    # unions of mutable types: the generic type argument of `obj` is unknown
+    return copy.deepcopy(obj)
+
+
+class DecodeCache:
+    """
+        A bounded LRU cache of decoded objects, keyed by digest of the raw payload (BLAKE2b), by decoded type and by decoding options (including the field aliases and enum encodings in effect, cf.&nbsp;`typing_json.aliases` and `typing_json.enums`).
+
+        The size of each entry is accounted as the size in bytes of its payload (a proxy for the memory used by the decoded object):
+        least recently used entries are evicted whenever the total size exceeds `max_bytes` or the number of entries exceeds `max_entries`.
+        Payloads larger than `max_bytes` are never cached.
+
+        Decoded objects of deeply immutable types (cf.&nbsp;`typing_json.typechecking.is_deeply_immutable`) are shared by all hits,
+        while defensive copies are returned for mutable types (sharing their deeply immutable parts), so that callers can freely modify the results.
+    """
+
+    __slots__ = ("max_bytes", "max_entries", "_entries", "_nbytes", "_lock", "_hits", "_misses")
+
+    def __init__(self, max_bytes: int = 64*1024*1024, max_entries: int = 1024):
+        if max_bytes <= 0:
+            raise ValueError("Cache size in bytes must be positive, found %d instead."%max_bytes)
+        if max_entries <= 0:
+            raise ValueError("Cache size must be positive, found %d instead."%max_entries)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def decode(self, payload: Union[str, bytes], t: Type, options: Hashable, decode: Callable[[], Any]) -> Any:
+        """
+            Returns the object decoded from `payload` with type `t` and the given (hashable) decoding options,
+            calling `decode()` on a cache miss. If the options are not hashable, `decode()` is called without caching.
+        """
+        data = payload.encode("utf-8", "surrogatepass") if isinstance(payload, str) else bytes(payload)
+        key = (hashlib.blake2b(data, digest_size=16).digest(), t, options)
+        try:
+            hash(key)
+        except TypeError:
+            return decode()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+            else:
+                self._misses += 1
+        if entry is None:
+            decoded_obj = decode()
+            nbytes = len(data)
+            if nbytes <= self.max_bytes:
+                with self._lock:
+                    if key not in self._entries:
+                        self._entries[key] = (decoded_obj, nbytes)
+                        self._nbytes += nbytes
+                    while self._nbytes > self.max_bytes or len(self._entries) > self.max_entries:
+                        _, (_, evicted_nbytes) = self._entries.popitem(last=False)
+                        self._nbytes -= evicted_nbytes
+        else:
+            decoded_obj = entry[0]
+        # the cached object is never handed out, only (copies of) its deeply immutable parts
+        return copy_decoded(decoded_obj, t)
+
+    def clear(self) -> None:
+        """ Discards all entries and resets the statistics. """
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> DecodeCacheStats:
+        """ Returns the current statistics for the cache. """
+        with self._lock:
+            return DecodeCacheStats(self._hits, self._misses, len(self._entries), self._nbytes)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,116 @@
+#pylint:disable = line-too-long, invalid-name
+"""
+    The `typing_json.compression` module provides transparent compression for `typing_json.dump`, `typing_json.load` and the NDJSON functions
+    of `typing_json.lines`, via their optional `compression` parameter.
+
+    The available compressions are those of the standard library: `"gzip"`, `"bz2"`, `"lzma"` and `"zlib"` (zlib streams, without gzip file header).
+    When a compression is set, the file object passed to the functions must be a binary file: the text is encoded as UTF-8 and compressed
+    (or decompressed and decoded) in chunks as it is written (or read), and the compressed bytes are never held in memory as a whole.
+    `typing_json.dump` streams the chunks produced by the encoder straight into the compressor; `typing_json.load` holds the decompressed
+    text only, since the whole document is parsed at once; the NDJSON functions hold a single line at a time. The file object itself is left open.
+
+    (Version: 0.1.3)
+"""
+
+# standard imports
+import bz2
+from contextlib import contextmanager
+import gzip
+import io
+import lzma
+from typing import Any, BinaryIO, Iterator, Optional, TextIO, Tuple
+import zlib
+
+
+COMPRESSIONS: Tuple[str, ...] = ("gzip", "bz2", "lzma", "zlib")
+""" The available compressions. """
+
+CHUNK_SIZE: int = 64*1024
+""" The size of the chunks of compressed data read from file objects. """
+
+
+def check_compression(compression: Optional[str]) -> None:
+    """ Raises `ValueError` if `compression` is neither `None` nor one of `typing_json.compression.COMPRESSIONS`. """
+    if compression is not None and compression not in COMPRESSIONS:
+        raise ValueError("Compression must be one of %s, found %s instead."%(str(COMPRESSIONS), repr(compression)))
+
+
+class _ZlibReader(io.RawIOBase):
+    """ A readable raw stream decompressing a zlib stream read in chunks from a binary file object. """
+
+    def __init__(self, fp: BinaryIO):
+        super().__init__()
+        self._fp = fp
+        self._decompressor = zlib.decompressobj()
+        self._pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: Any) -> int:
+        while not self._pending:
+            if self._decompressor.unconsumed_tail:
+                data = self._decompressor.unconsumed_tail
+            elif self._decompressor.eof:
+                return 0
+            else:
+                data = self._fp.read(CHUNK_SIZE)
+                if not data:
+                    raise EOFError("Compressed file ended before the end-of-stream marker was reached.")
+            # the output of each step is bounded, so that a small compressed chunk never expands all at once
+            self._pending = self._decompressor.decompress(data, CHUNK_SIZE)
+        n = min(len(b), len(self._pending))
+        b[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+
+
+class _ZlibWriter(io.RawIOBase):
+    """ A writable raw stream compressing data into a zlib stream written to a binary file object, flushed when the stream is closed. """
+
+    def __init__(self, fp: BinaryIO):
+        super().__init__()
+        self._fp = fp
+        self._compressor = zlib.compressobj()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b: Any) -> int:
+        self._fp.write(self._compressor.compress(b))
+        return len(b)
+
+    def close(self) -> None:
+        if not self.closed:
+            self._fp.write(self._compressor.flush())
+        super().close()
+
+
+def _binary_stream(fp: BinaryIO, compression: str, mode: str) -> Any:
+    """ Returns a binary stream (de)compressing data read from or written to `fp`, in mode `"r"` or `"w"`, which does not close `fp` when closed. """
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=fp, mode=mode+"b")
+    if compression == "bz2":
+        return bz2.BZ2File(fp, mode="r") if mode == "r" else bz2.BZ2File(fp, mode="w")
+    if compression == "lzma":
+        return lzma.LZMAFile(fp, mode=mode)
+    if mode == "r":
+        return io.BufferedReader(_ZlibReader(fp), CHUNK_SIZE)
+    return io.BufferedWriter(_ZlibWriter(fp), CHUNK_SIZE)
+
+
+@contextmanager
+def compressed_text(fp: BinaryIO, compression: str, mode: str) -> Iterator[TextIO]:
+    """
+        Context manager returning a UTF-8 text stream which reads from (if `mode` is `"r"`) or writes to (if `mode` is `"w"`) the binary file object `fp`
+        with the given compression. On exit, the compressed stream is finalised (e.g. by writing the gzip trailer), but `fp` is left open.
+        Raises `ValueError` if the compression or mode is not valid.
+    """
+    check_compression(compression)
+    if compression is None or mode not in ("r", "w"):
+        raise ValueError("Expected a compression in %s and mode 'r' or 'w', found %s and %s instead."%(str(COMPRESSIONS), repr(compression), repr(mode)))
+    text = io.TextIOWrapper(_binary_stream(fp, compression, mode), encoding="utf-8", newline="\n")
+    try:
+        yield text
+    finally:
+        text.close()
@@ -0,0 +1,223 @@
+#pylint:disable = line-too-long, invalid-name
+"""
+    The `typing_json.containers` module provides typed containers, which validate their elements on insertion.
+
+    The classes `typing_json.containers.TypedList`, `typing_json.containers.TypedMap`, `typing_json.containers.TypedSet` and
+    `typing_json.containers.TypedDeque` subclass `list`, `dict`, `set` and `collections.deque` respectively, and check all elements inserted
+    (by construction, item assignment or any of the mutating methods) with `typing_json.typechecking.is_instance`, raising `TypeError` on invalid elements.
+    Keeping a growing collection valid hence costs one check per insertion, rather than one full scan per validation.
+
+    Typed containers are recognised by `typing_json.typechecking.is_instance` (and hence by `typing_json.encoding.to_json_obj`, `typing_json.dump`
+    and `typing_json.dumps`): when checking a typed container against a type with the same generic type arguments, the scan of the elements is skipped
+    if the elements are deeply immutable (cf.&nbsp;`typing_json.typechecking.is_deeply_immutable`), as their validity cannot have changed since insertion.
+    For other element types (e.g. `TypedList(List[int])`), the elements are still checked, since they could have been modified after insertion:
+    nesting typed containers (e.g. a `TypedMap` of `TypedList` values) keeps these checks cheap.
+
+    (Version: 0.1.3)
+"""
+
+# standard imports
+from collections import deque
+from typing import Any, Iterable, Optional, Type
+
+# internal imports
+from typing_json.typechecking import is_instance, short_str
+from typing_json.validation import FULL_VALIDATION
+
+
+def _check(x: Any, t: Type) -> Any:
+    """ Returns `x` if it is an instance of `t`, otherwise raises `TypeError`. """
+    if not is_instance(x, t, validation=FULL_VALIDATION):
+        raise TypeError("Value %s is not of type %s."%(short_str(x), str(t)))
+    return x
+
+
+def _check_all(xs: Iterable, t: Type) -> list:
+    """ Returns a list of the elements of `xs`, raising `TypeError` if some element is not an instance of `t`. """
+    return [_check(x, t) for x in xs]
+
+
+class TypedList(list):
+    """ A list validating that all its elements are instances of `element_type` (e.g. `TypedList(int, [1, 2])` is valid for `List[int]`). """
+
+    __slots__ = ("_typed_args",)
+
+    def __init__(self, element_type: Type, iterable: Iterable = ()):
+        self._typed_args = (element_type,)
+        super().__init__(_check_all(iterable, element_type))
+
+    @property
+    def element_type(self) -> Type:
+        """ The type of the elements. """
+        return self._typed_args[0]
+
+    def append(self, x: Any) -> None:
+        super().append(_check(x, self._typed_args[0]))
+
+    def insert(self, i: int, x: Any) -> None: # type: ignore
+        super().insert(i, _check(x, self._typed_args[0]))
+
+    def extend(self, iterable: Iterable) -> None:
+        super().extend(_check_all(iterable, self._typed_args[0]))
+
+    def __iadd__(self, iterable: Iterable) -> "TypedList": # type: ignore
+        self.extend(iterable)
+        return self
+
+    def __setitem__(self, i, x) -> None:
+        if isinstance(i, slice):
+            super().__setitem__(i, _check_all(x, self._typed_args[0]))
+        else:
+            super().__setitem__(i, _check(x, self._typed_args[0]))
+
+    def copy(self) -> "TypedList":
+        return TypedList(self._typed_args[0], self)
+
+    def __reduce__(self):
+        return (TypedList, (self._typed_args[0], list(self)))
+
+    def __repr__(self) -> str:
+        return "TypedList(%s, %s)"%(str(self._typed_args[0]), list.__repr__(self))
+
+
+class TypedMap(dict):
+    """ A dictionary validating that all its keys are instances of `key_type` and all its values are instances of `value_type` (e.g. for `Dict[str, int]`). """
+
+    __slots__ = ("_typed_args",)
+
+    def __init__(self, key_type: Type, value_type: Type, *args, **kwargs):
+        self._typed_args = (key_type, value_type)
+        super().__init__()
+        self.update(*args, **kwargs)
+
+    @property
+    def key_type(self) -> Type:
+        """ The type of the keys. """
+        return self._typed_args[0]
+
+    @property
+    def value_type(self) -> Type:
+        """ The type of the values. """
+        return self._typed_args[1]
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(_check(key, self._typed_args[0]), _check(value, self._typed_args[1]))
+
+    def update(self, *args, **kwargs) -> None: # type: ignore # pylint: disable = arguments-differ
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def __ior__(self, other) -> "TypedMap": # type: ignore
+        self.update(other)
+        return self
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def copy(self) -> "TypedMap":
+        return TypedMap(self._typed_args[0], self._typed_args[1], self)
+
+    def __reduce__(self):
+        return (TypedMap, (self._typed_args[0], self._typed_args[1], dict(self)))
+
+    def __repr__(self) -> str:
+        return "TypedMap(%s, %s, %s)"%(str(self._typed_args[0]), str(self._typed_args[1]), dict.__repr__(self))
+
+
+class TypedSet(set):
+    """ A set validating that all its elements are instances of `element_type` (e.g. `TypedSet(str, {"a"})` is valid for `Set[str]`). """
+
+    __slots__ = ("_typed_args",)
+
+    def __init__(self, element_type: Type, iterable: Iterable = ()):
+        self._typed_args = (element_type,)
+        super().__init__(_check_all(iterable, element_type))
+
+    @property
+    def element_type(self) -> Type:
+        """ The type of the elements. """
+        return self._typed_args[0]
+
+    def add(self, x: Any) -> None:
+        super().add(_check(x, self._typed_args[0]))
+
+    def update(self, *iterables: Iterable) -> None:
+        for iterable in iterables:
+            super().update(_check_all(iterable, self._typed_args[0]))
+
+    def __ior__(self, other) -> "TypedSet": # type: ignore
+        self.update(other)
+        return self
+
+    def symmetric_difference_update(self, iterable: Iterable) -> None:
+        super().symmetric_difference_update(_check_all(iterable, self._typed_args[0]))
+
+    def __ixor__(self, other) -> "TypedSet": # type: ignore
+        self.symmetric_difference_update(other)
+        return self
+
+    def copy(self) -> "TypedSet":
+        return TypedSet(self._typed_args[0], self)
+
+    def __reduce__(self):
+        return (TypedSet, (self._typed_args[0], list(self)))
+
+    def __repr__(self) -> str:
+        return "TypedSet(%s, %s)"%(str(self._typed_args[0]), set.__repr__(self) if self else "set()")
+
+
+class TypedDeque(deque):
+    """ A deque validating that all its elements are instances of `element_type` (e.g. `TypedDeque(int, [1, 2], maxlen=10)` is valid for `Deque[int]`). """
+
+    def __init__(self, element_type: Type, iterable: Iterable = (), maxlen: Optional[int] = None):
+        self._typed_args = (element_type,)
+        super().__init__(_check_all(iterable, element_type), maxlen)
+
+    @property
+    def element_type(self) -> Type:
+        """ The type of the elements. """
+        return self._typed_args[0]
+
+    def append(self, x: Any) -> None:
+        super().append(_check(x, self._typed_args[0]))
+
+    def appendleft(self, x: Any) -> None:
+        super().appendleft(_check(x, self._typed_args[0]))
+
+    def insert(self, i: int, x: Any) -> None:
+        super().insert(i, _check(x, self._typed_args[0]))
+
+    def extend(self, iterable: Iterable) -> None:
+        super().extend(_check_all(iterable, self._typed_args[0]))
+
+    def extendleft(self, iterable: Iterable) -> None:
+        super().extendleft(_check_all(iterable, self._typed_args[0]))
+
+    def __iadd__(self, iterable: Iterable) -> "TypedDeque": # type: ignore
+        self.extend(iterable)
+        return self
+
+    def __setitem__(self, i, x) -> None:
+        super().__setitem__(i, _check(x, self._typed_args[0]))
+
+    def __add__(self, other: Iterable) -> "TypedDeque":
+        result = self.copy()
+        result.extend(other)
+        return result
+
+    def __mul__(self, n: int) -> "TypedDeque":
+        return TypedDeque(self._typed_args[0], list(self)*n, self.maxlen)
+
+    def copy(self) -> "TypedDeque":
+        return TypedDeque(self._typed_args[0], self, self.maxlen)
+
+    def __copy__(self) -> "TypedDeque":
+        return self.copy()
+
+    def __reduce__(self):
+        return (TypedDeque, (self._typed_args[0], list(self), self.maxlen))
+
+    def __repr__(self) -> str:
+        return "TypedDeque(%s, %s, maxlen=%s)"%(str(self._typed_args[0]), list(self), self.maxlen)
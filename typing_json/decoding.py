@@ -15,32 +15,84 @@ from collections import deque, OrderedDict
 from collections.abc import Mapping
 from decimal import Decimal, InvalidOperation
 from enum import EnumMeta
+from itertools import islice, repeat
 import json
-from typing import Any, List, Union, Type
+from typing import Any, Callable, List, Optional, Tuple, Union, Type
 
 # external dependencies
 from typing_extensions import Literal
 
 # internal imports
-from typing_json.typechecking import is_instance, is_namedtuple, is_typed_dict, JSON_BASE_TYPES, short_str
-from typing_json.encoding import is_json_encodable
+from typing_json.aliases import alias_table, fields_from_wire
+from typing_json.typechecking import contains_type, is_instance, is_namedtuple, is_typed_dict, JSON_BASE_TYPES, mark_as_validated, short_str
+from typing_json.encoding import is_columnar_record, is_json_encodable
+from typing_json.caching import InternTable
+from typing_json.enums import ENUM_ENCODINGS, enum_encoding, enum_from_wire, enum_from_wire_key
+from typing_json.limits import DecodeBudget, DecodeLimits
+from typing_json.unions import adaptive_unions_enabled, union_profile
+from typing_json.validation import ValidationPolicy, get_validation_policy
 
 
 _UNREACHABLE_ERROR_MSG = "Should never reach this point, please open an issue on GitHub."
 
 
-def _from_json_obj_namedtuple(obj, t, fields, field_types, field_defaults, cast_decimal=True):
+def parse_float_as_float(s: str) -> Union[float, Decimal]:
+    """
+        Parses a JSON float literal as a `float`, unless the literal encodes an integer (or overflows `float`),
+        in which case it is parsed as a `decimal.Decimal` so that it can still be cast to `int`.
+    """
+    x = float(s)
+    if x.is_integer() or x in (_INF, -_INF):
+        return Decimal(s)
+    return x
+
+
+_INF = float("inf")
+
+
+def _requires_decimal(t: Type) -> bool:
+    """ Whether decoding into `t` requires float literals to be parsed as `decimal.Decimal`. """
+    if t is Decimal:
+        return True
+    if hasattr(t, "__origin__") and t.__origin__ is Literal:
+        return any(isinstance(s, float) for s in t.__args__)
+    return False
+
+
+def typed_parse_float(t: Type, cast_decimal: bool = True) -> Callable[[str], Any]:
+    """
+        Returns a function suitable for use as the `parse_float` parameter of `json.load`/`json.loads`
+        when the resulting JSON object is going to be decoded into an instance of type `t` by `from_json_obj`.
+
+        If `cast_decimal` is `True` and `decimal.Decimal` does not appear anywhere in `t`, `typing_json.decoding.parse_float_as_float` is returned:
+        float literals are parsed straight into `float`, except for those encoding integers, which are parsed into `decimal.Decimal` so that they can still be cast to `int`.
+        Otherwise (or if `t` involves literal types with `float` literals, which are decoded unaltered), `decimal.Decimal` is returned,
+        i.e. all float literals are parsed into `decimal.Decimal` as usual.
+        In both cases, the result of `from_json_obj` is the same as it would be if all float literals were parsed into `decimal.Decimal`,
+        without the overhead of a double conversion for values of type `float`.
+    """
+    if cast_decimal and not contains_type(t, _requires_decimal):
+        return parse_float_as_float
+    return Decimal
+
+
+
+def _from_json_obj_namedtuple(obj, t, fields, field_types, field_defaults, opts):
     # pylint: disable = too-many-arguments
     if isinstance(obj, list):
         # there is a special provision for decoding namedtuples from lists (the standard encoding done by the builtin json library)
         if len(fields) < len(obj):
             raise TypeError("Object %s provides too many values for namedtuple type t=%s."%(short_str(obj), str(t)))
-        return_val = t(*tuple(from_json_obj(obj[i] if i < len(obj) else field_defaults[field], field_types[field], cast_decimal=cast_decimal) for i, field in enumerate(fields)))
+        return_val = t(*tuple(_from_json_obj(obj[i] if i < len(obj) else field_defaults[field], field_types[field], opts) for i, field in enumerate(fields)))
         # assert is_instance(return_val, t, cast_decimal=cast_decimal)
         return return_val
     if not isinstance(obj, (dict, OrderedDict)):
         # Namedtuples are ordinarily decoded from dictionaries, not necessarily ordered (though they are encoded as ordered dictionaries).
         raise TypeError("Object %s is not (ordered) dictionary (t=%s)."%(short_str(obj), str(t))) # pylint:disable=line-too-long
+    aliases = alias_table(t)
+    if aliases is not None:
+        # fields of aliased types are decoded from their wire keys
+        obj = fields_from_wire(obj, t, aliases)
     converted_dict: OrderedDict() = {} # type:ignore
     if set(obj.keys()).union(set(field_defaults.keys())) != set(field_types.keys()):
         # raise an error if the keys provided by the object together with the names of fields with default values don't yield exactly the names of all fields for the namedtuple
@@ -56,22 +108,130 @@ def _from_json_obj_namedtuple(obj, t, fields, field_types, field_defaults, cast_
             converted_dict[field] = field_defaults[field]
         else:
             # for each field appearing in the JSON object, decoding the corresponding value
-            converted_dict[field] = from_json_obj(obj[field], field_type, cast_decimal=cast_decimal)
+            converted_dict[field] = _from_json_obj(obj[field], field_type, opts)
     return_val = t(**converted_dict)
     # assert is_instance(return_val, t, cast_decimal=cast_decimal)
     return return_val
 
 
-def _from_json_obj_iterator(obj, element_t, cast_decimal=True):
-    if is_namedtuple(element_t):
+def _update_in_place(obj, converted_dict):
+    """ Updates the values of `obj` which differ (by identity) from the corresponding values in `converted_dict`, then returns `obj`. """
+    for field, val in converted_dict.items():
+        if obj[field] is not val:
+            obj[field] = val
+    return obj
+
+
+def _validated_indices(n: int, element_t: Type, opts: "_DecodingOptions") -> Optional[range]:
+    """
+        Returns the range of indices of elements of type `element_t` to be validated in a collection of size `n`,
+        according to the validation policy, or `None` if all elements have to be validated.
+    """
+    validation = opts.validation
+    if validation.mode == "full" or opts.budget is not None or opts.intern_table is not None or not _is_trusted_type(element_t):
+        # resource limits and interning apply to all elements, so that validation cannot be skipped when decoding with limits or interning
+        return None
+    return validation.indices(n)
+
+
+def _is_trusted_type(t: Type) -> bool:
+    """ Whether values of type `t` can be decoded without validation (JSON basic types and literal types). """
+    return t in JSON_BASE_TYPES or t is None or (hasattr(t, "__origin__") and t.__origin__ is Literal)
+
+
+def _from_json_obj_trusted(obj: Any, t: Type) -> Any:
+    """
+        Decodes a value of JSON basic type or literal type `t` without validation, only casting numbers to the required type.
+        Raises `TypeError` if a non-integral number is cast to `int`, rather than truncating it.
+    """
+    if obj.__class__ is Decimal:
+        if t is float:
+            return float(obj)
+        if t is int:
+            if not obj.is_finite() or obj != obj.to_integral_value():
+                raise TypeError("Object %s is not of type %s."%(short_str(obj), str(t)))
+            return int(obj)
+    elif t is float and obj.__class__ is int:
+        return float(obj)
+    return obj
+
+
+def _from_json_obj_sampled(obj, element_t, validated, opts):
+    """ Decodes the elements of a collection, validating only those with index in `validated`. """
+    for i, el in enumerate(obj):
+        if i in validated:
+            yield _from_json_obj(el, element_t, opts)
+        else:
+            yield _from_json_obj_trusted(el, element_t)
+
+
+def _from_json_obj_iterator(obj, element_t, opts):
+    validated = _validated_indices(len(obj), element_t, opts)
+    if validated is not None:
+        return _from_json_obj_sampled(obj, element_t, validated, opts)
+    if is_namedtuple(element_t) and opts.intern_table is None and opts.budget is None:
         fields = getattr(element_t, "_fields")
         field_types = getattr(element_t, "_field_types")
         field_defaults = getattr(element_t, "_field_defaults")
-        return (_from_json_obj_namedtuple(el, element_t, fields, field_types, field_defaults, cast_decimal=cast_decimal) for el in obj)
-    return (from_json_obj(el, element_t, cast_decimal=cast_decimal) for el in obj)
+        return (_from_json_obj_namedtuple(el, element_t, fields, field_types, field_defaults, opts) for el in obj)
+    return (_from_json_obj(el, element_t, opts) for el in obj)
+
+
+def _from_json_obj_columns(obj, element_t, opts):
+    """ Decodes a list of records (namedtuples or total typed dicts) of type `element_t` from its columnar layout, a dictionary of columns. """
+    # pylint: disable = too-many-locals
+    if is_namedtuple(element_t):
+        field_types = getattr(element_t, "_field_types")
+        field_defaults = getattr(element_t, "_field_defaults")
+    else:
+        field_types = getattr(element_t, "__annotations__")
+        field_defaults = {}
+    aliases = alias_table(element_t)
+    if aliases is not None:
+        # columns of aliased types are keyed by the wire keys of the fields
+        obj = fields_from_wire(obj, element_t, aliases)
+    extra_fields = [field for field in obj if field not in field_types]
+    if extra_fields:
+        raise TypeError("Extra columns %s found when decoding object %s (t=%s)."%(str(extra_fields), short_str(obj), str(element_t)))
+    missing_fields = [field for field in field_types if field not in obj and field not in field_defaults]
+    if missing_fields:
+        raise TypeError("Columns %s missing from object %s (t=%s)."%(str(missing_fields), short_str(obj), str(element_t)))
+    if not obj:
+        raise TypeError("Object %s has no columns, cannot determine number of records (t=%s)."%(short_str(obj), str(element_t)))
+    n = None
+    columns = []
+    for field, field_type in field_types.items():
+        if field not in obj:
+            # columns for fields with default values can be omitted
+            columns.append(repeat(field_defaults[field]))
+            continue
+        column = obj[field]
+        if not isinstance(column, list):
+            raise TypeError("Column %s of object %s is not a list (t=%s)."%(field, short_str(obj), str(element_t)))
+        if n is None:
+            n = len(column)
+        elif len(column) != n:
+            raise TypeError("Column %s of object %s has length %d, expected %d (t=%s)."%(field, short_str(obj), len(column), n, str(element_t)))
+        # columns are decoded in bulk, as homogeneous lists of values
+        if opts.budget is None:
+            columns.append(list(_from_json_obj_iterator(column, field_type, opts)))
+            continue
+        opts.budget.enter(column)
+        try:
+            columns.append(list(_from_json_obj_iterator(column, field_type, opts)))
+        finally:
+            opts.budget.depth -= 1
+    if is_namedtuple(element_t):
+        records = [element_t(*values) for values in islice(zip(*columns), n)]
+        if opts.intern_table is not None:
+            records = [opts.intern_table.intern(record, element_t) for record in records]
+        return records
+    fields = list(field_types)
+    return [dict(zip(fields, values)) for values in islice(zip(*columns), n)]
 
 
-def from_json_obj(obj: Any, t: Type, cast_decimal: bool = True) -> Any:
+def from_json_obj(obj: Any, t: Type, cast_decimal: bool = True, limits: Optional[DecodeLimits] = None, in_place: bool = False, adaptive_unions: Optional[bool] = None, validation: Optional[ValidationPolicy] = None, mark_validated: bool = False, intern: Union[bool, InternTable] = False, columnar: bool = False, enum_encoding: Optional[str] = None) -> Any:
+    # pylint: disable = too-many-arguments
     """
         Decodes a JSON object `obj` into an instance of a typecheckable type `t`.
         This method raises `TypeError` if type `t` is not JSON encodable according to `typing_json.encoding.is_json_encodable`.
@@ -113,17 +273,154 @@ def from_json_obj(obj: Any, t: Type, cast_decimal: bool = True) -> Any:
         The keys for the dictionary must form a subset of all keys for the typed dict `t`; if `t` is total, then all keys must be presend.
         An instance of `t` is then constructed (and returned) by assigning to keys having names in the dictionary the JSON decoding of the corresponding values in the dictionary.
 
+        If a namedtuple or typed dict `t` has field aliases (cf.&nbsp;`typing_json.aliases`), the keys of the dictionary must be the wire keys of the fields, rather than the field names.
+
+        The optional parameter `limits` can be used to pass a `typing_json.limits.DecodeLimits` instance, specifying resource limits
+        for the decoding: if any of the limits is exceeded, `typing_json.limits.DecodeLimitExceeded` is raised.
+
+        If the optional parameter `in_place` is set to `True` (default: `False`), `obj` is assumed to be owned by the caller, as freshly produced
+        by a JSON parser which preserves the order of object members in plain dictionaries (such as `json.loads` without `object_pairs_hook`).
+        In this case, the lists and dictionaries of `obj` are reused (and modified in place) wherever they can be used as part of the result,
+        namely for `typing.List`, typed dicts and `typing.Dict`/`typing.Mapping` with `str` keys, and plain dictionaries are accepted for `typing.OrderedDict`.
+        Containers are never reused while trying the generic type arguments of a `typing.Union`, but plain dictionaries are still accepted for `typing.OrderedDict` there.
+
+        The optional parameter `adaptive_unions` can be used to enable (if `True`) or disable (if `False`) adaptive ordering of the generic type arguments tried
+        when decoding values of `typing.Union` types (cf.&nbsp;`typing_json.unions`): if `None` (default), the process-wide setting is used.
+        Adaptive ordering never changes the result of the decoding.
+
+        The optional parameter `validation` can be used to pass a `typing_json.validation.ValidationPolicy`, determining which elements of collections
+        are validated: if `None` (default), the process-wide policy is used (cf.&nbsp;`typing_json.validation.set_validation_policy`).
+        Elements which are not validated are decoded without checks only if their type is a JSON basic type or a literal type
+        (numbers are still cast to `int`/`float` where required), while all other elements are decoded (and hence validated) as usual.
+        If `limits` is not `None`, all elements are validated regardless of the policy.
+
+        If the optional parameter `mark_validated` is `True` (default: `False`), the deeply immutable parts of the decoded object are marked as validated
+        by `typing_json.typechecking.mark_as_validated`, so that re-encoding them later (e.g. after modifying other parts of the object) does not re-validate them.
+        Marks are only set if all elements were validated, i.e. if the validation policy is `typing_json.validation.FULL_VALIDATION`.
+
+        The optional parameter `intern` can be used to deduplicate the decoded object: if `True`, a fresh `typing_json.caching.InternTable` is used
+        for this call, while a table can also be passed explicitly, to share canonical instances across calls (default: `False`, no deduplication).
+        Short strings and dictionary keys are interned, and equal namedtuples, tuples and frozensets of the same type are replaced by a single instance
+        (cf.&nbsp;`typing_json.caching.InternTable`); keys of dictionaries reused in place (cf.&nbsp;`in_place`) are left unchanged.
+
+        If the optional parameter `columnar` is `True` (default: `False`), lists, deques and variadic tuples of records (namedtuples and total typed dicts)
+        can also be decoded from the columnar layout produced by `typing_json.encoding.to_json_obj` with `columnar=True`: a dictionary with the record fields
+        as keys and lists of field values of the same length as values (columns for namedtuple fields with default values can be omitted).
+        Columns are decoded in bulk, and the records are then rebuilt. Lists of records are still accepted in row layout.
+
+        The optional parameter `enum_encoding` can be used to decode enum values (and enum dictionary keys) by `"value"` or by `"ordinal"`, rather than by `"name"`
+        (the default), for all enum types which do not set their own encoding (cf.&nbsp;`typing_json.enums`).
+
         (Version 0.1.3)
     """
-    # pylint: disable = too-many-branches, too-many-statements, too-many-return-statements
+    _check_json_encodable(t)
+    opts = _decoding_options(cast_decimal, limits, in_place, adaptive_unions, validation, intern, columnar, enum_encoding)
+    decoded_obj = _from_json_obj(obj, t, opts)
+    if mark_validated and opts.validation.mode == "full":
+        mark_as_validated(decoded_obj, t)
+    return decoded_obj
+
+
+def from_json_obj_decoder(cast_decimal: bool = True, limits: Optional[DecodeLimits] = None, in_place: bool = False, adaptive_unions: Optional[bool] = None, validation: Optional[ValidationPolicy] = None, mark_validated: bool = False, intern: Union[bool, InternTable] = False, columnar: bool = False, enum_encoding: Optional[str] = None) -> Callable[[Any, Type], Any]:
+    # pylint: disable = too-many-arguments
+    """
+        Returns a function `decode(obj, t)` which decodes the JSON object `obj` into an instance of `t` as `typing_json.decoding.from_json_obj` does
+        with the given options, for decoding several parts of a single payload (cf.&nbsp;`typing_json.projection`).
+        All calls share the same running state: the resource limits apply to all calls together (the clock for `max_time` starts when the function is created),
+        and `intern=True` uses a single `typing_json.caching.InternTable` for all calls.
+
+        Raises `ValueError` if `enum_encoding` is not valid, while the returned function raises the same errors as `typing_json.decoding.from_json_obj`.
+    """
+    opts = _decoding_options(cast_decimal, limits, in_place, adaptive_unions, validation, intern, columnar, enum_encoding)
+    def decode(obj: Any, t: Type) -> Any:
+        _check_json_encodable(t)
+        decoded_obj = _from_json_obj(obj, t, opts)
+        if mark_validated and opts.validation.mode == "full":
+            mark_as_validated(decoded_obj, t)
+        return decoded_obj
+    return decode
+
+
+def _check_json_encodable(t: Type) -> None:
+    """ Raises `TypeError` if `t` is not JSON encodable, with the trace of the failure. """
     trace: List[str] = []
     def failure_callback(message: str) -> None:
         trace.append(message)
     if not is_json_encodable(t, failure_callback=failure_callback):
         # Argument `t` must be JSON encodable.
         raise TypeError("Type %s is not json-encodable. Trace:\n%s"%(str(t), "\n".join(trace)))
+
+
+def _decoding_options(cast_decimal: bool, limits: Optional[DecodeLimits], in_place: bool, adaptive_unions: Optional[bool], validation: Optional[ValidationPolicy], intern: Union[bool, InternTable], columnar: bool, enum_encoding: Optional[str]) -> "_DecodingOptions":
+    """ Validates the options of `from_json_obj` and sets up the running state of a decoding (resource budget, intern table). """
+    # pylint: disable = too-many-arguments
+    if enum_encoding is not None and enum_encoding not in ENUM_ENCODINGS:
+        raise ValueError("Enum encoding must be one of %s, found %s instead."%(str(ENUM_ENCODINGS), repr(enum_encoding)))
+    budget = None if limits is None else DecodeBudget(limits)
+    if adaptive_unions is None:
+        adaptive_unions = adaptive_unions_enabled()
+    if validation is None:
+        validation = get_validation_policy()
+    if isinstance(intern, InternTable):
+        intern_table: Optional[InternTable] = intern
+    else:
+        intern_table = InternTable() if intern else None
+    return _DecodingOptions(cast_decimal, budget, in_place, adaptive_unions, validation, intern_table, columnar, enum_encoding)
+
+
+class _DecodingOptions:
+    """ Options and running state shared by all recursive calls of a single `from_json_obj` invocation. """
+    # pylint: disable = too-few-public-methods
+
+    __slots__ = ("cast_decimal", "budget", "in_place", "plain_dicts", "adaptive_unions", "validation", "intern_table", "columnar", "enum_encoding")
+
+    def __init__(self, cast_decimal: bool, budget: Optional[DecodeBudget], in_place: bool, adaptive_unions: bool, validation: ValidationPolicy, intern_table: Optional[InternTable], columnar: bool, enum_encoding: Optional[str]):
+        # pylint: disable = too-many-arguments
+        self.cast_decimal = cast_decimal
+        self.budget = budget
+        self.in_place = in_place
+        # whether the object was parsed into plain dictionaries (without ordered dictionary hook), which holds throughout the decoding
+        # (unlike `in_place`, which is cleared while trying the generic type arguments of a `typing.Union`)
+        self.plain_dicts = in_place
+        self.adaptive_unions = adaptive_unions
+        self.validation = validation
+        self.intern_table = intern_table
+        self.columnar = columnar
+        self.enum_encoding = enum_encoding
+
+
+def _from_json_obj(obj: Any, t: Type, opts: _DecodingOptions) -> Any:
+    """
+        Recursive step of `from_json_obj`, accounting for resource limits (if any) before decoding.
+        The generic type arguments of a `typing.Union` are tried on the same JSON value, at the same depth, so that unions are not accounted for themselves.
+    """
+    budget = opts.budget
+    if budget is None or getattr(t, "__origin__", None) is Union:
+        if opts.intern_table is None:
+            return _from_json_obj_value(obj, t, opts)
+        return opts.intern_table.intern(_from_json_obj_value(obj, t, opts), t)
+    budget.enter(obj)
+    try:
+        decoded_obj = _from_json_obj_value(obj, t, opts)
+    finally:
+        budget.depth -= 1
+    if opts.intern_table is None:
+        return decoded_obj
+    return opts.intern_table.intern(decoded_obj, t)
+
+
+def _from_json_obj_value(obj: Any, t: Type, opts: _DecodingOptions) -> Any:
+    """ Decodes `obj` into an instance of `t`, assuming that `t` is JSON encodable. """
+    # pylint: disable = too-many-branches, too-many-statements, too-many-return-statements
+    cast_decimal = opts.cast_decimal
+    trace: List[str] = []
+    def failure_callback(message: str) -> None:
+        trace.append(message)
     if t in JSON_BASE_TYPES:
         # JSON basic types are returned unaltered, with the exception of casting `Decimal` to `int`/`float` if `cast_decimal` is `True`.
+        if obj.__class__ is t:
+            # fast path for values which are already of the exact type required (e.g. floats parsed by `typed_parse_float`)
+            return obj
         if t == int and cast_decimal and isinstance(obj, Decimal) and obj == obj.to_integral_value():
             return int(obj)
         if t == float and cast_decimal and isinstance(obj, Decimal):
@@ -149,6 +446,10 @@ def from_json_obj(obj: Any, t: Type, cast_decimal: bool = True) -> Any:
             ...
         raise TypeError("Object %s is not decimal.Decimal (t=%s)."%(short_str(obj), str(t)))
     if isinstance(t, EnumMeta):
+        encoding = enum_encoding(t, opts.enum_encoding)
+        if encoding != "name":
+            # For enumerations encoded by value or ordinal, use the precomputed reverse lookup table.
+            return enum_from_wire(obj, t, encoding)
         # For enumerations, use the `t.__members__` dictionary to convert the string name into an enumeration value.
         if not isinstance(obj, str):
             raise TypeError("Object %s is not a string (t=%s)."%(short_str(obj), str(t)))
@@ -159,34 +460,59 @@ def from_json_obj(obj: Any, t: Type, cast_decimal: bool = True) -> Any:
         fields = getattr(t, "_fields")
         field_types = getattr(t, "_field_types")
         field_defaults = getattr(t, "_field_defaults")
-        return _from_json_obj_namedtuple(obj, t, fields, field_types, field_defaults, cast_decimal=cast_decimal)
+        return _from_json_obj_namedtuple(obj, t, fields, field_types, field_defaults, opts)
     if is_typed_dict(t):
         # Typed dicts are encoded as ordered dictionaries, with their fields as keys and the JSON-encoded field values as corresponding values.
         field_types = getattr(t, "__annotations__")
         total = getattr(t, "__total__")
         if not isinstance(obj, (dict, OrderedDict)):
             raise TypeError("Object %s is not dict or OrderedDict (t=%s)."%(short_str(obj), str(t)))
+        aliases = alias_table(t)
+        wire_obj = obj
+        if aliases is not None:
+            # fields of aliased types are decoded from their wire keys
+            obj = fields_from_wire(obj, t, aliases)
         converted_dict = dict() # type:ignore
         for field, field_type in field_types.items():
             if total and field not in obj:
                 raise TypeError("Key %s missing from object %s (typed dict is total, t=%s)"%(field, short_str(obj), str(t)))
             if field in obj:
-                converted_dict[field] = from_json_obj(obj[field], field_type, cast_decimal=cast_decimal)
+                converted_dict[field] = _from_json_obj(obj[field], field_type, opts)
         for field in obj:
             if field not in field_types:
                 raise TypeError("Extra field %s found when decoding object. (t=%s)."%(field, str(t)))
+        if opts.in_place and obj.__class__ is dict and obj is wire_obj:
+            # reuse the parsed dictionary, only replacing the values which changed in decoding
+            return _update_in_place(obj, converted_dict)
         return converted_dict
     if hasattr(t, "__origin__") and hasattr(t, "__args__"):
         # `typing` generics
         if t.__origin__ is Union:
             # For `typing.Union` (and `typing.Optional`), attempt to decode the value using the generic type arguments in sequence
-            for s in t.__args__:
-                try:
-                    return_val = from_json_obj(obj, s, cast_decimal=cast_decimal)
-                    # assert is_instance(return_val, t, cast_decimal=cast_decimal)
-                    return return_val
-                except TypeError:
-                    continue
+            # (containers are not reused in place, as a failed attempt could leave them partially decoded)
+            in_place = opts.in_place
+            opts.in_place = False
+            try:
+                if opts.adaptive_unions:
+                    # in adaptive mode, types are tried in an order which gives the same result but favours the most frequent hits
+                    profile = union_profile(t, encoding=False)
+                    for i in profile.order:
+                        try:
+                            return_val = _from_json_obj(obj, t.__args__[i], opts)
+                        except TypeError:
+                            continue
+                        profile.record(i)
+                        return return_val
+                else:
+                    for s in t.__args__:
+                        try:
+                            return_val = _from_json_obj(obj, s, opts)
+                            # assert is_instance(return_val, t, cast_decimal=cast_decimal)
+                            return return_val
+                        except TypeError:
+                            continue
+            finally:
+                opts.in_place = in_place
             raise TypeError("Object %s is not convertible to any of the types in %s."%(short_str(obj), str(t)))
         if t.__origin__ is Literal:
             # for `typing_extensions.Literal`, check that the object is an instance of `t` and then return it unaltered
@@ -194,32 +520,44 @@ def from_json_obj(obj: Any, t: Type, cast_decimal: bool = True) -> Any:
             if not is_instance(obj, t, failure_callback=failure_callback, cast_decimal=cast_decimal):
                 raise TypeError("Object %s is not allowed (t=%s). Trace:\n%s"%(short_str(obj), str(t), "\n".join(trace)))
             return obj
+        if opts.columnar and isinstance(obj, (dict, OrderedDict)) and (t.__origin__ in (list, deque) or t.__origin__ is tuple and t.__args__[-1] is ...) and is_columnar_record(t.__args__[0]):
+            # in columnar layout, lists, deques and variadic tuples of records are decoded from a dictionary of columns
+            records = _from_json_obj_columns(obj, t.__args__[0], opts)
+            if t.__origin__ is list:
+                return records
+            return deque(records) if t.__origin__ is deque else tuple(records)
         if t.__origin__ is list:
             # for `typing.List`, expect a list and return a list with recursively JSON-decoded elements
             if not isinstance(obj, list):
                 raise TypeError("Object %s is not list (t=%s)."%(short_str(obj), str(t)))
-            return_val = list(_from_json_obj_iterator(obj, t.__args__[0], cast_decimal=cast_decimal))
+            if opts.in_place:
+                # reuse the parsed list, only replacing the elements which changed in decoding
+                changes = [(i, y) for i, (x, y) in enumerate(zip(obj, _from_json_obj_iterator(obj, t.__args__[0], opts))) if y is not x]
+                for i, y in changes:
+                    obj[i] = y
+                return obj
+            return_val = list(_from_json_obj_iterator(obj, t.__args__[0], opts))
             # assert is_instance(return_val, t, cast_decimal=cast_decimal)
             return return_val
         if t.__origin__ is deque:
             # for `typing.Deque`, expect a list and return a deque with recursively JSON-decoded elements
             if not isinstance(obj, list):
                 raise TypeError("Object %s is not list (t=%s)."%(short_str(obj), str(t)))
-            return_val = deque(_from_json_obj_iterator(obj, t.__args__[0], cast_decimal=cast_decimal))
+            return_val = deque(_from_json_obj_iterator(obj, t.__args__[0], opts))
             # assert is_instance(return_val, t, cast_decimal=cast_decimal)
             return return_val
         if t.__origin__ is set:
             # for `typing.Set`, expect a list and return a set with recursively JSON-decoded elements
             if not isinstance(obj, list):
                 raise TypeError("Object %s is not list (t=%s)."%(short_str(obj), str(t)))
-            return_val = set(_from_json_obj_iterator(obj, t.__args__[0], cast_decimal=cast_decimal))
+            return_val = set(_from_json_obj_iterator(obj, t.__args__[0], opts))
             # assert is_instance(return_val, t, cast_decimal=cast_decimal)
             return return_val
         if t.__origin__ is frozenset:
             # for `typing.FrozenSet`, expect a list and return a frozenset with recursively JSON-decoded elements
             if not isinstance(obj, list):
                 raise TypeError("Object %s is not list (t=%s)."%(short_str(obj), str(t)))
-            return_val = frozenset(_from_json_obj_iterator(obj, t.__args__[0], cast_decimal=cast_decimal))
+            return_val = frozenset(_from_json_obj_iterator(obj, t.__args__[0], opts))
             # assert is_instance(return_val, t, cast_decimal=cast_decimal)
             return return_val
         if t.__origin__ is tuple:
@@ -227,47 +565,72 @@ def from_json_obj(obj: Any, t: Type, cast_decimal: bool = True) -> Any:
             if not isinstance(obj, list):
                 raise TypeError("Object %s is not list (t=%s)."%(short_str(obj), str(t)))
             if len(t.__args__) == 2 and t.__args__[1] is ...: # pylint:disable=no-else-return
-                return_val = tuple(_from_json_obj_iterator(obj, t.__args__[0], cast_decimal=cast_decimal))
+                return_val = tuple(_from_json_obj_iterator(obj, t.__args__[0], opts))
                 # assert is_instance(return_val, t, cast_decimal=cast_decimal)
                 return return_val
             else:
                 if len(obj) != len(t.__args__):
                     raise TypeError("List %s is of incorrect length (t=%s)."%(short_str(obj), str(t)))
-                return_val = tuple(from_json_obj(x, t.__args__[i], cast_decimal=cast_decimal) for i, x in enumerate(obj))
+                return_val = tuple(_from_json_obj(x, t.__args__[i], opts) for i, x in enumerate(obj))
                 # assert is_instance(return_val, t, cast_decimal=cast_decimal)
                 return return_val
         if t.__origin__ in (dict, Mapping):
             # for `typing.Dict` and `typing.Mapping`, expect a dict and return a dict with recursively JSON-decoded values and keys (parsing keys from strings in all those cases where they would have been stringified)
             if not isinstance(obj, (dict, OrderedDict)):
                 raise TypeError("Object %s is not dict or OrderedDict (t=%s)."%(short_str(obj), str(t)))
+            if opts.in_place and obj.__class__ is dict and t.__args__[0] is str:
+                # reuse the parsed dictionary, only replacing the values which changed in decoding
+                changed_values: List[Tuple[str, Any]] = []
+                validated = _validated_indices(len(obj), t.__args__[1], opts)
+                for i, (field, val) in enumerate(obj.items()):
+                    if not isinstance(field, str):
+                        raise TypeError("Object key %s is not of json basic type %s (t=%s)."%(field, str(t.__args__[0]), str(t)))
+                    converted_val = _from_json_obj(val, t.__args__[1], opts) if validated is None or i in validated else _from_json_obj_trusted(val, t.__args__[1])
+                    if converted_val is not val:
+                        changed_values.append((field, converted_val))
+                for field, converted_val in changed_values:
+                    obj[field] = converted_val
+                return obj
             converted_dict = dict() # type:ignore
-            for field in obj:
+            validated = _validated_indices(len(obj), t.__args__[1], opts)
+            for i, field in enumerate(obj):
                 if t.__args__[0] in JSON_BASE_TYPES:
                     if not is_instance(field, t.__args__[0], cast_decimal=cast_decimal):
                         raise TypeError("Object key %s is not of json basic type %s (t=%s)."%(field, str(t.__args__[0]), str(t)))
-                    converted_field = field
+                    converted_field = field if opts.intern_table is None else opts.intern_table.intern(field, t.__args__[0])
+                elif isinstance(t.__args__[0], EnumMeta) and enum_encoding(t.__args__[0], opts.enum_encoding) != "name":
+                    converted_field = enum_from_wire_key(field, t.__args__[0], enum_encoding(t.__args__[0], opts.enum_encoding))
                 elif isinstance(t.__args__[0], EnumMeta) or hasattr(t.__args__[0], "__origin__") and t.__args__[0].__origin__ is Literal:
-                    converted_field = from_json_obj(field, t.__args__[0], cast_decimal=cast_decimal)
+                    converted_field = _from_json_obj(field, t.__args__[0], opts)
                 else:
-                    converted_field = from_json_obj(json.loads(field), t.__args__[0], cast_decimal=cast_decimal)
-                converted_dict[converted_field] = from_json_obj(obj[field], t.__args__[1], cast_decimal=cast_decimal)
+                    converted_field = _from_json_obj(json.loads(field), t.__args__[0], opts)
+                if validated is None or i in validated:
+                    converted_dict[converted_field] = _from_json_obj(obj[field], t.__args__[1], opts)
+                else:
+                    converted_dict[converted_field] = _from_json_obj_trusted(obj[field], t.__args__[1])
             # assert is_instance(converted_dict, t, cast_decimal=cast_decimal)
             return converted_dict
         if t.__origin__ is OrderedDict:
             # for `typing.OrderedDict`, expect a `collections.OrderedDict` and return an ordered dict with recursively JSON-decoded values and keys (parsing keys from strings in all those cases where they would have been stringified)
-            if not isinstance(obj, OrderedDict):
+            if not isinstance(obj, OrderedDict) and not (opts.plain_dicts and obj.__class__ is dict):
                 raise TypeError("Object %s is not OrderedDict (t=%s)."%(short_str(obj), str(t)))
             converted_dict = OrderedDict() # type:ignore
-            for field in obj:
+            validated = _validated_indices(len(obj), t.__args__[1], opts)
+            for i, field in enumerate(obj):
                 if t.__args__[0] in JSON_BASE_TYPES:
                     if not isinstance(field, t.__args__[0]):
                         raise TypeError("Object key %s not of json basic type %s (t=%s)."%(field, str(t.__args__[0]), str(t)))
-                    converted_field = field
+                    converted_field = field if opts.intern_table is None else opts.intern_table.intern(field, t.__args__[0])
+                elif isinstance(t.__args__[0], EnumMeta) and enum_encoding(t.__args__[0], opts.enum_encoding) != "name":
+                    converted_field = enum_from_wire_key(field, t.__args__[0], enum_encoding(t.__args__[0], opts.enum_encoding))
                 elif isinstance(t.__args__[0], EnumMeta) or hasattr(t.__args__[0], "__origin__") and t.__args__[0].__origin__ is Literal:
-                    converted_field = from_json_obj(field, t.__args__[0], cast_decimal=cast_decimal)
+                    converted_field = _from_json_obj(field, t.__args__[0], opts)
+                else:
+                    converted_field = _from_json_obj(json.loads(field), t.__args__[0], opts)
+                if validated is None or i in validated:
+                    converted_dict[converted_field] = _from_json_obj(obj[field], t.__args__[1], opts)
                 else:
-                    converted_field = from_json_obj(json.loads(field), t.__args__[0], cast_decimal=cast_decimal)
-                converted_dict[converted_field] = from_json_obj(obj[field], t.__args__[1], cast_decimal=cast_decimal)
+                    converted_dict[converted_field] = _from_json_obj_trusted(obj[field], t.__args__[1])
             # assert is_instance(converted_dict, t, cast_decimal=cast_decimal)
             return converted_dict
     raise AssertionError(_UNREACHABLE_ERROR_MSG) # pragma: no cover
@@ -15,14 +15,20 @@ from collections import deque, OrderedDict
 from collections.abc import Mapping
 from decimal import Decimal
 from enum import EnumMeta
+from functools import lru_cache
 import json
-from typing import Any, Callable, List, Optional, Union, Type
+from typing import Any, Callable, FrozenSet, Hashable, List, Optional, Tuple, Union, Type, cast
 
 # external dependencies
 from typing_extensions import Literal
 
 # internal imports
-from typing_json.typechecking import is_instance, is_keyable, is_namedtuple, is_typecheckable, is_typed_dict, JSON_BASE_TYPES, short_str
+from typing_json.aliases import alias_table, aliases_version
+from typing_json.caching import EncodeCache
+from typing_json.enums import ENUM_ENCODINGS, enum_encoding, enum_encodings_version, enum_table, enum_to_wire_key
+from typing_json.typechecking import is_deeply_immutable, is_instance, is_keyable, is_namedtuple, is_typecheckable, is_typed_dict, JSON_BASE_TYPES, short_str
+from typing_json.unions import adaptive_unions_enabled, union_profile
+from typing_json.validation import FULL_VALIDATION, ValidationPolicy
 
 
 _UNREACHABLE_ERROR_MSG = "Should never reach this point, please open an issue on GitHub."
@@ -125,33 +131,150 @@ def is_json_encodable(t: Type, failure_callback: Optional[Callable[[str], None]]
     return False
 
 
-def _to_json_obj_namedtuple(obj, field_types, use_decimal=True, namedtuples_as_lists=False):
+def is_columnar_record(t: Type) -> bool:
+    """
+        Whether lists of instances of `t` can be encoded in columnar layout (cf.&nbsp;the `columnar` parameter of `typing_json.encoding.to_json_obj`),
+        i.e. whether `t` is a namedtuple or a total typed dict.
+    """
+    return is_namedtuple(t) or (is_typed_dict(t) and getattr(t, "__total__"))
+
+
+def _record_field_types(t: Type) -> "OrderedDict[str, Type]":
+    """ The field types of the namedtuple or typed dict `t`, in declaration order. """
+    return OrderedDict(getattr(t, "_field_types") if is_namedtuple(t) else getattr(t, "__annotations__"))
+
+
+class _EncodingOptions:
+    """ Options shared by all recursive calls of a single `to_json_obj` invocation. """
+    # pylint: disable = too-few-public-methods
+
+    __slots__ = ("use_decimal", "namedtuples_as_lists", "adaptive_unions", "encode_cache", "columnar", "omit_defaults", "enum_encoding")
+
+    def __init__(self, use_decimal: bool, namedtuples_as_lists: bool, adaptive_unions: bool, encode_cache: Optional[EncodeCache], columnar: bool, omit_defaults: bool, enum_encoding: Optional[str]):
+        # pylint: disable = too-many-arguments
+        self.use_decimal = use_decimal
+        self.namedtuples_as_lists = namedtuples_as_lists
+        self.adaptive_unions = adaptive_unions
+        self.encode_cache = encode_cache
+        self.columnar = columnar
+        self.omit_defaults = omit_defaults
+        self.enum_encoding = enum_encoding
+
+
+_NO_DEFAULT = object()
+""" Marker for namedtuple fields without default value. """
+
+
+@lru_cache(maxsize=None)
+def _namedtuple_defaults(t: Type) -> Tuple[Tuple[str, Type, Any], ...]:
+    """ Table of `(field, field_type, default)` triples for the namedtuple type `t`, in field order, with `_NO_DEFAULT` for fields without default value. """
+    field_defaults = getattr(t, "_field_defaults")
+    return tuple((field, field_type, field_defaults.get(field, _NO_DEFAULT)) for field, field_type in getattr(t, "_field_types").items())
+
+
+@lru_cache(maxsize=None)
+def _omissible_fields(t: Type) -> FrozenSet[str]:
+    """ Fields of the typed dict `t` which can be omitted when their value is `None`: the fields of optional type, if `t` is not total. """
+    if getattr(t, "__total__"):
+        return frozenset()
+    return frozenset(field for field, field_type in getattr(t, "__annotations__").items() if is_instance(None, field_type, validation=FULL_VALIDATION))
+
+
+def _is_default(value: Any, default: Any) -> bool:
+    """ Whether `value` is equal to the field `default` value, and of the same class (so that decoding the default gives back an equal value of the same class). """
+    return default is not _NO_DEFAULT and value.__class__ is default.__class__ and value == default
+
+
+def _to_json_obj_memoised(obj, t, opts, encode):
+    """ Encodes `obj` by calling `encode()`, memoising the result in the encode cache if `t` is deeply immutable. """
+    if not is_deeply_immutable(t):
+        return encode()
+    key = (id(obj), t, opts.use_decimal, opts.namedtuples_as_lists, opts.columnar, opts.omit_defaults, opts.enum_encoding, aliases_version(), enum_encodings_version())
+    fragment = opts.encode_cache.get(key, obj)
+    if fragment is None:
+        fragment = encode()
+        opts.encode_cache.put(key, obj, fragment)
+    return fragment
+
+
+def _to_json_obj_namedtuple(obj, field_types, opts):
     # pylint:disable=invalid-name
-    if namedtuples_as_lists:
-        return [to_json_obj(getattr(obj, field), field_type, use_decimal=use_decimal, typecheck=False, namedtuples_as_lists=namedtuples_as_lists) for field, field_type in field_types.items()]
+    if opts.omit_defaults:
+        return _to_json_obj_namedtuple_sparse(obj, opts)
+    if opts.namedtuples_as_lists:
+        return [_to_json_obj(getattr(obj, field), field_type, opts) for field, field_type in field_types.items()]
     json_dict = OrderedDict() # type:ignore
+    table = alias_table(obj.__class__)
+    if table is not None:
+        # fields of aliased types are encoded with their wire keys
+        for field, field_type in field_types.items():
+            json_dict[table.to_wire[field]] = _to_json_obj(getattr(obj, field), field_type, opts)
+        return json_dict
     for field, field_type in field_types.items():
-        json_dict[field] = to_json_obj(getattr(obj, field), field_type, use_decimal=use_decimal, typecheck=False, namedtuples_as_lists=namedtuples_as_lists)
+        json_dict[field] = _to_json_obj(getattr(obj, field), field_type, opts)
     return json_dict
 
 
-def _to_json_obj_homogeneous_collection(obj, element_t, use_decimal=True, namedtuples_as_lists=False):
+def _to_json_obj_namedtuple_sparse(obj, opts):
+    """ Encodes a namedtuple omitting the fields equal to their default value (only trailing ones, if `namedtuples_as_lists` is `True`). """
+    table = _namedtuple_defaults(obj.__class__)
+    if opts.namedtuples_as_lists:
+        n = len(table)
+        while n > 0 and _is_default(obj[n-1], table[n-1][2]):
+            n -= 1
+        return [_to_json_obj(obj[i], table[i][1], opts) for i in range(n)]
+    json_dict = OrderedDict() # type:ignore
+    aliases = alias_table(obj.__class__)
+    for (field, field_type, default), value in zip(table, obj):
+        if not _is_default(value, default):
+            json_dict[field if aliases is None else aliases.to_wire[field]] = _to_json_obj(value, field_type, opts)
+    return json_dict
+
+
+def _to_json_obj_columns(obj, element_t, opts):
+    """ Encodes a sequence of records (namedtuples or total typed dicts) of type `element_t` in columnar layout, as an ordered dictionary of columns. """
+    field_types = _record_field_types(element_t)
+    if is_namedtuple(element_t):
+        columns = list(zip(*obj)) if obj else [() for _ in field_types]
+    else:
+        columns = [[el[field] for el in obj] for field in field_types]
+    json_dict = OrderedDict() # type:ignore
+    aliases = alias_table(element_t)
+    for (field, field_type), column in zip(field_types.items(), columns):
+        json_dict[field if aliases is None else aliases.to_wire[field]] = _to_json_obj_homogeneous_collection(column, field_type, opts)
+    return json_dict
+
+
+def _to_json_obj_homogeneous_collection(obj, element_t, opts):
     # pylint:disable=invalid-name,too-many-return-statements
     if element_t in JSON_BASE_TYPES or element_t in (None, type(None)):
         return list(obj)
     if element_t is Decimal:
-        if use_decimal:
+        if opts.use_decimal:
             return list(obj)
         return [str(el) for el in obj]
     if isinstance(element_t, EnumMeta):
-        return [el._name_ for el in obj] # pylint:disable=protected-access
-    if is_namedtuple(element_t):
+        encoding = enum_encoding(element_t, opts.enum_encoding)
+        if encoding == "name":
+            return [el._name_ for el in obj] # pylint:disable=protected-access
+        to_wire = enum_table(element_t, encoding).to_wire
+        return [to_wire[el] for el in obj]
+    if is_namedtuple(element_t) and opts.encode_cache is None:
         field_types = getattr(element_t, "_field_types")
-        return [_to_json_obj_namedtuple(el, field_types, use_decimal=use_decimal, namedtuples_as_lists=namedtuples_as_lists) for el in obj]
-    return [to_json_obj(x, element_t, use_decimal=use_decimal, typecheck=False, namedtuples_as_lists=namedtuples_as_lists) for x in obj]
+        return [_to_json_obj_namedtuple(el, field_types, opts) for el in obj]
+    return [_to_json_obj(x, element_t, opts) for x in obj]
+
 
+def _to_json_obj_tuple(obj, t, opts):
+    # pylint:disable=invalid-name
+    if len(t.__args__) == 2 and t.__args__[1] is ...:
+        if opts.columnar and is_columnar_record(t.__args__[0]):
+            return _to_json_obj_columns(obj, t.__args__[0], opts)
+        return _to_json_obj_homogeneous_collection(obj, t.__args__[0], opts)
+    return [_to_json_obj(x, t.__args__[i], opts) for i, x in enumerate(obj)]
 
-def to_json_obj(obj: Any, t: Type, use_decimal: bool = False, typecheck: bool = True, namedtuples_as_lists=False) -> Any:
+
+def to_json_obj(obj: Any, t: Type, use_decimal: bool = False, typecheck: bool = True, namedtuples_as_lists=False, adaptive_unions: Optional[bool] = None, validation: Optional[ValidationPolicy] = None, encode_cache: Optional[EncodeCache] = None, columnar: bool = False, omit_defaults: bool = False, enum_encoding: Optional[str] = None) -> Any:
     """
         Encodes an instance `obj` of typecheckable type `t` into a JSON object.
         The optional `use_decimal` parameter can be used to specify that instances of
@@ -165,10 +288,11 @@ def to_json_obj(obj: Any, t: Type, use_decimal: bool = False, typecheck: bool =
         - if `t` is `decimal.Decimal` and `use_decimal` is `False` (default), `str(obj)` is returned;
         - if `t` is `decimal.Decimal` and `use_decimal` is `True`, `obj` is returned unchanged;
         - if `t` is `None` (used as an alias for `NoneType`), `None` is returned;
-        - if `t` is an enum (i.e. `isinstance(t, EnumMeta)`), the enum value name `obj._name_` is returned;
+        - if `t` is an enum (i.e. `isinstance(t, EnumMeta)`), the enum value name `obj._name_` is returned (unless a different encoding is used, cf.&nbsp;below);
         - if `t` is a namedtuple according to `typing_json.typechecking.is_namedtuple` and all its fields are JSON encodable and `namedtuples_as_lists` is `False`, this method is called recursively on all field values and then an ordered dictionary is returned with the field names as names and the JSON-encoded field values as corresponding values;
         - if `t` is a namedtuple according to `typing_json.typechecking.is_namedtuple` and all its fields are JSON encodable and `namedtuples_as_lists` is `True`, this method is called recursively on all field values and then a list is returned with the JSON-encoded field values appearing in the same order as the namedtuple fields (which are not explicitly encoded);
         - if `t` is a typed dict according to `typing_json.typechecking.is_typed_dict` and all its values are JSON encodable, then a dictionary is returned with the same keys as `obj` and JSON-encoded values using the types specified by `t`.
+        - for namedtuples and typed dicts with field aliases (cf.&nbsp;`typing_json.aliases`), the wire keys of the fields are used in place of the field names;
         - if `t` is `typing.Union`, the generic type arguments in the union are tried one after the other until a `u` is found such that `is_instance(obj, u)`, then `obj` is JSON-encoded using `u` as its type.
         - if `t` is a `typing_extensions.Literal`, `obj` is returned unchanged;
         - if `t` is one of `typing.List`, `typing.Set`, `typing.FrozenSet`, `typing.Deque` or `typing.Tuple`, a list is returned containing the elements of the original collection, recursively JSON-encoded;
@@ -186,9 +310,35 @@ def to_json_obj(obj: Any, t: Type, use_decimal: bool = False, typecheck: bool =
         An optional parameter `typecheck` (default: `True`) can be used to skip the check that `t` be JSON encodable and that `obj` be an instance of `t`.
         The parameter `typecheck` is set to `False` in all recursive calls (i.e. typechecking is only done once).
 
+        An optional parameter `adaptive_unions` can be used to enable (if `True`) or disable (if `False`) adaptive ordering of the generic type arguments tried
+        when encoding values of `typing.Union` types (cf.&nbsp;`typing_json.unions`): if `None` (default), the process-wide setting is used.
+        Adaptive ordering never changes the result of the encoding.
+
+        An optional parameter `validation` can be used to pass the `typing_json.validation.ValidationPolicy` used by `typing_json.typechecking.is_instance`
+        when `typecheck` is `True`: if `None` (default), the process-wide policy is used (cf.&nbsp;`typing_json.validation.set_validation_policy`).
+
+        An optional parameter `encode_cache` can be used to pass a `typing_json.caching.EncodeCache`, memoising the encoding of deeply immutable values
+        (cf.&nbsp;`typing_json.typechecking.is_deeply_immutable`) by identity: the JSON object returned can then share fragments with other JSON objects
+        encoded using the same cache, so it must not be modified.
+
+        If the optional parameter `columnar` is `True` (default: `False`), lists, deques and variadic tuples of records (namedtuples and total typed dicts,
+        cf.&nbsp;`typing_json.encoding.is_columnar_record`) are encoded in columnar layout: as an ordered dictionary with the record fields as keys and lists
+        of the JSON-encoded field values (one per record, in order) as corresponding values. Field names are then encoded once per list, rather than once per record.
+        Sets and frozensets of records are always encoded as lists of records.
+
+        If the optional parameter `omit_defaults` is `True` (default: `False`), namedtuple fields whose value is equal to the field default value
+        (and of the same class) are omitted from the encoding (only trailing such fields, if `namedtuples_as_lists` is `True`), as are `None` values of
+        optional fields in non-total typed dicts: `typing_json.decoding.from_json_obj` restores the namedtuple defaults, while the keys of omitted `None`
+        values are absent from the decoded typed dicts. Columns in columnar layout are never omitted.
+
+        The optional parameter `enum_encoding` can be used to encode enum values by `"value"` or by `"ordinal"`, rather than by `"name"` (the default),
+        for all enum types which do not set their own encoding (cf.&nbsp;`typing_json.enums`). The same encoding is used for enum dictionary keys.
+
         (Version 0.1.3)
     """
-    # pylint:disable=invalid-name,too-many-return-statements,too-many-branches
+    # pylint:disable=too-many-arguments
+    if enum_encoding is not None and enum_encoding not in ENUM_ENCODINGS:
+        raise ValueError("Enum encoding must be one of %s, found %s instead."%(str(ENUM_ENCODINGS), repr(enum_encoding)))
     if typecheck:
         trace: List[str] = []
         def failure_callback(message: str) -> None:
@@ -197,15 +347,23 @@ def to_json_obj(obj: Any, t: Type, use_decimal: bool = False, typecheck: bool =
             # Argument `t` must be JSON encodable.
             raise TypeError("Type %s is not json-encodable. Trace:\n%s"%(str(t), "\n".join(trace)))
         trace = []
-        if not is_instance(obj, t, failure_callback=failure_callback):
+        if not is_instance(obj, t, failure_callback=failure_callback, validation=validation):
             # Argument `obj` must be an instance of argument `t`.
             raise TypeError("Object %s is not of type %s. Trace:\n%s"%(short_str(obj), str(t), "\n".join(trace)))
+    if adaptive_unions is None:
+        adaptive_unions = adaptive_unions_enabled()
+    return _to_json_obj(obj, t, _EncodingOptions(use_decimal, namedtuples_as_lists, adaptive_unions, encode_cache, columnar, omit_defaults, enum_encoding))
+
+
+def _to_json_obj(obj: Any, t: Type, opts: _EncodingOptions) -> Any:
+    """ Encodes an instance `obj` of type `t` into a JSON object, assuming that `t` is JSON encodable and that `obj` is an instance of `t`. """
+    # pylint:disable=invalid-name,too-many-return-statements,too-many-branches
     if t in JSON_BASE_TYPES:
         # JSON basic types are returned unchanged.
         return obj
     if t is Decimal:
         # If `use_decimal` is `True`, `obj` is returned unchanged:
-        if use_decimal:
+        if opts.use_decimal:
             return obj
         # If `use_decimal` is `False` (default), instances of `decimal.Decimal` are encoded as strings.
         return str(obj)
@@ -213,44 +371,64 @@ def to_json_obj(obj: Any, t: Type, use_decimal: bool = False, typecheck: bool =
         # `None` can be used as an alias for `NoneType`.
         return None
     if isinstance(t, EnumMeta):
-        # Enum values are encoded by their name.
-        return obj._name_ # pylint:disable=protected-access
+        # Enum values are encoded by their name, unless a different encoding is set for the type or the call.
+        encoding = enum_encoding(t, opts.enum_encoding)
+        if encoding == "name":
+            return obj._name_ # pylint:disable=protected-access
+        return enum_table(cast(Hashable, t), encoding).to_wire[obj]
     if is_namedtuple(t):
         # Namedtuples are encoded as ordered dictionaries, with their fields as keys and the JSON-encoded field values as corresponding values.
         field_types = getattr(t, "_field_types")
-        return _to_json_obj_namedtuple(obj, field_types, use_decimal=use_decimal, namedtuples_as_lists=namedtuples_as_lists)
+        if opts.encode_cache is not None:
+            return _to_json_obj_memoised(obj, t, opts, lambda: _to_json_obj_namedtuple(obj, field_types, opts))
+        return _to_json_obj_namedtuple(obj, field_types, opts)
     if is_typed_dict(t):
         # Typed dicts are encoded as ordered dictionaries, with their fields as keys and the JSON-encoded field values as corresponding values.
         field_types = getattr(t, "__annotations__")
-        # return _to_json_obj_namedtuple(obj, field_types, use_decimal=use_decimal, namedtuples_as_lists=namedtuples_as_lists)
+        # return _to_json_obj_namedtuple(obj, field_types, opts)
         # A `dict`is used for `typing.Dict` and `typing.Mapping`.
+        # Fields missing from non-total typed dicts are omitted, as are `None` values of optional fields if `omit_defaults` is `True`.
+        omissible = _omissible_fields(cast(Hashable, t)) if opts.omit_defaults else frozenset()
+        aliases = alias_table(t)
         return {
-            field: to_json_obj(obj[field], field_type,
-                               use_decimal=use_decimal,
-                               typecheck=False,
-                               namedtuples_as_lists=namedtuples_as_lists)
+            field if aliases is None else aliases.to_wire[field]: _to_json_obj(obj[field], field_type, opts)
             for field, field_type in field_types.items()
+            if field in obj and not (obj[field] is None and field in omissible)
         }
     if hasattr(t, "__origin__") and hasattr(t, "__args__"):
         # Generics from the `typing` module.
         if t.__origin__ is Union:
             # values in a `typing.Union` are JSON-encoded using the first type in the union that the object is found to be an instance of.
+            if opts.adaptive_unions:
+                # in adaptive mode, types are tried in an order which gives the same result but favours the most frequent hits
+                profile = union_profile(t, encoding=True)
+                for i in profile.order:
+                    s = t.__args__[i]
+                    if is_instance(obj, s, validation=FULL_VALIDATION):
+                        profile.record(i)
+                        return _to_json_obj(obj, s, opts)
+                raise TypeError("Object %s is not of type %s."%(short_str(obj), str(t)))
             for s in t.__args__:
-                if is_instance(obj, s):
-                    return to_json_obj(obj, s, use_decimal=use_decimal, typecheck=False, namedtuples_as_lists=namedtuples_as_lists)
-            raise AssertionError(_UNREACHABLE_ERROR_MSG) # pragma: no cover
+                if is_instance(obj, s, validation=FULL_VALIDATION):
+                    return _to_json_obj(obj, s, opts)
+            # reachable when `obj` is an element of a collection which was skipped by the validation policy
+            raise TypeError("Object %s is not of type %s."%(short_str(obj), str(t)))
         if t.__origin__ is Literal:
             # `typing_extensions.Literal` are returned unchanged
             return obj
         if t.__origin__ in (list, set, frozenset, deque):
             # `typing.List`, `typing.Set`, `typing.FrozenSet` and `typing.Deque` are turned into lists, with their elements recursively JSON-encoded
-            return _to_json_obj_homogeneous_collection(obj, t.__args__[0], use_decimal=use_decimal, namedtuples_as_lists=namedtuples_as_lists)
+            if opts.columnar and t.__origin__ in (list, deque) and is_columnar_record(t.__args__[0]):
+                # in columnar layout, lists and deques of records are turned into a dictionary of columns, one for each field
+                return _to_json_obj_columns(obj, t.__args__[0], opts)
+            if t.__origin__ is frozenset and opts.encode_cache is not None:
+                return _to_json_obj_memoised(obj, t, opts, lambda: _to_json_obj_homogeneous_collection(obj, t.__args__[0], opts))
+            return _to_json_obj_homogeneous_collection(obj, t.__args__[0], opts)
         if t.__origin__ is tuple:
             # `typing.Tuple` are turned into lists, with their elements recursively JSON-encoded
-            if len(t.__args__) == 2 and t.__args__[1] is ...: # pylint:disable=no-else-return
-                return _to_json_obj_homogeneous_collection(obj, t.__args__[0], use_decimal=use_decimal, namedtuples_as_lists=namedtuples_as_lists)
-            else:
-                return [to_json_obj(x, t.__args__[i], use_decimal=use_decimal, typecheck=False, namedtuples_as_lists=namedtuples_as_lists) for i, x in enumerate(obj)]
+            if opts.encode_cache is not None:
+                return _to_json_obj_memoised(obj, t, opts, lambda: _to_json_obj_tuple(obj, t, opts))
+            return _to_json_obj_tuple(obj, t, opts)
         if t.__origin__ in (dict, OrderedDict, Mapping):
             # `typing.Dict` and `typing.Mapping` are turned into dictionaries and `typing.OrderedDict` are turned into ordered dictionaries.
             # The values are recursively JSON-encoded. Keys require special handling.
@@ -258,24 +436,25 @@ def to_json_obj(obj: Any, t: Type, use_decimal: bool = False, typecheck: bool =
             if t.__args__[0] in JSON_BASE_TYPES+(Decimal, None,):
                 # Keys of JSON basic types, `decimal.Decimal` and `None` are recursively JSON-encoded.
                 # encoded_fields = [field for field in fields] # pylint: disable = unnecessary-comprehension
-                encoded_fields = [to_json_obj(field, t.__args__[0], use_decimal=use_decimal, typecheck=False, namedtuples_as_lists=namedtuples_as_lists) for field in fields]
+                encoded_fields = [_to_json_obj(field, t.__args__[0], opts) for field in fields]
             elif (hasattr(t.__args__[0], "__origin__") and t.__args__[0].__origin__ is Literal):
                 # Keys of `typing_extensions.Literal` types are recursively JSON-encoded.
                 # encoded_fields = [field for field in fields] # pylint: disable = unnecessary-comprehension
-                encoded_fields = [to_json_obj(field, t.__args__[0], use_decimal=use_decimal, typecheck=False, namedtuples_as_lists=namedtuples_as_lists) for field in fields]
+                encoded_fields = [_to_json_obj(field, t.__args__[0], opts) for field in fields]
             elif isinstance(t.__args__[0], EnumMeta):
-                # Keys of enumeration types are recursively JSON-encoded.
-                encoded_fields = [to_json_obj(field, t.__args__[0], use_decimal=use_decimal, typecheck=False, namedtuples_as_lists=namedtuples_as_lists) for field in fields]
+                # Keys of enumeration types are recursively JSON-encoded (and stringified, if encoded by value or ordinal and not strings already).
+                encoding = enum_encoding(t.__args__[0], opts.enum_encoding)
+                encoded_fields = [enum_to_wire_key(field, t.__args__[0], encoding) for field in fields]
             else:
                 # Keys of any other type are recursively JSON-encoded and then JSON dumped to strings.
-                encoded_fields = [json.dumps(to_json_obj(field, t.__args__[0], use_decimal=use_decimal, typecheck=False, namedtuples_as_lists=namedtuples_as_lists)) for field in fields]
+                encoded_fields = [json.dumps(_to_json_obj(field, t.__args__[0], opts)) for field in fields]
             if t.__origin__ in (dict, Mapping):
                 # A `dict`is used for `typing.Dict` and `typing.Mapping`.
-                return {encoded_fields[i]: to_json_obj(obj[field], t.__args__[1], use_decimal=use_decimal, typecheck=False, namedtuples_as_lists=namedtuples_as_lists) for i, field in enumerate(fields)}
+                return {encoded_fields[i]: _to_json_obj(obj[field], t.__args__[1], opts) for i, field in enumerate(fields)}
             if t.__origin__ is OrderedDict:
                 # A `collections.OrderedDict` is used for `typing.OrderedDict`.
                 new_ordered_dict = OrderedDict() # type:ignore
                 for i, field in enumerate(fields):
-                    new_ordered_dict[encoded_fields[i]] = to_json_obj(obj[field], t.__args__[1], use_decimal=use_decimal, typecheck=False, namedtuples_as_lists=namedtuples_as_lists)
+                    new_ordered_dict[encoded_fields[i]] = _to_json_obj(obj[field], t.__args__[1], opts)
                 return new_ordered_dict
     raise AssertionError(_UNREACHABLE_ERROR_MSG) # pragma: no cover
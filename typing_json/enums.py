@@ -0,0 +1,152 @@
+#pylint:disable = line-too-long, invalid-name
+"""
+    The `typing_json.enums` module provides alternative encodings for enum values.
+
+    By default, enum values are JSON-encoded by name. Two more compact encodings are available:
+
+    - `"value"`, enum values are encoded by their value, which must be a string, a number, a boolean or `None` (and distinct for distinct members);
+    - `"ordinal"`, enum values are encoded by their position in the enumeration (aliases excluded), starting from `0`.
+
+    The encoding for an enum type can be declared alongside the type, as a class attribute `__json_enum_encoding__` (dunder names are not enum members),
+    or registered centrally with `typing_json.enums.set_enum_encoding` (which takes precedence). For all other enum types, the encoding can be chosen per call
+    by the `enum_encoding` parameter of `typing_json.encoding.to_json_obj` and `typing_json.decoding.from_json_obj` (and of `typing_json.dump`,
+    `typing_json.dumps`, `typing_json.load` and `typing_json.loads`), defaulting to `"name"`.
+
+    The same encoding is used for enum values and for enum dictionary keys: keys encoded by value or ordinal are stringified with `json.dumps`,
+    unless they are strings already. Forward and reverse lookup tables are computed once for each enum type and encoding.
+    Entries of a `typing_json.caching.EncodeCache` or `typing_json.caching.DecodeCache` stored before `typing_json.enums.set_enum_encoding` is called are not reused afterwards.
+
+    (Version: 0.1.3)
+"""
+
+# standard imports
+from decimal import Decimal
+from enum import Enum, EnumMeta
+from functools import lru_cache
+import json
+import threading
+from typing import Any, Dict, Hashable, NamedTuple, Optional, Tuple, Type, cast
+
+
+ENUM_ENCODINGS: Tuple[str, ...] = ("name", "value", "ordinal")
+""" The available encodings for enum values. """
+
+
+class EnumTable(NamedTuple):
+    """
+        Lookup tables for an enum type and encoding:
+
+        - `to_wire` maps each member to its JSON encoding;
+        - `from_wire` maps the JSON encoding of each member (and of each alias, for encoding by name) back to the member.
+    """
+    to_wire: Dict[Enum, Any]
+    from_wire: Dict[Any, Enum]
+
+
+_lock = threading.Lock()
+_registry: Dict[Any, str] = {}
+""" Centrally registered encodings, by enum type. """
+
+_version: int = 0
+""" Number of changes to the registry, used in the keys of caches of encoded and decoded objects (cf.&nbsp;`typing_json.enums.enum_encodings_version`). """
+
+
+def _check_encoding(encoding: str) -> None:
+    """ Raises `ValueError` if `encoding` is not one of `typing_json.enums.ENUM_ENCODINGS`. """
+    if encoding not in ENUM_ENCODINGS:
+        raise ValueError("Enum encoding must be one of %s, found %s instead."%(str(ENUM_ENCODINGS), repr(encoding)))
+
+
+def set_enum_encoding(t: Type, encoding: Optional[str]) -> None:
+    """
+        Sets the encoding for enum type `t` to `encoding` (one of `"name"`, `"value"` or `"ordinal"`), or discards the encoding registered for `t` if `encoding` is `None`.
+        Raises `TypeError` if `t` is not an enum type, and `ValueError` if the encoding is not valid or if `t` cannot be encoded by value.
+    """
+    global _version # pylint: disable = global-statement
+    if not isinstance(t, EnumMeta):
+        raise TypeError("Type %s is not an enum type."%str(t))
+    if encoding is not None:
+        # builds the tables, checking that `t` can be encoded as required
+        enum_table(cast(Hashable, t), encoding)
+    with _lock:
+        if encoding is None:
+            _registry.pop(t, None)
+        else:
+            _registry[t] = encoding
+        _version += 1
+
+
+def enum_encodings_version() -> int:
+    """
+        The number of times enum encodings have been set or discarded by `typing_json.enums.set_enum_encoding`: caches of encoded or decoded objects
+        include it in their keys, so that entries cached before a change to the registered encodings are not reused.
+    """
+    return _version
+
+
+def enum_encoding(t: Type, default: Optional[str] = None) -> str:
+    """
+        The encoding for enum type `t`: the registered encoding, if any, otherwise the `__json_enum_encoding__` attribute of `t`,
+        otherwise `default` (`"name"`, if `None`).
+    """
+    encoding = _registry.get(t)
+    if encoding is None:
+        encoding = getattr(t, "__json_enum_encoding__", None) or default or "name"
+    return encoding
+
+
+@lru_cache(maxsize=None)
+def enum_table(t: Type, encoding: str) -> EnumTable:
+    """
+        Returns the lookup tables for enum type `t` and the given encoding.
+        Raises `ValueError` if the encoding is not valid, or if it is `"value"` and the values of `t` are not distinct JSON basic values.
+    """
+    _check_encoding(encoding)
+    members = list(t) # type: ignore
+    if encoding == "name":
+        return EnumTable({m: m._name_ for m in members}, dict(t.__members__)) # type: ignore # pylint: disable = protected-access
+    if encoding == "ordinal":
+        return EnumTable({m: i for i, m in enumerate(members)}, dict(enumerate(members)))
+    for m in members:
+        if not (m.value is None or isinstance(m.value, (str, int, float))):
+            raise ValueError("Value %s of member %s is not a JSON basic value, enum type %s cannot be encoded by value."%(repr(m.value), m._name_, str(t))) # pylint: disable = protected-access
+    from_wire = {m.value: m for m in members}
+    if len(from_wire) != len(members):
+        raise ValueError("Values of enum type %s are not distinct, cannot be encoded by value."%str(t))
+    return EnumTable({m: m.value for m in members}, from_wire)
+
+
+def enum_from_wire(obj: Any, t: Type, encoding: str) -> Any:
+    """ Decodes the member of enum type `t` from its JSON encoding `obj`, raising `TypeError` if `obj` does not encode any member. """
+    from_wire = enum_table(cast(Hashable, t), encoding).from_wire
+    if obj.__class__ is Decimal and obj.is_finite():
+        # numbers parsed as decimals are looked up as `int` or `float`
+        obj = int(obj) if obj == obj.to_integral_value() else float(obj)
+    if encoding == "ordinal" and obj.__class__ is not int:
+        raise TypeError("Object %s is not an ordinal (t=%s)."%(repr(obj), str(t)))
+    try:
+        member = from_wire.get(obj)
+    except TypeError:
+        # unhashable objects
+        member = None
+    if member is None or (encoding == "value" and (obj.__class__ is bool) is not (member.value.__class__ is bool)):
+        # booleans only encode members with boolean values (and vice versa), even though `True == 1` and `False == 0`
+        raise TypeError("Object %s does not encode a member by %s (t=%s)."%(repr(obj), encoding, str(t)))
+    return member
+
+
+def enum_to_wire_key(member: Enum, t: Type, encoding: str) -> str:
+    """ Encodes the member of enum type `t` as a dictionary key. """
+    wire = enum_table(cast(Hashable, t), encoding).to_wire[member]
+    return wire if isinstance(wire, str) else json.dumps(wire)
+
+
+def enum_from_wire_key(key: str, t: Type, encoding: str) -> Any:
+    """ Decodes the member of enum type `t` from a dictionary key, raising `TypeError` if `key` does not encode any member. """
+    if encoding != "ordinal" and key in enum_table(cast(Hashable, t), encoding).from_wire:
+        return enum_table(cast(Hashable, t), encoding).from_wire[key]
+    try:
+        wire = json.loads(key)
+    except ValueError:
+        raise TypeError("Key %s does not encode a member by %s (t=%s)."%(repr(key), encoding, str(t))) from None
+    return enum_from_wire(wire, t, encoding)
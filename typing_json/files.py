@@ -0,0 +1,161 @@
+#pylint:disable = line-too-long, invalid-name
+"""
+    The `typing_json.files` module provides file-backed loading and saving of typed objects, e.g. for configuration files read on hot paths.
+
+    A `typing_json.files.TypedFileCache` keeps the objects decoded from files, together with the stat signature of each file
+    (device, inode, size, modification and change times): loading a file whose signature has not changed since the last load
+    returns the cached object at the cost of a single `os.stat` call, while files which changed are re-read and re-decoded.
+    The function `typing_json.files.watch_load` uses a process-wide cache.
+
+    The function `typing_json.files.atomic_dump` (and the method `typing_json.files.TypedFileCache.dump`) writes files atomically,
+    by writing to a temporary file in the same directory, flushing it to disk and then replacing the target file:
+    readers never observe partially written files. The permissions of the target file are preserved when it is replaced
+    (new files are created with the default permissions, according to the umask), and the directory is flushed to disk after the replacement.
+
+    (Version: 0.1.3)
+"""
+
+# standard imports
+import os
+import stat
+import tempfile
+import threading
+from typing import Any, Dict, Optional, Tuple, Type
+
+# internal imports
+from typing_json import dump, load, loads
+from typing_json.caching import copy_decoded
+from typing_json.compression import check_compression
+
+
+StatSignature = Tuple[int, int, int, int, int]
+""" Type of stat signatures: device, inode, size, modification time (ns) and change time (ns). """
+
+
+def stat_signature(path: str) -> StatSignature:
+    """ Returns the stat signature of the file at `path`, which changes whenever the file is modified or replaced. """
+    st = os.stat(path)
+    return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+
+
+def atomic_dump(obj: Any, encoded_type: Type, path: str, **kwargs) -> None:
+    """
+        Encodes `obj` with type `encoded_type` and writes it to the file at `path` atomically, using `typing_json.dump` (to which `kwargs` are passed):
+        the JSON is written to a temporary file in the same directory as `path`, which is flushed to disk and then renamed to `path` with `os.replace`.
+        If the `compression` keyword argument is set, the temporary file is opened in binary mode.
+        If encoding fails, the file at `path` is left untouched.
+        The permissions of an existing file at `path` are preserved, while new files get the default permissions for the current umask
+        (rather than the owner-only permissions of temporary files).
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".%s."%os.path.basename(path), suffix=".tmp")
+    try:
+        with (os.fdopen(fd, "wb") if kwargs.get("compression") is not None else os.fdopen(fd, "w", encoding="utf-8")) as f:
+            dump(obj, encoded_type, f, **kwargs)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~_current_umask()
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    _fsync_directory(directory)
+
+
+def _current_umask() -> int:
+    """ Returns the umask of the process (which can only be read by setting it). """
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
+
+
+def _fsync_directory(directory: str) -> None:
+    """ Flushes the entries of `directory` to disk, so that a file replaced in it survives a crash (on platforms where directories can be opened). """
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(directory, os.O_RDONLY | getattr(os, "O_DIRECTORY"))
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class TypedFileCache:
+    """
+        A thread-safe cache of objects decoded from files, revalidated by stat signature (cf.&nbsp;`typing_json.files.stat_signature`).
+
+        The keyword arguments `load_kwargs` are passed to `typing_json.loads` whenever a file is (re-)decoded.
+        If `copies` is `False` (default), all loads of an unchanged file return the same decoded object, which must not be modified;
+        if `copies` is `True`, loads return copies of the decoded object sharing only its deeply immutable parts.
+    """
+
+    def __init__(self, copies: bool = False, **load_kwargs):
+        self.copies = copies
+        self.load_kwargs = load_kwargs
+        self._entries: Dict[Tuple[str, Any, Optional[str]], Tuple[StatSignature, Any]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, path: str, decoded_type: Type, compression: Optional[str] = None) -> Any:
+        """
+            Returns the object decoded from the file at `path` with type `decoded_type`, re-reading the file only if its stat signature
+            changed since it was last decoded by this cache.
+            If `compression` is set, the file is read in binary mode and decompressed (cf.&nbsp;`typing_json.load`),
+            e.g. to read back files written by `typing_json.files.TypedFileCache.dump` with the same `compression`.
+            Files are decoded without holding the lock of the cache: if several threads decode the same file concurrently,
+            all of them return the object stored by the first one to finish.
+        """
+        check_compression(compression)
+        key = (os.path.abspath(path), decoded_type, compression)
+        signature = stat_signature(path)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != signature:
+            # the file is read and decoded outside of the lock, so that loads of other files are not blocked meanwhile
+            if compression is None:
+                with open(path, "r", encoding="utf-8") as f:
+                    decoded_obj = loads(f.read(), decoded_type, **self.load_kwargs)
+            else:
+                with open(path, "rb") as fb:
+                    decoded_obj = load(fb, decoded_type, compression=compression, **self.load_kwargs)
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is None or entry[0] != signature:
+                    # the signature taken before reading is stored: if the file changes while it is being read, the next load re-reads it
+                    entry = (signature, decoded_obj)
+                    self._entries[key] = entry
+        if self.copies:
+            return copy_decoded(entry[1], decoded_type)
+        return entry[1]
+
+    def dump(self, obj: Any, encoded_type: Type, path: str, **dump_kwargs) -> None:
+        """ Writes `obj` to the file at `path` atomically (cf.&nbsp;`typing_json.files.atomic_dump`); the next load of `path` re-reads the file. """
+        atomic_dump(obj, encoded_type, path, **dump_kwargs)
+        self.invalidate(path)
+
+    def invalidate(self, path: str) -> None:
+        """ Discards the objects cached for the file at `path`, for all decoded types. """
+        abspath = os.path.abspath(path)
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == abspath]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """ Discards all cached objects. """
+        with self._lock:
+            self._entries.clear()
+
+
+_file_cache = TypedFileCache()
+
+
+def watch_load(path: str, decoded_type: Type, compression: Optional[str] = None) -> Any:
+    """
+        Returns the object decoded from the file at `path` with type `decoded_type` (using the default options of `typing_json.loads`,
+        and decompressing the file if `compression` is set),
+        re-reading the file only if it changed since it was last loaded, according to its stat signature.
+        The decoded objects are shared by all calls, and must not be modified.
+    """
+    return _file_cache.load(path, decoded_type, compression)
@@ -0,0 +1,259 @@
+#pylint:disable = line-too-long, invalid-name
+"""
+    The `typing_json.indexing` module provides random access to the records of typed NDJSON files (cf.&nbsp;`typing_json.lines`),
+    such as append-only record logs, without decoding the file from the start.
+
+    A `typing_json.indexing.LineIndex` holds the byte offsets of the records (non-blank lines) of a file, and optionally maps the values of a key field
+    of the records (a field of a namedtuple or typed dict record type) to record numbers. An index is built in a single pass over the file,
+    extracting key values with `typing_json.pointer.get_path` (which decodes the key field only), and can be saved next to the file
+    (by default, at the file path with suffix `.idx`). As lines are appended to the file, `typing_json.indexing.LineIndex.update` indexes the new lines only.
+    Only complete lines (terminated by a newline) are indexed, so that a record being appended is never read half-written.
+
+    A `typing_json.indexing.IndexedLines` reader memory-maps the file and decodes single records on demand, by record number or by key,
+    at the cost of a single slice of the mapped file (and of the decoding of that record alone).
+
+    (Version: 0.1.3)
+"""
+
+# standard imports
+from array import array
+import json
+import mmap
+import os
+import sys
+from typing import Any, Dict, Iterator, Optional, Type
+
+# internal imports
+from typing_json import loads
+from typing_json.decoding import from_json_obj
+from typing_json.encoding import _record_field_types, is_json_encodable, to_json_obj
+from typing_json.lines import line_error
+from typing_json.pointer import get_path
+from typing_json.typechecking import is_keyable, is_namedtuple, is_typed_dict
+
+
+INDEX_SUFFIX: str = ".idx"
+""" The suffix appended to the path of a file to obtain the default path of its index. """
+
+_INDEX_VERSION = 1
+
+
+def _key_pointer(field: str) -> str:
+    """ The JSON Pointer to field `field` of a record (cf.&nbsp;RFC 6901 for the escaping of `~` and `/`). """
+    return "/"+field.replace("~", "~0").replace("/", "~1")
+
+
+def _offsets_to_bytes(offsets: array) -> bytes:
+    """ Little-endian encoding of an array of offsets. """
+    if sys.byteorder == "big":
+        offsets = array("Q", offsets)
+        offsets.byteswap()
+    return offsets.tobytes()
+
+
+def _offsets_from_bytes(b: bytes) -> array:
+    """ Inverse of `_offsets_to_bytes`. """
+    offsets = array("Q")
+    offsets.frombytes(b)
+    if sys.byteorder == "big":
+        offsets.byteswap()
+    return offsets
+
+
+class LineIndex:
+    """
+        The offset index of the NDJSON file at `path`, whose records have type `record_type`:
+
+        - `offsets` is an `array.array` of the byte offsets at which the records (non-blank lines) start;
+        - `size` is the number of bytes of the file indexed so far (always the end of a complete line);
+        - if `key` is the name of a field of `record_type` (which must be a namedtuple or typed dict type, with a keyable field type),
+          `keys` maps each value of the field to the number of the last record having that value (later records for the same key supersede earlier ones).
+
+        Raises `TypeError` if `key` is not a keyable field of `record_type`.
+    """
+
+    def __init__(self, path: str, record_type: Type, key: Optional[str] = None):
+        if not is_json_encodable(record_type):
+            raise TypeError("Type %s is not json-encodable."%str(record_type))
+        if key is not None:
+            if not is_namedtuple(record_type) and not is_typed_dict(record_type):
+                raise TypeError("Key field %s requires a namedtuple or typed dict record type, found %s instead."%(repr(key), str(record_type)))
+            field_types = _record_field_types(record_type)
+            if key not in field_types:
+                raise TypeError("Key %s is not a field of record type %s."%(repr(key), str(record_type)))
+            if not is_keyable(field_types[key]):
+                raise TypeError("Key field %s has type %s, which is not keyable."%(repr(key), str(field_types[key])))
+        self.path = path
+        self.record_type = record_type
+        self.key = key
+        self.offsets = array("Q")
+        self.keys: Dict[Any, int] = {}
+        self.size = 0
+
+    @property
+    def key_type(self) -> Optional[Type]:
+        """ The type of the key field, or `None` if the index has no key. """
+        if self.key is None:
+            return None
+        return _record_field_types(self.record_type)[self.key]
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def update(self) -> int:
+        """
+            Indexes the complete lines appended to the file since it was last indexed, returning the number of new records.
+            If the file was truncated or rewritten (i.e. it no longer extends the indexed prefix), it is re-indexed from the start.
+        """
+        with open(self.path, "rb") as f:
+            file_size = os.fstat(f.fileno()).st_size
+            if self.size > 0:
+                f.seek(self.size-1)
+                if file_size < self.size or f.read(1) != b"\n":
+                    self.offsets = array("Q")
+                    self.keys = {}
+                    self.size = 0
+            f.seek(self.size)
+            count = len(self.offsets)
+            offset = self.size
+            pointer = None if self.key is None else _key_pointer(self.key)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # incomplete last line, indexed once it has been completed
+                    break
+                if line.strip():
+                    if pointer is not None:
+                        try:
+                            key_value = get_path(line, self.record_type, pointer)
+                        except KeyError as e:
+                            raise TypeError("Record %d: record has no key field %s."%(len(self.offsets), repr(self.key))) from e
+                        except (TypeError, ValueError) as e:
+                            raise line_error(e, len(self.offsets), "Record") from e
+                        self.keys[key_value] = len(self.offsets)
+                    self.offsets.append(offset)
+                offset += len(line)
+            self.size = offset
+        return len(self.offsets)-count
+
+    def save(self, index_path: Optional[str] = None) -> None:
+        """
+            Saves the index to the file at `index_path` (by default, the path of the indexed file with suffix `typing_json.indexing.INDEX_SUFFIX`),
+            as a JSON header line (including the key values, encoded with `typing_json.encoding.to_json_obj`) followed by the offsets as little-endian 64-bit integers.
+            The index file is replaced atomically.
+        """
+        if index_path is None:
+            index_path = self.path+INDEX_SUFFIX
+        key_type = self.key_type
+        header = {"version": _INDEX_VERSION, "size": self.size, "count": len(self.offsets), "key": self.key,
+                  "keys": [] if key_type is None else [[to_json_obj(k, key_type), i] for k, i in self.keys.items()]}
+        tmp_path = index_path+".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(json.dumps(header, separators=(",", ":")).encode("utf-8")+b"\n")
+            f.write(_offsets_to_bytes(self.offsets))
+        os.replace(tmp_path, index_path)
+
+    @staticmethod
+    def load(path: str, record_type: Type, key: Optional[str] = None, index_path: Optional[str] = None) -> "LineIndex":
+        """
+            Returns the index of the NDJSON file at `path`, loaded from the index file at `index_path` (by default, the path of the file with suffix
+            `typing_json.indexing.INDEX_SUFFIX`) if it exists and has the requested key, otherwise built from scratch.
+            In both cases, the index is updated with the lines appended to the file since it was saved (without saving it again).
+        """
+        index = LineIndex(path, record_type, key)
+        if index_path is None:
+            index_path = path+INDEX_SUFFIX
+        if os.path.exists(index_path):
+            with open(index_path, "rb") as f:
+                header = json.loads(f.readline().decode("utf-8"))
+                if header.get("version") == _INDEX_VERSION and header.get("key") == key:
+                    offsets = _offsets_from_bytes(f.read(8*header["count"]))
+                    key_type = index.key_type
+                    if len(offsets) == header["count"]:
+                        index.offsets = offsets
+                        index.size = header["size"]
+                        index.keys = {} if key_type is None else {from_json_obj(k, key_type): i for k, i in header["keys"]}
+        index.update()
+        return index
+
+
+class IndexedLines:
+    """
+        A random-access reader for the NDJSON file at `path`, whose records have type `record_type`, using a `typing_json.indexing.LineIndex`
+        (by default, the one loaded by `typing_json.indexing.LineIndex.load` for the given `key`).
+        The file is memory-mapped, and single records are decoded on demand with `typing_json.loads` (to which the keyword arguments `load_kwargs` are passed):
+
+        - `reader[n]` decodes record number `n`, starting from `0` (negative numbers count from the end);
+        - `reader.get(key_value)` decodes the last record with the given key value (or returns `default`, if there is none);
+        - `reader.refresh()` indexes the records appended to the file since the reader was opened (or last refreshed).
+
+        Errors raised while decoding a record are reported with the record number (cf.&nbsp;`typing_json.lines.line_error`).
+        Readers should be closed after use (e.g. by using them as context managers), to release the memory map.
+    """
+
+    def __init__(self, path: str, record_type: Type, key: Optional[str] = None, index: Optional[LineIndex] = None, **load_kwargs):
+        self.index = index if index is not None else LineIndex.load(path, record_type, key)
+        self.path = path
+        self.record_type = record_type
+        self.load_kwargs = load_kwargs
+        self._file = open(path, "rb")
+        self._mmap: Optional[mmap.mmap] = None
+        self._map()
+
+    def _map(self) -> None:
+        """ (Re-)maps the indexed prefix of the file. """
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self.index.size > 0:
+            # empty files cannot be mapped
+            self._mmap = mmap.mmap(self._file.fileno(), self.index.size, access=mmap.ACCESS_READ)
+
+    def refresh(self) -> int:
+        """ Indexes the records appended to the file since the last refresh, returning the number of new records. """
+        n = self.index.update()
+        self._map()
+        return n
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def raw(self, n: int) -> bytes:
+        """ Returns the bytes of record number `n` (without the terminating newline), raising `IndexError` if there is no such record. """
+        start = self.index.offsets[n]
+        mm = self._mmap
+        assert mm is not None
+        return mm[start:mm.find(b"\n", start)]
+
+    def __getitem__(self, n: int) -> Any:
+        """ Decodes record number `n`, raising `IndexError` if there is no such record. """
+        raw = self.raw(n)
+        try:
+            return loads(raw, self.record_type, **self.load_kwargs)
+        except (TypeError, ValueError) as e:
+            raise line_error(e, n if n >= 0 else len(self)+n, "Record") from e
+
+    def __iter__(self) -> Iterator[Any]:
+        for n in range(len(self)):
+            yield self[n]
+
+    def get(self, key_value: Any, default: Any = None) -> Any:
+        """ Decodes the last record whose key field has value `key_value`, or returns `default` if there is none. Raises `TypeError` if the index has no key. """
+        if self.index.key is None:
+            raise TypeError("The index of file %s has no key field."%self.path)
+        n = self.index.keys.get(key_value)
+        if n is None:
+            return default
+        return self[n]
+
+    def close(self) -> None:
+        """ Releases the memory map and closes the file. """
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self) -> "IndexedLines":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
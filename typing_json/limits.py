@@ -0,0 +1,109 @@
+#pylint:disable = line-too-long, invalid-name
+"""
+    The `typing_json.limits` module provides resource limits for decoding untrusted JSON payloads.
+
+    Limits are specified by an instance of `typing_json.limits.DecodeLimits`, which can be passed to
+    `typing_json.load`, `typing_json.loads` and `typing_json.decoding.from_json_obj` via the optional `limits` parameter.
+    When a limit is exceeded, decoding is aborted by raising `typing_json.limits.DecodeLimitExceeded`.
+
+    (Version: 0.1.3)
+"""
+
+# standard imports
+import time
+from typing import Any, NamedTuple, Optional
+
+
+class DecodeLimitExceeded(ValueError):
+    """
+        Raised when decoding exceeds one of the limits specified by a `typing_json.limits.DecodeLimits` instance.
+
+        This is deliberately not a subclass of `TypeError`, so that it is never swallowed by the trial decoding
+        of `typing.Union` members in `typing_json.decoding.from_json_obj`.
+        The name of the limit which was exceeded is stored in the `limit` attribute.
+    """
+
+    limit: str
+
+    def __init__(self, limit: str, message: str):
+        super().__init__(message)
+        self.limit = limit
+
+    def __reduce__(self):
+        # errors raised in worker processes are pickled (cf. `typing_json.lines.load_lines_parallel`)
+        return (DecodeLimitExceeded, (self.limit, str(self)))
+
+
+class DecodeLimits(NamedTuple):
+    """
+        Resource limits for decoding, all optional (a value of `None` means that the corresponding resource is not limited):
+
+        - `max_depth` is the maximum nesting depth of JSON values (the top-level value is at depth 1), regardless of any `typing.Union` types wrapping them;
+        - `max_length` is the maximum number of elements in a JSON array or entries in a JSON object;
+        - `max_string_length` is the maximum length of a JSON string, including strings used as object keys;
+        - `max_nodes` is the maximum total number of decoding steps, where each value visited counts as one step
+          (this includes repeated visits due to trial decoding of `typing.Union` members and values parsed from stringified dictionary keys);
+        - `max_time` is the maximum time in seconds to be spent decoding, including parsing when using `typing_json.load`/`typing_json.loads`;
+        - `max_input_size` is the maximum length of the string/bytes passed to `typing_json.loads` (or read by `typing_json.load`).
+    """
+    max_depth: Optional[int] = None
+    max_length: Optional[int] = None
+    max_string_length: Optional[int] = None
+    max_nodes: Optional[int] = None
+    max_time: Optional[float] = None
+    max_input_size: Optional[int] = None
+
+
+class DecodeBudget:
+    """
+        Running state for a `typing_json.limits.DecodeLimits` instance, shared by all recursive steps of a single decoding.
+        The clock for `max_time` starts when the budget is created.
+    """
+    # pylint: disable = too-few-public-methods, too-many-instance-attributes
+
+    __slots__ = ("limits", "depth", "nodes", "deadline", "_max_depth", "_max_length", "_max_string_length", "_max_nodes")
+
+    def __init__(self, limits: DecodeLimits):
+        self.limits = limits
+        self.depth = 0
+        self.nodes = 0
+        self.deadline = None if limits.max_time is None else time.monotonic()+limits.max_time
+        self._max_depth = limits.max_depth
+        self._max_length = limits.max_length
+        self._max_string_length = limits.max_string_length
+        self._max_nodes = limits.max_nodes
+
+    def check_input_size(self, s: Any) -> None:
+        """ Checks the size of the raw input string/bytes against `max_input_size`. """
+        max_input_size = self.limits.max_input_size
+        if max_input_size is not None and len(s) > max_input_size:
+            raise DecodeLimitExceeded("max_input_size", "Input of size %d exceeds limit max_input_size=%d."%(len(s), max_input_size))
+
+    def check_time(self) -> None:
+        """ Checks the time elapsed since the budget was created against `max_time`. """
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise DecodeLimitExceeded("max_time", "Decoding exceeded time limit max_time=%s."%str(self.limits.max_time))
+
+    def enter(self, obj: Any) -> None:
+        """
+            Accounts for a decoding step on the JSON value `obj`, one level deeper than the current one.
+            The caller is responsible for decrementing `depth` once the step is over.
+        """
+        self.depth += 1
+        self.nodes += 1
+        if self._max_depth is not None and self.depth > self._max_depth:
+            raise DecodeLimitExceeded("max_depth", "Nesting depth exceeds limit max_depth=%d."%self._max_depth)
+        if self._max_nodes is not None and self.nodes > self._max_nodes:
+            raise DecodeLimitExceeded("max_nodes", "Number of decoding steps exceeds limit max_nodes=%d."%self._max_nodes)
+        if self.deadline is not None:
+            self.check_time()
+        if isinstance(obj, str):
+            if self._max_string_length is not None and len(obj) > self._max_string_length:
+                raise DecodeLimitExceeded("max_string_length", "String of length %d exceeds limit max_string_length=%d."%(len(obj), self._max_string_length))
+        elif isinstance(obj, (list, dict)):
+            if self._max_length is not None and len(obj) > self._max_length:
+                raise DecodeLimitExceeded("max_length", "Collection of length %d exceeds limit max_length=%d."%(len(obj), self._max_length))
+            if isinstance(obj, dict) and self._max_string_length is not None:
+                for key in obj:
+                    if isinstance(key, str) and len(key) > self._max_string_length:
+                        raise DecodeLimitExceeded("max_string_length", "Key of length %d exceeds limit max_string_length=%d."%(len(key), self._max_string_length))
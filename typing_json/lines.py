@@ -0,0 +1,414 @@
+#pylint:disable = line-too-long, invalid-name
+"""
+    The `typing_json.lines` module provides typed encoding and decoding of newline-delimited JSON (NDJSON), one object per line.
+
+    The function `typing_json.lines.dump_lines` writes a sequence of objects of the same type, encoding each with `typing_json.dumps`,
+    while `typing_json.lines.load_lines` lazily decodes the lines of a file with `typing_json.loads`, yielding one object per non-blank line:
+    only one line is held in memory at a time. Both functions accept the optional `compression` parameter of `typing_json.dump` and `typing_json.load`
+    (cf.&nbsp;`typing_json.compression`), in which case the file object must be a binary file.
+
+    The function `typing_json.lines.load_lines_parallel` decodes a single (uncompressed) NDJSON file on multiple cores: the file is split into byte ranges
+    aligned on newlines (cf.&nbsp;`typing_json.lines.line_ranges`), which are memory-mapped and decoded by a pool of worker processes,
+    and the decoded objects are streamed back in file order or in completion order.
+
+    (Version: 0.1.3)
+"""
+
+# standard imports
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+import io
+from itertools import islice
+import mmap
+import os
+from typing import Any, Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Type
+
+# internal imports
+from typing_json import dumps, loads
+from typing_json.compression import check_compression, compressed_text
+from typing_json.encoding import is_json_encodable
+from typing_json.limits import DecodeLimitExceeded
+
+
+def dump_lines(objs: Iterable[Any], encoded_type: Type, fp, compression: Optional[str] = None, **kwargs) -> int:
+    """
+        Writes the objects in `objs` to the file object `fp` as NDJSON, encoding each object on its own line with `typing_json.dumps`
+        using `encoded_type` as a type hint (the keyword arguments `kwargs` are passed to `typing_json.dumps`). Returns the number of lines written.
+
+        If the optional parameter `compression` is set, `fp` must be a binary file object, to which the lines are written through the compressor.
+
+        Raises `TypeError` if `encoded_type` is not JSON-encodable, and `ValueError` if the `indent` option is set (which would break lines).
+    """
+    if not is_json_encodable(encoded_type):
+        raise TypeError("Type %s is not json-encodable."%str(encoded_type))
+    if kwargs.get("indent") is not None:
+        raise ValueError("Option indent=%s is not allowed for NDJSON, each object must be encoded on a single line."%repr(kwargs["indent"]))
+    check_compression(compression)
+    if compression is not None:
+        with compressed_text(fp, compression, "w") as text:
+            return dump_lines(objs, encoded_type, text, **kwargs)
+    n = 0
+    for obj in objs:
+        fp.write(dumps(obj, encoded_type, **kwargs)+"\n")
+        n += 1
+    return n
+
+
+def line_error(e: Exception, lineno: int, label: str = "Line") -> Exception:
+    """
+        Returns an error reporting the error `e` raised while decoding line number `lineno` (starting from 1): a `TypeError` for decoding errors,
+        a `ValueError` for parsing errors (with the position of the error within the line), and `e` itself for exceeded limits.
+        The optional `label` replaces `"Line"` in the error message, for errors located by other positions (e.g. record numbers).
+    """
+    if isinstance(e, DecodeLimitExceeded):
+        return e
+    if isinstance(e, TypeError):
+        return TypeError("%s %d: %s"%(label, lineno, str(e)))
+    return ValueError("%s %d: %s"%(label, lineno, str(e)))
+
+
+ERROR_POLICIES: Tuple[str, ...] = ("abort", "skip", "collect")
+""" The policies for records which fail to decode: raise the error, skip the record, or skip the record and collect the error. """
+
+
+class Checkpoint(NamedTuple):
+    """
+        A resume point for the decoding of an NDJSON stream, covering all lines consumed so far:
+
+        - `offset` is the byte offset of the first line not yet consumed;
+        - `record` is the number of records decoded (and yielded) so far;
+        - `line` is the number of lines consumed so far, including blank lines and skipped records.
+    """
+    offset: int
+    record: int
+    line: int
+
+
+START: Checkpoint = Checkpoint(0, 0, 0)
+""" The checkpoint at the start of a stream. """
+
+
+class RecordError(NamedTuple):
+    """ A record which failed to decode: its line number (starting from 1), the byte offset at which the line starts, and the error raised (cf.&nbsp;`typing_json.lines.line_error`). """
+    line: int
+    offset: int
+    error: Exception
+
+
+class LineStream:
+    """
+        An iterator over the objects decoded from an NDJSON stream, as returned by `typing_json.lines.load_lines` and `typing_json.lines.load_lines_parallel`.
+
+        While iterating, `checkpoint` is a `typing_json.lines.Checkpoint` covering all objects yielded so far (and the blank lines and skipped records around them),
+        which can be passed as the `resume` parameter of a later call to continue decoding from that point, without re-reading the prefix of the stream.
+        With the `"collect"` error policy, the records which failed to decode are appended to `errors` (a list of `typing_json.lines.RecordError`) as they are skipped.
+    """
+
+    def __init__(self, checkpoint: Checkpoint):
+        self.checkpoint = checkpoint
+        self.errors: List[RecordError] = []
+        self._records: Iterator[Any] = iter(())
+
+    def __iter__(self) -> "LineStream":
+        return self
+
+    def __next__(self) -> Any:
+        return next(self._records)
+
+    def close(self) -> None:
+        """ Stops decoding, releasing the resources held by the stream (e.g. worker processes). """
+        close = getattr(self._records, "close", None)
+        if close is not None:
+            close()
+
+
+def _check_policy(errors: str) -> None:
+    """ Raises `ValueError` if `errors` is not one of `typing_json.lines.ERROR_POLICIES`. """
+    if errors not in ERROR_POLICIES:
+        raise ValueError("Error policy must be one of %s, found %s instead."%(str(ERROR_POLICIES), repr(errors)))
+
+
+def _record_error(stream: LineStream, errors: str, e: Exception, lineno: int, offset: int) -> None:
+    """ Applies the error policy `errors` to the error `e` raised by the record at line number `lineno`, starting at byte offset `offset`. """
+    error = line_error(e, lineno)
+    if errors == "abort":
+        raise error from e
+    if errors == "collect":
+        stream.errors.append(RecordError(lineno, offset, error))
+
+
+def load_lines(fp, decoded_type: Type, compression: Optional[str] = None, errors: str = "abort", resume: Optional[Checkpoint] = None, **kwargs) -> LineStream:
+    """
+        Lazily decodes the NDJSON lines read from the file object `fp` (text or binary), using `decoded_type` as a type hint:
+        each non-blank line is decoded with `typing_json.loads` (to which the keyword arguments `kwargs` are passed) and the decoded object is yielded.
+        Returns a `typing_json.lines.LineStream`, exposing checkpoints as the lines are consumed.
+
+        If the optional parameter `compression` is set, `fp` must be a binary file object, whose contents are decompressed in chunks as the lines are read.
+
+        The optional parameter `errors` sets the policy for records which fail to decode (cf.&nbsp;`typing_json.lines.ERROR_POLICIES`):
+        with `"abort"` (default), the error is raised with the line number (cf.&nbsp;`typing_json.lines.line_error`), after all objects decoded from the previous lines
+        have been yielded; with `"skip"`, the record is skipped; with `"collect"`, the record is skipped and the error is appended to the `errors` of the stream.
+
+        If the optional parameter `resume` is a checkpoint of a previous stream over the same data, decoding resumes from that point: seekable binary files
+        are positioned at the checkpoint offset, while for other streams (text files and compressed streams) the lines before the checkpoint are read and discarded,
+        without being parsed. Checkpoint offsets are counted in bytes from the start of the (decompressed) stream, assuming UTF-8 and no newline translation for text files.
+
+        Raises `TypeError` if `decoded_type` is not JSON-encodable, and `ValueError` if the compression or error policy is not valid.
+    """
+    # pylint: disable = too-many-arguments
+    if not is_json_encodable(decoded_type):
+        raise TypeError("Type %s is not json-encodable."%str(decoded_type))
+    check_compression(compression)
+    _check_policy(errors)
+    stream = LineStream(START if resume is None else Checkpoint(*resume))
+    stream._records = _load_lines(stream, fp, decoded_type, compression, errors, kwargs) # pylint: disable = protected-access
+    return stream
+
+
+def _load_lines(stream: LineStream, fp, decoded_type: Type, compression: Optional[str], errors: str, kwargs) -> Iterator[Any]:
+    # pylint: disable = too-many-arguments
+    if compression is not None:
+        with compressed_text(fp, compression, "r") as text:
+            yield from _load_lines(stream, text, decoded_type, None, errors, kwargs)
+        return
+    offset, record, lineno = stream.checkpoint
+    binary = not isinstance(fp, io.TextIOBase)
+    if lineno > 0:
+        if binary and fp.seekable():
+            fp.seek(offset)
+        else:
+            # lines before the checkpoint are skipped without being parsed
+            for _ in islice(fp, lineno):
+                pass
+    for line in fp:
+        lineno += 1
+        start = offset
+        offset += len(line) if binary else len(line.encode("utf-8"))
+        if not line.strip():
+            continue
+        try:
+            obj = loads(line, decoded_type, **kwargs)
+        except (TypeError, ValueError) as e:
+            # with the abort policy, the error is raised and the checkpoint is left before the record
+            _record_error(stream, errors, e, lineno, start)
+            stream.checkpoint = Checkpoint(offset, record, lineno)
+            continue
+        record += 1
+        stream.checkpoint = Checkpoint(offset, record, lineno)
+        yield obj
+    stream.checkpoint = Checkpoint(offset, record, lineno)
+
+
+RANGE_SIZE: int = 16*1024*1024
+""" The default size in bytes of the ranges decoded by each task of `typing_json.lines.load_lines_parallel`. """
+
+
+def line_ranges(path: str, range_size: int = RANGE_SIZE, start: int = 0) -> List[Tuple[int, int]]:
+    """
+        Splits the file at `path`, from byte offset `start` (which must be the start of a line), into consecutive byte ranges `(start, end)` of about `range_size` bytes each,
+        covering the rest of the file, where each range except possibly the last ends just after a newline (so that no line spans two ranges).
+    """
+    if range_size < 1:
+        raise ValueError("Range size must be positive, found %d instead."%range_size)
+    ranges: List[Tuple[int, int]] = []
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size <= start:
+            return ranges
+        with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm:
+            while start < size:
+                newline = mm.find(b"\n", min(start+range_size, size)-1)
+                end = size if newline == -1 else newline+1
+                ranges.append((start, end))
+                start = end
+    return ranges
+
+
+def _count_lines(path: str, start: int, end: int) -> int:
+    """ The number of newlines in the byte range `[start, end)` of the file at `path`. """
+    if end <= start:
+        return 0
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), end, access=mmap.ACCESS_READ) as mm:
+            return mm[start:end].count(b"\n")
+
+
+class _RangeResult(NamedTuple):
+    """
+        The result of decoding a byte range: the objects decoded, with the line numbers (within the range, starting from 1) and end offsets of their lines,
+        the number of lines in the range, and the records which failed to decode, with their line numbers, start and end offsets and errors.
+    """
+    objs: List[Any]
+    lines: List[int]
+    ends: List[int]
+    nlines: int
+    failed: List[Tuple[int, int, int, Exception]]
+
+
+def _decode_range(path: str, start: int, end: int, decoded_type: Type, errors: str, kwargs: Dict[str, Any]) -> _RangeResult:
+    """ Decodes the NDJSON lines in the byte range `[start, end)` of the file at `path`, stopping at the first record which fails to decode if `errors` is `"abort"`. """
+    # pylint: disable = too-many-arguments
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), end, access=mmap.ACCESS_READ) as mm:
+            data = mm[start:end]
+    result = _RangeResult([], [], [], data.count(b"\n")+(0 if data.endswith(b"\n") else 1), [])
+    offset = start
+    for lineno, line in enumerate(data.split(b"\n"), 1):
+        line_start = offset
+        offset += len(line)+1
+        if not line.strip():
+            continue
+        try:
+            result.objs.append(loads(line, decoded_type, **kwargs))
+        except (TypeError, ValueError) as e:
+            result.failed.append((lineno, line_start, min(offset, end), e))
+            if errors == "abort":
+                break
+            continue
+        result.lines.append(lineno)
+        result.ends.append(min(offset, end))
+    return result
+
+
+def load_lines_parallel(path: str, decoded_type: Type, workers: Optional[int] = None, ordered: bool = True, range_size: int = RANGE_SIZE, errors: str = "abort", resume: Optional[Checkpoint] = None, **kwargs) -> LineStream:
+    """
+        Lazily decodes the NDJSON file at `path` using `decoded_type` as a type hint, as `typing_json.lines.load_lines` does, with `workers` processes
+        (by default, as many as CPUs; with `workers=1`, the file is decoded in the calling process). The file is split into byte ranges of about `range_size` bytes
+        aligned on newlines (cf.&nbsp;`typing_json.lines.line_ranges`), each of which is memory-mapped and decoded by a worker, with `typing_json.loads`
+        (to which the keyword arguments `kwargs` are passed, and which must hence be picklable). At most two ranges per worker are decoded ahead of the consumer.
+
+        If `ordered` is `True` (default), the decoded objects are yielded in file order; otherwise, the objects decoded from each range are yielded
+        as soon as the range has been decoded (still in file order within each range).
+
+        The optional parameters `errors` and `resume` are as for `typing_json.lines.load_lines`: errors are reported with the line number within the whole file,
+        and decoding resumes from the checkpoint offset. The checkpoint of the returned `typing_json.lines.LineStream` advances with each object yielded if `ordered` is `True`,
+        and otherwise with each range yielded after all the ranges preceding it (so that resuming may yield again some of the objects yielded out of order).
+        Resources are released when the stream is exhausted or closed, or when an error is raised (e.g. by a crashed worker process).
+
+        Raises `TypeError` if `decoded_type` is not JSON-encodable, and `ValueError` if `workers` or `range_size` is not positive or the error policy is not valid.
+    """
+    # pylint: disable = too-many-arguments
+    if not is_json_encodable(decoded_type):
+        raise TypeError("Type %s is not json-encodable."%str(decoded_type))
+    _check_policy(errors)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("Number of workers must be positive, found %d instead."%workers)
+    stream = LineStream(START if resume is None else Checkpoint(*resume))
+    ranges = line_ranges(path, range_size, stream.checkpoint.offset)
+    stream._records = _load_lines_parallel(stream, path, decoded_type, ranges, workers, ordered, errors, kwargs) # pylint: disable = protected-access
+    return stream
+
+
+class _ParallelState:
+    """ State of the consumer of the ranges decoded by `typing_json.lines.load_lines_parallel`. """
+    # pylint: disable = too-few-public-methods, too-many-instance-attributes
+
+    def __init__(self, stream: LineStream, path: str, ranges: List[Tuple[int, int]], ordered: bool, errors: str):
+        # pylint: disable = too-many-arguments
+        self.stream = stream
+        self.path = path
+        self.ranges = ranges
+        self.ordered = ordered
+        self.errors = errors
+        self.base = stream.checkpoint
+        self.completed: Dict[int, Tuple[int, int]] = {}
+        self.next_range = 0
+        self.prefix_lines = self.base.line
+        self.prefix_records = self.base.record
+
+    def first_line(self, i: int) -> int:
+        """ The number of lines before range number `i`. """
+        if i == self.next_range:
+            return self.prefix_lines
+        return self.base.line+_count_lines(self.path, self.base.offset, self.ranges[i][0])
+
+    def results(self, i: int, result: _RangeResult) -> Iterator[Any]:
+        """ Yields the objects decoded from range number `i`, applying the error policy to the records which failed to decode and advancing the checkpoint. """
+        stream = self.stream
+        first_line = self.first_line(i) if result.failed or self.ordered else 0
+        failed = iter(result.failed)
+        pending = next(failed, None)
+        for obj, lineno, end in zip(result.objs, result.lines, result.ends):
+            while pending is not None and pending[0] < lineno:
+                self._failed(first_line, pending)
+                pending = next(failed, None)
+            if self.ordered:
+                stream.checkpoint = Checkpoint(end, stream.checkpoint.record+1, first_line+lineno)
+            yield obj
+        while pending is not None:
+            self._failed(first_line, pending)
+            pending = next(failed, None)
+        self.completed[i] = (result.nlines, len(result.objs))
+        while self.next_range in self.completed:
+            # the checkpoint advances over the completed ranges preceding all ranges not yet completed
+            nlines, nobjs = self.completed.pop(self.next_range)
+            self.prefix_lines += nlines
+            self.prefix_records += nobjs
+            stream.checkpoint = Checkpoint(self.ranges[self.next_range][1], self.prefix_records, self.prefix_lines)
+            self.next_range += 1
+
+    def _failed(self, first_line: int, failed: Tuple[int, int, int, Exception]) -> None:
+        """ Applies the error policy to a record which failed to decode, advancing the checkpoint past the record unless the error is raised. """
+        lineno, start, end, e = failed
+        _record_error(self.stream, self.errors, e, first_line+lineno, start)
+        if self.ordered:
+            self.stream.checkpoint = Checkpoint(end, self.stream.checkpoint.record, first_line+lineno)
+
+
+def _load_lines_parallel(stream: LineStream, path: str, decoded_type: Type, ranges: List[Tuple[int, int]], workers: int, ordered: bool, errors: str, kwargs: Dict[str, Any]) -> Iterator[Any]:
+    # pylint: disable = too-many-arguments, too-many-locals
+    state = _ParallelState(stream, path, ranges, ordered, errors)
+    if workers == 1:
+        for i, (start, end) in enumerate(ranges):
+            yield from state.results(i, _decode_range(path, start, end, decoded_type, errors, kwargs))
+        return
+    executor = ProcessPoolExecutor(workers)
+    futures: Dict[Future, int] = {}
+    order: Deque[Future] = deque()
+    submitted = 0
+    completed = False
+    def submit() -> None:
+        nonlocal submitted
+        while submitted < len(ranges) and len(futures) < 2*workers:
+            start, end = ranges[submitted]
+            future = executor.submit(_decode_range, path, start, end, decoded_type, errors, kwargs)
+            futures[future] = submitted
+            if ordered:
+                order.append(future)
+            submitted += 1
+    try:
+        submit()
+        while futures:
+            if ordered:
+                done = [order.popleft()]
+            else:
+                done = sorted(wait(futures, return_when=FIRST_COMPLETED)[0], key=futures.__getitem__)
+            for future in done:
+                i = futures.pop(future)
+                yield from state.results(i, future.result())
+            submit()
+        completed = True
+    finally:
+        if completed:
+            executor.shutdown(wait=True)
+        else:
+            # ranges not yet started are not decoded if the consumer stops early or an error is raised
+            _terminate(executor, futures)
+
+
+def _terminate(executor: ProcessPoolExecutor, futures: Dict[Future, int]) -> None:
+    """
+        Cancels the pending `futures` and terminates the worker processes of `executor`, without waiting for the ranges being decoded
+        (waiting for them can deadlock on Python 3.7 once the consumer has stopped): the executor then finds itself broken and shuts down at once.
+    """
+    for future in futures:
+        future.cancel()
+    futures.clear()
+    processes = list((getattr(executor, "_processes", None) or {}).values())
+    for process in processes:
+        process.terminate()
+    for process in processes:
+        process.join()
+    executor.shutdown(wait=True)
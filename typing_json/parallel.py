@@ -0,0 +1,117 @@
+#pylint:disable = line-too-long, invalid-name
+"""
+    The `typing_json.parallel` module provides parallel JSON encoding of a single large collection.
+
+    The function `typing_json.parallel.dumps_parallel` splits the top-level collection (a list, tuple, deque or dictionary) into slices,
+    which are encoded to text fragments by the workers of a thread or process pool, each with `typing_json.dumps`.
+    The fragments are then concatenated with the item separator and indentation of the whole document, so that the output is identical to that of `typing_json.dumps`.
+
+    Collections of other types, too small to be split, or encoded with options which do not encode elements independently (e.g. `columnar=True`,
+    or `sort_keys=True` for dictionaries without string keys) are encoded by `typing_json.dumps` in the calling thread.
+
+    (Version: 0.1.3)
+"""
+
+# standard imports
+from collections import deque, OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+import os
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+# internal imports
+from typing_json import dumps
+from typing_json.encoding import is_json_encodable
+
+
+EXECUTORS: Tuple[str, ...] = ("thread", "process")
+""" The kinds of executors created by `typing_json.parallel.dumps_parallel`. """
+
+
+def _collection_kind(t: Type) -> Optional[type]:
+    """ The class of the slices into which instances of `t` are split (`list`, `tuple`, `deque`, `dict` or `collections.OrderedDict`), or `None` if they are not split. """
+    if not hasattr(t, "__origin__") or not hasattr(t, "__args__"):
+        return None
+    if t.__origin__ in (list, deque):
+        return t.__origin__
+    if t.__origin__ is tuple and len(t.__args__) == 2 and t.__args__[1] is ...:
+        return tuple
+    if t.__origin__ is OrderedDict:
+        return OrderedDict
+    if t.__origin__ in (dict, Mapping):
+        return dict
+    return None
+
+
+def _framing(kwargs: Dict[str, Any]) -> Tuple[str, str]:
+    """ The item separator and the newline-and-indentation preceding each top-level item, for the formatting options of `json.dumps` in `kwargs`. """
+    indent = kwargs.get("indent")
+    separators = kwargs.get("separators")
+    if separators is not None:
+        item_separator = separators[0]
+    else:
+        item_separator = ", " if indent is None else ","
+    if indent is None:
+        return item_separator, ""
+    return item_separator, "\n"+(" "*indent if isinstance(indent, int) else indent)
+
+
+def _encode_slice(obj: Any, encoded_type: Type, kwargs: Dict[str, Any]) -> str:
+    """ Encodes the non-empty slice `obj` with `typing_json.dumps`, returning the encoded items without the surrounding brackets, newlines and indentation. """
+    s = dumps(obj, encoded_type, **kwargs)
+    _, newline_indent = _framing(kwargs)
+    return s[1+len(newline_indent):-2 if newline_indent else -1]
+
+
+def dumps_parallel(obj: Any, encoded_type: Type, workers: Optional[int] = None, executor: Union[str, Executor] = "thread", chunk_size: Optional[int] = None, **kwargs) -> str:
+    """
+        Encodes `obj` with `typing_json.dumps` using `encoded_type` as a type hint (the keyword arguments `kwargs` are passed to `typing_json.dumps`),
+        splitting the top-level collection into slices of `chunk_size` elements (by default, four slices per worker) which are encoded in parallel.
+        The output is identical to that of `typing_json.dumps(obj, encoded_type, **kwargs)`, except that validation policies (cf.&nbsp;`typing_json.validation`)
+        apply to each slice separately.
+
+        The optional parameter `executor` is either `"thread"` (default) or `"process"`, in which case a pool of `workers` threads or processes is created
+        (by default, as many as CPUs), or an existing `concurrent.futures.Executor`. For processes, `obj`, `encoded_type` and `kwargs` must be picklable.
+
+        Raises `TypeError` if `encoded_type` is not JSON-encodable, and `ValueError` if `executor` is not valid or `workers` or `chunk_size` is not positive.
+    """
+    # pylint: disable = too-many-arguments
+    if not is_json_encodable(encoded_type):
+        raise TypeError("Type %s is not json-encodable."%str(encoded_type))
+    if not isinstance(executor, Executor) and executor not in EXECUTORS:
+        raise ValueError("Executor must be one of %s or a concurrent.futures.Executor, found %s instead."%(str(EXECUTORS), repr(executor)))
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("Number of workers must be positive, found %d instead."%workers)
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError("Chunk size must be positive, found %d instead."%chunk_size)
+    kind = _collection_kind(encoded_type)
+    if kind is None or not isinstance(obj, encoded_type.__origin__) or kwargs.get("columnar") or kwargs.get("backend") is not None:
+        # not a collection which can be split (including objects of the wrong type, for which `typing_json.dumps` raises the error),
+        # or elements not encoded independently of each other
+        return dumps(obj, encoded_type, **kwargs)
+    items: List[Any]
+    if kind in (dict, OrderedDict):
+        items = list(obj.items())
+        if kwargs.get("sort_keys"):
+            if encoded_type.__args__[0] is not str or not all(isinstance(k, str) for k, _ in items):
+                # the order of other keys depends on their encoding
+                return dumps(obj, encoded_type, **kwargs)
+            items.sort(key=lambda item: item[0])
+    else:
+        items = list(obj)
+    if chunk_size is None:
+        chunk_size = max(1, -(-len(items)//(4*workers)))
+    if len(items) <= chunk_size:
+        return dumps(obj, encoded_type, **kwargs)
+    slices = [kind(items[i:i+chunk_size]) for i in range(0, len(items), chunk_size)]
+    if isinstance(executor, Executor):
+        fragments = list(executor.map(_encode_slice, slices, [encoded_type]*len(slices), [kwargs]*len(slices)))
+    else:
+        pool_class = ThreadPoolExecutor if executor == "thread" else ProcessPoolExecutor
+        with pool_class(workers) as pool:
+            fragments = list(pool.map(_encode_slice, slices, [encoded_type]*len(slices), [kwargs]*len(slices)))
+    item_separator, newline_indent = _framing(kwargs)
+    opening, closing = ("{", "}") if kind in (dict, OrderedDict) else ("[", "]")
+    return opening+newline_indent+(item_separator+newline_indent).join(fragments)+("\n" if newline_indent else "")+closing
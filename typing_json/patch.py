@@ -0,0 +1,230 @@
+#pylint:disable = line-too-long, invalid-name
+"""
+    The `typing_json.patch` module provides typed diffs and patches between values of the same type.
+
+    The function `typing_json.patch.diff` computes a patch turning an instance `old` of a type `t` into another instance `new` of `t`,
+    and the function `typing_json.patch.apply_patch` applies it. Patches are JSON objects, guided by the structure of `t`:
+
+    - `{}` leaves the value unchanged;
+    - `{"=": val}` replaces the value by the value JSON-encoded as `val` (cf.&nbsp;`typing_json.encoding.to_json_obj`);
+    - for namedtuples and typed dicts, `{".": {field: patch, ...}, "-": [field, ...]}` patches the given fields and removes the given fields
+      (only non-total typed dicts can have fields removed);
+    - for dictionaries and mappings, `{".": [[key, patch], ...], "-": [key, ...]}` patches (or adds) the values for the given keys and removes the given keys,
+      where keys are JSON-encoded (and not stringified, regardless of their type);
+    - for lists, deques and tuples, `{".": [[index, patch], ...]}` patches the elements at the given indices (collections of different lengths are replaced);
+    - for sets and frozensets, `{"+": [element, ...], "-": [element, ...]}` adds and removes the given JSON-encoded elements.
+
+    Unchanged parts of the values are skipped by `typing_json.patch.diff` (in constant time if they are the same object, e.g. for unchanged fields of
+    namedtuples produced by `_replace`), and `typing_json.patch.apply_patch` only decodes (and hence validates) the values in the patch:
+    the size of the patch and the cost of applying it scale with the size of the change, not with the size of the values.
+
+    (Version: 0.1.3)
+"""
+
+# standard imports
+from collections import deque, OrderedDict
+from collections.abc import Mapping
+from decimal import Decimal
+from typing import Any, Dict, Optional, Type, Union
+
+# internal imports
+from typing_json.decoding import from_json_obj
+from typing_json.encoding import to_json_obj
+from typing_json.typechecking import is_instance, is_namedtuple, is_typed_dict, short_str
+
+
+def _identical(old: Any, new: Any) -> bool:
+    """ Whether `old` and `new` have the same JSON encoding as leaf values (e.g. `True == 1` and `Decimal("1.0") == Decimal("1.00")`, but they are not identical). """
+    if old is new:
+        return True
+    if old.__class__ is not new.__class__ or old != new:
+        return False
+    return not isinstance(old, (Decimal, float)) or str(old) == str(new)
+
+
+def _union_member(obj: Any, t: Type) -> Optional[Type]:
+    """ Returns the generic type argument of union type `t` used to encode `obj`. """
+    for s in t.__args__:
+        if is_instance(obj, s):
+            return s
+    return None
+
+
+def _replace(new: Any, t: Type, use_decimal: bool) -> Dict[str, Any]:
+    return {"=": to_json_obj(new, t, use_decimal=use_decimal)}
+
+
+def diff(old: Any, new: Any, t: Type, use_decimal: bool = False) -> Dict[str, Any]:
+    """
+        Returns a patch turning the instance `old` of type `t` into the instance `new` of type `t` (cf.&nbsp;the module documentation).
+        Values in the patch are JSON-encoded by `typing_json.encoding.to_json_obj`, to which the optional parameter `use_decimal` is passed.
+        Raises `TypeError` if some value in the patch is not of the expected type.
+    """
+    return _diff(old, new, t, use_decimal)
+
+
+def _diff(old: Any, new: Any, t: Type, use_decimal: bool) -> Dict[str, Any]:
+    # pylint: disable = too-many-return-statements, too-many-branches
+    if old is new:
+        return {}
+    if is_namedtuple(t):
+        field_types = getattr(t, "_field_types")
+        changes = {}
+        for field, field_type in field_types.items():
+            field_patch = _diff(getattr(old, field), getattr(new, field), field_type, use_decimal)
+            if field_patch:
+                changes[field] = field_patch
+        return {".": changes} if changes else {}
+    if is_typed_dict(t):
+        field_types = getattr(t, "__annotations__")
+        changes = {}
+        for field in new:
+            field_patch = _diff(old[field], new[field], field_types[field], use_decimal) if field in old else _replace(new[field], field_types[field], use_decimal)
+            if field_patch:
+                changes[field] = field_patch
+        removed = [field for field in old if field not in new]
+        return _patch(changes, None, removed)
+    if hasattr(t, "__origin__") and hasattr(t, "__args__"):
+        if t.__origin__ is Union:
+            member = _union_member(new, t)
+            if member is not None and member is _union_member(old, t):
+                return _diff(old, new, member, use_decimal)
+            return _replace(new, t, use_decimal)
+        if t.__origin__ in (list, deque, tuple):
+            if len(old) != len(new) or old.__class__ is not new.__class__:
+                return _replace(new, t, use_decimal)
+            variadic = t.__origin__ is not tuple or (len(t.__args__) == 2 and t.__args__[1] is ...)
+            element_changes = []
+            for i, (old_el, new_el) in enumerate(zip(old, new)):
+                element_patch = _diff(old_el, new_el, t.__args__[0] if variadic else t.__args__[i], use_decimal)
+                if element_patch:
+                    element_changes.append([i, element_patch])
+            return {".": element_changes} if element_changes else {}
+        if t.__origin__ in (set, frozenset):
+            added = [to_json_obj(el, t.__args__[0], use_decimal=use_decimal) for el in new if el not in old]
+            removed = [to_json_obj(el, t.__args__[0], use_decimal=use_decimal) for el in old if el not in new]
+            return _patch(None, added, removed)
+        if t.__origin__ in (dict, OrderedDict, Mapping):
+            key_t, value_t = t.__args__
+            if t.__origin__ is OrderedDict and list(new) != [k for k in old if k in new]+[k for k in new if k not in old]:
+                # the order of keys in ordered dictionaries changed in a way that patching cannot reproduce
+                return _replace(new, t, use_decimal)
+            key_changes = []
+            for key, val in new.items():
+                value_patch = _diff(old[key], val, value_t, use_decimal) if key in old else _replace(val, value_t, use_decimal)
+                if value_patch:
+                    key_changes.append([to_json_obj(key, key_t, use_decimal=use_decimal), value_patch])
+            removed = [to_json_obj(key, key_t, use_decimal=use_decimal) for key in old if key not in new]
+            return _patch(key_changes, None, removed)
+    if _identical(old, new):
+        return {}
+    return _replace(new, t, use_decimal)
+
+
+def _patch(changes, added, removed) -> Dict[str, Any]:
+    """ Assembles a patch from its non-empty parts. """
+    patch: Dict[str, Any] = {}
+    if changes:
+        patch["."] = changes
+    if added:
+        patch["+"] = added
+    if removed:
+        patch["-"] = removed
+    return patch
+
+
+def apply_patch(obj: Any, patch: Dict[str, Any], t: Type, **decode_kwargs) -> Any:
+    """
+        Applies a patch produced by `typing_json.patch.diff` to the instance `obj` of type `t`, returning the patched value.
+
+        Mutable values (lists, deques, sets, dictionaries and typed dicts) are patched in place, while immutable values (namedtuples, tuples and frozensets)
+        are rebuilt with only the changed parts replaced. The values in the patch are decoded (and hence validated) by `typing_json.decoding.from_json_obj`,
+        to which the keyword arguments `decode_kwargs` are passed: the rest of `obj` is neither copied nor validated.
+
+        Raises `TypeError` if the patch is malformed or does not match type `t` and value `obj` (in which case `obj` may have been partially patched).
+    """
+    return _apply(obj, patch, t, decode_kwargs)
+
+
+def _apply(obj: Any, patch: Any, t: Type, decode_kwargs: Dict[str, Any]) -> Any:
+    # pylint: disable = too-many-return-statements, too-many-branches
+    if not isinstance(patch, dict) or not set(patch.keys()) <= {"=", ".", "+", "-"}:
+        raise TypeError("Patch %s is malformed (t=%s)."%(short_str(patch), str(t)))
+    if not patch:
+        return obj
+    if "=" in patch:
+        if len(patch) > 1:
+            raise TypeError("Patch %s is malformed: replacements cannot be combined with other changes (t=%s)."%(short_str(patch), str(t)))
+        return from_json_obj(patch["="], t, **decode_kwargs)
+    changes = patch.get(".")
+    added = patch.get("+", [])
+    removed = patch.get("-", [])
+    if is_namedtuple(t):
+        field_types = getattr(t, "_field_types")
+        changes = {} if changes is None else changes
+        if added or removed or not isinstance(changes, dict) or not set(changes.keys()) <= set(field_types.keys()):
+            raise TypeError("Patch %s is malformed for namedtuple type t=%s."%(short_str(patch), str(t)))
+        return obj._replace(**{field: _apply(getattr(obj, field), field_patch, field_types[field], decode_kwargs) for field, field_patch in changes.items()})
+    if is_typed_dict(t):
+        field_types = getattr(t, "__annotations__")
+        changes = {} if changes is None else changes
+        if added or not isinstance(changes, dict) or not set(changes.keys()) <= set(field_types.keys()) or not set(removed) <= set(field_types.keys()):
+            raise TypeError("Patch %s is malformed for typed dict type t=%s."%(short_str(patch), str(t)))
+        if removed and getattr(t, "__total__"):
+            raise TypeError("Patch %s removes fields from total typed dict type t=%s."%(short_str(patch), str(t)))
+        for field, field_patch in changes.items():
+            obj[field] = _apply_new_or_existing(obj, field, field_patch, field_types[field], decode_kwargs)
+        for field in removed:
+            obj.pop(field, None)
+        return obj
+    if hasattr(t, "__origin__") and hasattr(t, "__args__"):
+        if t.__origin__ is Union:
+            member = _union_member(obj, t)
+            if member is None:
+                raise TypeError("Object %s is not of type %s."%(short_str(obj), str(t)))
+            return _apply(obj, patch, member, decode_kwargs)
+        if t.__origin__ in (list, deque, tuple):
+            if added or removed or not isinstance(changes, list):
+                raise TypeError("Patch %s is malformed for collection type t=%s."%(short_str(patch), str(t)))
+            variadic = t.__origin__ is not tuple or (len(t.__args__) == 2 and t.__args__[1] is ...)
+            changes = [] if changes is None else changes
+            patched = obj if t.__origin__ is not tuple else list(obj)
+            for change in changes:
+                if not isinstance(change, list) or len(change) != 2 or not isinstance(change[0], int) or not 0 <= change[0] < len(obj):
+                    raise TypeError("Patch %s has malformed change %s for collection %s (t=%s)."%(short_str(patch), short_str(change), short_str(obj), str(t)))
+                i, element_patch = change
+                patched[i] = _apply(obj[i], element_patch, t.__args__[0] if variadic else t.__args__[i], decode_kwargs)
+            return patched if t.__origin__ is not tuple else tuple(patched)
+        if t.__origin__ in (set, frozenset):
+            if changes or not isinstance(added, list) or not isinstance(removed, list):
+                raise TypeError("Patch %s is malformed for set type t=%s."%(short_str(patch), str(t)))
+            added_elements = [from_json_obj(el, t.__args__[0], **decode_kwargs) for el in added]
+            removed_elements = [from_json_obj(el, t.__args__[0], **decode_kwargs) for el in removed]
+            if t.__origin__ is frozenset:
+                return (obj - frozenset(removed_elements)) | frozenset(added_elements)
+            obj.difference_update(removed_elements)
+            obj.update(added_elements)
+            return obj
+        if t.__origin__ in (dict, OrderedDict, Mapping):
+            key_t, value_t = t.__args__
+            changes = [] if changes is None else changes
+            if added or not isinstance(changes, list) or not isinstance(removed, list):
+                raise TypeError("Patch %s is malformed for dictionary type t=%s."%(short_str(patch), str(t)))
+            for change in changes:
+                if not isinstance(change, list) or len(change) != 2:
+                    raise TypeError("Patch %s has malformed change %s (t=%s)."%(short_str(patch), short_str(change), str(t)))
+                key = from_json_obj(change[0], key_t, **decode_kwargs)
+                obj[key] = _apply_new_or_existing(obj, key, change[1], value_t, decode_kwargs)
+            for key in removed:
+                obj.pop(from_json_obj(key, key_t, **decode_kwargs), None)
+            return obj
+    raise TypeError("Patch %s is malformed for type %s: only replacements are allowed."%(short_str(patch), str(t)))
+
+
+def _apply_new_or_existing(obj: Any, key: Any, patch: Any, t: Type, decode_kwargs: Dict[str, Any]) -> Any:
+    """ Applies `patch` to the value for `key` in the dictionary `obj`, or decodes the new value for `key` if `obj` has none. """
+    if key in obj:
+        return _apply(obj[key], patch, t, decode_kwargs)
+    if not isinstance(patch, dict) or set(patch.keys()) != {"="}:
+        raise TypeError("Patch %s for missing key %s must be a replacement (t=%s)."%(short_str(patch), short_str(key), str(t)))
+    return from_json_obj(patch["="], t, **decode_kwargs)
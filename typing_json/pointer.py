@@ -0,0 +1,235 @@
+#pylint:disable = line-too-long, invalid-name
+"""
+    The `typing_json.pointer` module provides typed JSON Pointer access (RFC 6901) to JSON documents, without decoding the whole document.
+
+    The function `typing_json.pointer.get_path` walks the type of the document along the pointer to determine the type of the value pointed to,
+    scans the JSON text to locate that value (skipping over all other values without parsing them into Python objects),
+    and then parses and decodes only the value located, using `typing_json.decoding.from_json_obj`.
+
+    Pointer tokens are interpreted according to the type being walked:
+
+    - for namedtuples and typed dicts, tokens are field names (namedtuples encoded as lists are also supported);
+    - for lists, deques, sets, frozensets and tuples, tokens are non-negative decimal indices;
+    - for dictionaries and mappings, tokens are keys: for key types which are stringified in the JSON encoding (cf.&nbsp;`typing_json.encoding.to_json_obj`),
+      the token is the stringified key (e.g. `"[1, 2]"` for a key `(1, 2)` of type `Tuple[int, int]`), matched by value rather than by text;
+    - for unions, the generic type arguments are tried in order (a pointer missing from the document for one type is looked up for the next).
+
+    (Version: 0.1.3)
+"""
+
+# standard imports
+from collections import deque, OrderedDict
+from collections.abc import Mapping
+from decimal import Decimal
+from enum import EnumMeta
+import json
+from json.decoder import scanstring # type: ignore
+import re
+from typing import Any, List, Optional, Tuple, Type, Union
+
+# external dependencies
+from typing_extensions import Literal
+
+# internal imports
+from typing_json.aliases import wire_key
+from typing_json.decoding import from_json_obj
+from typing_json.encoding import to_json_obj
+from typing_json.typechecking import is_namedtuple, is_typed_dict, JSON_BASE_TYPES
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRING = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
+_STRUCTURAL = re.compile(r'[\[\]{}"]')
+_SCALAR = re.compile(r'[^,\]}\s]+')
+
+
+def parse_pointer(pointer: str) -> List[str]:
+    """ Parses a JSON Pointer (RFC 6901) such as `"/orders/123/total"` into its list of (unescaped) reference tokens. """
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise ValueError("JSON pointer %s must be empty or start with '/'."%repr(pointer))
+    return [token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")]
+
+
+def _skip_whitespace(s: str, pos: int) -> int:
+    return _WHITESPACE.match(s, pos).end() # type: ignore
+
+
+def _skip_value(s: str, pos: int) -> int:
+    """ Returns the position immediately after the JSON value starting at position `pos` of `s` (no whitespace), without parsing it. """
+    c = s[pos:pos+1]
+    if c == '"':
+        match = _STRING.match(s, pos)
+        if match is None:
+            raise json.JSONDecodeError("Unterminated string", s, pos)
+        return match.end()
+    if c in ("[", "{"):
+        depth = 0
+        while True:
+            match = _STRUCTURAL.search(s, pos)
+            if match is None:
+                raise json.JSONDecodeError("Unterminated array or object", s, pos)
+            c = match.group()
+            if c == '"':
+                pos = _skip_value(s, match.start())
+                continue
+            pos = match.end()
+            depth += 1 if c in ("[", "{") else -1
+            if depth == 0:
+                return pos
+    match = _SCALAR.match(s, pos)
+    if match is None:
+        raise json.JSONDecodeError("Expecting value", s, pos)
+    return match.end()
+
+
+def _members(s: str, pos: int):
+    """ Iterates over the members of the JSON object starting at position `pos` of `s`, yielding pairs `(key, value_pos)`. """
+    pos = _skip_whitespace(s, pos+1)
+    if s[pos:pos+1] == "}":
+        return
+    while True:
+        if s[pos:pos+1] != '"':
+            raise json.JSONDecodeError("Expecting property name enclosed in double quotes", s, pos)
+        key, pos = scanstring(s, pos+1)
+        pos = _skip_whitespace(s, pos)
+        if s[pos:pos+1] != ":":
+            raise json.JSONDecodeError("Expecting ':' delimiter", s, pos)
+        pos = _skip_whitespace(s, pos+1)
+        yield key, pos
+        pos = _skip_whitespace(s, _skip_value(s, pos))
+        if s[pos:pos+1] == "}":
+            return
+        if s[pos:pos+1] != ",":
+            raise json.JSONDecodeError("Expecting ',' delimiter", s, pos)
+        pos = _skip_whitespace(s, pos+1)
+
+
+def _elements(s: str, pos: int):
+    """ Iterates over the elements of the JSON array starting at position `pos` of `s`, yielding their starting positions. """
+    pos = _skip_whitespace(s, pos+1)
+    if s[pos:pos+1] == "]":
+        return
+    while True:
+        yield pos
+        pos = _skip_whitespace(s, _skip_value(s, pos))
+        if s[pos:pos+1] == "]":
+            return
+        if s[pos:pos+1] != ",":
+            raise json.JSONDecodeError("Expecting ',' delimiter", s, pos)
+        pos = _skip_whitespace(s, pos+1)
+
+
+def _find_member(s: str, pos: int, token: str, t: Type, key_matches=None) -> int:
+    """ Returns the position of the value of the member with key `token` in the JSON object at `pos`, raising `KeyError` if there is none. """
+    if s[pos:pos+1] != "{":
+        raise TypeError("Value at position %d is not a JSON object (t=%s)."%(pos, str(t)))
+    for key, value_pos in _members(s, pos):
+        if key == token or (key_matches is not None and key_matches(key)):
+            return value_pos
+    raise KeyError(token)
+
+
+def _find_element(s: str, pos: int, token: str, t: Type) -> int:
+    """ Returns the position of the element with index `token` in the JSON array at `pos`, raising `KeyError` if there is none. """
+    if s[pos:pos+1] != "[":
+        raise TypeError("Value at position %d is not a JSON array (t=%s)."%(pos, str(t)))
+    if not token.isdigit() or (len(token) > 1 and token[0] == "0"):
+        raise TypeError("Pointer token %s is not an array index (t=%s)."%(repr(token), str(t)))
+    index = int(token)
+    for i, element_pos in enumerate(_elements(s, pos)):
+        if i == index:
+            return element_pos
+    raise KeyError(token)
+
+
+def _get(s: str, pos: int, t: Type, tokens: List[str], decode_kwargs) -> Any:
+    # pylint: disable = too-many-return-statements, too-many-branches, too-many-locals
+    if not tokens:
+        obj, _ = json.JSONDecoder(parse_float=Decimal, object_pairs_hook=OrderedDict).raw_decode(s, pos)
+        return from_json_obj(obj, t, **decode_kwargs)
+    token, tokens = tokens[0], tokens[1:]
+    if is_namedtuple(t):
+        fields = getattr(t, "_fields")
+        field_types = getattr(t, "_field_types")
+        field_defaults = getattr(t, "_field_defaults")
+        if token not in field_types:
+            raise TypeError("Pointer token %s is not a field of namedtuple type t=%s."%(repr(token), str(t)))
+        try:
+            if s[pos:pos+1] == "[":
+                value_pos = _find_element(s, pos, str(fields.index(token)), t)
+            else:
+                value_pos = _find_member(s, pos, wire_key(t, token), t)
+        except KeyError:
+            if token not in field_defaults:
+                raise
+            if not tokens:
+                # the value of a missing field is its default value, as in a full decode
+                return field_defaults[token]
+            # the default value is re-encoded (with the caller's enum encoding) to be walked by the remaining tokens
+            encoded = to_json_obj(field_defaults[token], field_types[token], enum_encoding=decode_kwargs.get("enum_encoding"))
+            return _get(json.dumps(encoded), 0, field_types[token], tokens, decode_kwargs)
+        return _get(s, value_pos, field_types[token], tokens, decode_kwargs)
+    if is_typed_dict(t):
+        field_types = getattr(t, "__annotations__")
+        if token not in field_types:
+            raise TypeError("Pointer token %s is not a field of typed dict type t=%s."%(repr(token), str(t)))
+        return _get(s, _find_member(s, pos, wire_key(t, token), t), field_types[token], tokens, decode_kwargs)
+    if hasattr(t, "__origin__") and hasattr(t, "__args__"):
+        if t.__origin__ is Union:
+            missing: Optional[KeyError] = None
+            for member in t.__args__:
+                if member in (None, type(None)):
+                    continue
+                try:
+                    return _get(s, pos, member, [token]+tokens, decode_kwargs)
+                except KeyError as e:
+                    # the pointer may still exist in the document for one of the other types
+                    missing = e
+                except TypeError:
+                    continue
+            if missing is not None:
+                raise missing
+            raise TypeError("Pointer token %s cannot be resolved in any of the types in %s."%(repr(token), str(t)))
+        if t.__origin__ in (list, deque, set, frozenset):
+            return _get(s, _find_element(s, pos, token, t), t.__args__[0], tokens, decode_kwargs)
+        if t.__origin__ is tuple:
+            if len(t.__args__) == 2 and t.__args__[1] is ...:
+                return _get(s, _find_element(s, pos, token, t), t.__args__[0], tokens, decode_kwargs)
+            if not token.isdigit() or int(token) >= len(t.__args__):
+                raise TypeError("Pointer token %s is not an index for tuple type t=%s."%(repr(token), str(t)))
+            return _get(s, _find_element(s, pos, token, t), t.__args__[int(token)], tokens, decode_kwargs)
+        if t.__origin__ in (dict, OrderedDict, Mapping):
+            key_t = t.__args__[0]
+            if key_t in JSON_BASE_TYPES or key_t is Decimal or isinstance(key_t, EnumMeta) or (hasattr(key_t, "__origin__") and key_t.__origin__ is Literal):
+                # keys which are not stringified are matched by text
+                return _get(s, _find_member(s, pos, token, t), t.__args__[1], tokens, decode_kwargs)
+            # stringified keys are matched by value, so that the pointer token does not need to match the exact stringification
+            try:
+                key = from_json_obj(json.loads(token, parse_float=Decimal, object_pairs_hook=OrderedDict), key_t)
+            except ValueError as e:
+                raise TypeError("Pointer token %s is not a stringified key of type %s."%(repr(token), str(key_t))) from e
+            def key_matches(json_key: str) -> bool:
+                try:
+                    return from_json_obj(json.loads(json_key, parse_float=Decimal, object_pairs_hook=OrderedDict), key_t) == key
+                except (TypeError, ValueError):
+                    return False
+            return _get(s, _find_member(s, pos, token, t, key_matches), t.__args__[1], tokens, decode_kwargs)
+    raise TypeError("Pointer token %s cannot be resolved in values of type %s."%(repr(token), str(t)))
+
+
+def get_path(source: Union[str, bytes, bytearray], t: Type, pointer: str, **decode_kwargs) -> Any:
+    """
+        Returns the value pointed to by the JSON Pointer `pointer` (e.g. `"/orders/123/total"`) in the JSON document `source` (text or UTF-8/16/32 bytes),
+        decoded with the type obtained by walking `t` along the pointer. Only the value pointed to is parsed and decoded, by `typing_json.decoding.from_json_obj`
+        (to which the keyword arguments `decode_kwargs` are passed, e.g. `cast_decimal`), while the rest of the document is only scanned.
+
+        Raises `KeyError` if the pointer does not exist in the document, `TypeError` if the pointer cannot be resolved in type `t` or if the document
+        does not match `t` along the pointer, and `json.JSONDecodeError` if the document is malformed along the pointer.
+        Missing fields of namedtuples resolve to their default values.
+    """
+    if isinstance(source, (bytes, bytearray)):
+        source = source.decode(json.detect_encoding(source), "surrogatepass")
+    pos = _skip_whitespace(source, 0)
+    return _get(source, pos, t, parse_pointer(pointer), decode_kwargs)
@@ -0,0 +1,220 @@
+#pylint:disable = line-too-long, invalid-name
+"""
+    The `typing_json.projection` module provides projection decoding: decoding and validating only selected paths of a JSON object.
+
+    Paths are strings of segments separated by dots, such as `"header.id"` or `"items[*].price"`:
+
+    - a name segment `field` selects a field of a namedtuple or typed dict, or a key of a dictionary/mapping (using the JSON key string);
+    - an index segment `[i]` selects the element at index `i` of a list, deque or tuple (negative indices are not allowed);
+    - a wildcard segment `[*]` (or `.*`) selects all elements of a list, deque or variadic tuple, or all values of a dictionary/mapping.
+
+    The result of a projection is a partial object, made of nested dictionaries mirroring the selected paths:
+
+    - namedtuples, typed dicts and dictionaries are projected to dictionaries containing the selected fields/keys;
+    - collections selected by wildcard are projected to lists (or to dictionaries, for dictionaries/mappings);
+    - collections selected by index are projected to dictionaries mapping the selected indices to the projected elements;
+    - the value at the end of each path is decoded in full by `typing_json.decoding.from_json_obj`.
+
+    Only the selected values are decoded and validated: the rest of the JSON object is only checked where it lies along a selected path
+    (e.g. that namedtuple fields exist and that lists are lists). Fields of namedtuples missing from the JSON object are projected from their default values,
+    and optional fields of non-total typed dicts missing from the JSON object are omitted from the projection.
+    When decoding with `columnar=True`, lists, deques and variadic tuples of records in columnar layout are projected as the corresponding lists of records.
+
+    (Version: 0.1.3)
+"""
+
+# standard imports
+from collections import deque, OrderedDict
+from collections.abc import Mapping
+import re
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+# internal imports
+from typing_json.aliases import wire_key
+from typing_json.decoding import from_json_obj_decoder
+from typing_json.encoding import is_columnar_record, to_json_obj
+from typing_json.typechecking import is_namedtuple, is_typed_dict, short_str
+
+
+Segment = Union[str, int]
+""" Type of path segments: field names/keys (`str`), indices (`int`) or the wildcard `ALL`. """
+
+ALL = "[*]"
+""" The wildcard path segment. """
+
+SelectionTree = Optional[Dict[Segment, Any]]
+""" Type of selection trees, mapping segments to selection subtrees (`None` selects the whole value). """
+
+_SEGMENT_REGEX = re.compile(r"\[(\*|[0-9]+)\]|\.?([^.\[\]]+)")
+
+
+def parse_path(path: str) -> Tuple[Segment, ...]:
+    """ Parses a path such as `"items[*].price"` into a tuple of segments, raising `ValueError` if the path is malformed. """
+    segments: List[Segment] = []
+    pos = 0
+    while pos < len(path):
+        match = _SEGMENT_REGEX.match(path, pos)
+        if match is None or (match.group(2) is not None and pos > 0 and path[pos] != "."):
+            raise ValueError("Malformed path %s at position %d."%(repr(path), pos))
+        index, name = match.groups()
+        if index is not None:
+            segments.append(ALL if index == "*" else int(index))
+        else:
+            segments.append(ALL if name == "*" else name)
+        pos = match.end()
+    if not segments:
+        raise ValueError("Path must be non-empty.")
+    return tuple(segments)
+
+
+def selection_tree(paths: Sequence[str]) -> Dict[Segment, Any]:
+    """ Merges the given paths into a selection tree (a path selecting a value overrides all longer paths through it). """
+    tree: Dict[Segment, Any] = {}
+    for path in paths:
+        segments = parse_path(path)
+        node = tree
+        for i, segment in enumerate(segments):
+            if i == len(segments)-1:
+                node[segment] = None
+            else:
+                if segment in node and node[segment] is None:
+                    break
+                node = node.setdefault(segment, {})
+    return tree
+
+
+def project(obj: Any, t: Type, select: Sequence[str], **decode_kwargs) -> Any:
+    """
+        Decodes the paths listed in `select` from the JSON object `obj`, assuming type `t`, into a partial object (cf.&nbsp;the module documentation).
+        The selected values are decoded as by `typing_json.decoding.from_json_obj`, with the keyword arguments `decode_kwargs`:
+        all selected values share a single resource budget for the `limits` option, and a single intern table for the `intern` option.
+
+        Raises `ValueError` if some path is malformed, and `TypeError` if some path does not exist in type `t` or if `obj` does not match `t` along the selected paths.
+    """
+    tree = selection_tree(select)
+    opts = _ProjectionOptions(from_json_obj_decoder(**decode_kwargs), decode_kwargs.get("enum_encoding"), decode_kwargs.get("columnar", False))
+    return _project(obj, t, tree, opts)
+
+
+class _ProjectionOptions:
+    """ Options shared by all recursive calls of a single `project` invocation. """
+    # pylint: disable = too-few-public-methods
+
+    __slots__ = ("decode", "enum_encoding", "columnar")
+
+    def __init__(self, decode: Callable[[Any, Type], Any], enum_encoding: Optional[str], columnar: bool):
+        self.decode = decode
+        self.enum_encoding = enum_encoding
+        self.columnar = columnar
+
+
+def _columnar_rows(obj: Any, element_t: Type) -> List[Dict[str, Any]]:
+    """ Turns the columnar layout `obj` of a list of records of type `element_t` into the list of records, keyed by wire keys. """
+    if not obj:
+        raise TypeError("Object %s has no columns, cannot determine number of records (t=%s)."%(short_str(obj), str(element_t)))
+    n = None
+    for key, column in obj.items():
+        if not isinstance(column, list):
+            raise TypeError("Column %s of object %s is not a list (t=%s)."%(key, short_str(obj), str(element_t)))
+        if n is None:
+            n = len(column)
+        elif len(column) != n:
+            raise TypeError("Column %s of object %s has length %d, expected %d (t=%s)."%(key, short_str(obj), len(column), n, str(element_t)))
+    return [{key: column[i] for key, column in obj.items()} for i in range(n or 0)]
+
+
+def _project(obj: Any, t: Type, tree: SelectionTree, opts: _ProjectionOptions) -> Any:
+    # pylint: disable = too-many-return-statements, too-many-branches
+    if tree is None:
+        return opts.decode(obj, t)
+    if is_namedtuple(t):
+        fields = getattr(t, "_fields")
+        field_types = getattr(t, "_field_types")
+        field_defaults = getattr(t, "_field_defaults")
+        if not isinstance(obj, (list, dict, OrderedDict)):
+            raise TypeError("Object %s is not a list or (ordered) dictionary (t=%s)."%(short_str(obj), str(t)))
+        projection: Dict[Segment, Any] = {}
+        for field, subtree in tree.items():
+            if not isinstance(field, str) or field not in field_types:
+                raise TypeError("Path segment %s is not a field of namedtuple type t=%s."%(str(field), str(t)))
+            if isinstance(obj, list):
+                i = fields.index(field)
+                present, val = i < len(obj), obj[i] if i < len(obj) else None
+            else:
+                key = wire_key(t, field)
+                present, val = key in obj, obj.get(key)
+            if not present:
+                if field not in field_defaults:
+                    raise TypeError("Object %s is missing field %s (t=%s)."%(short_str(obj), field, str(t)))
+                if subtree is None:
+                    # the default value is used as is, as when decoding the whole namedtuple
+                    projection[field] = field_defaults[field]
+                    continue
+                # paths inside the default value are projected from its encoding, with the same options used for decoding
+                val = to_json_obj(field_defaults[field], field_types[field], use_decimal=True, columnar=opts.columnar, enum_encoding=opts.enum_encoding)
+            projection[field] = _project(val, field_types[field], subtree, opts)
+        return projection
+    if is_typed_dict(t):
+        field_types = getattr(t, "__annotations__")
+        total = getattr(t, "__total__")
+        if not isinstance(obj, (dict, OrderedDict)):
+            raise TypeError("Object %s is not dict or OrderedDict (t=%s)."%(short_str(obj), str(t)))
+        projection = {}
+        for field, subtree in tree.items():
+            if not isinstance(field, str) or field not in field_types:
+                raise TypeError("Path segment %s is not a field of typed dict type t=%s."%(str(field), str(t)))
+            key = wire_key(t, field)
+            if key not in obj:
+                if total:
+                    raise TypeError("Key %s missing from object %s (typed dict is total, t=%s)"%(key, short_str(obj), str(t)))
+                continue
+            projection[field] = _project(obj[key], field_types[field], subtree, opts)
+        return projection
+    if hasattr(t, "__origin__") and hasattr(t, "__args__"):
+        if t.__origin__ is Union:
+            if obj is None and any(s in (None, type(None)) for s in t.__args__):
+                return None
+            for s in t.__args__:
+                if s in (None, type(None)):
+                    continue
+                try:
+                    return _project(obj, s, tree, opts)
+                except TypeError:
+                    continue
+            raise TypeError("Object %s cannot be projected to any of the types in %s."%(short_str(obj), str(t)))
+        if t.__origin__ in (list, deque, tuple):
+            variadic = t.__origin__ is not tuple or (len(t.__args__) == 2 and t.__args__[1] is ...)
+            if opts.columnar and variadic and isinstance(obj, (dict, OrderedDict)) and is_columnar_record(t.__args__[0]):
+                obj = _columnar_rows(obj, t.__args__[0])
+            if not isinstance(obj, list):
+                raise TypeError("Object %s is not list (t=%s)."%(short_str(obj), str(t)))
+            if not variadic and len(obj) != len(t.__args__):
+                raise TypeError("List %s is of incorrect length (t=%s)."%(short_str(obj), str(t)))
+            if ALL in tree:
+                if len(tree) > 1 or not variadic:
+                    raise TypeError("Wildcard cannot be combined with other segments, nor used on fixed-length tuples (t=%s)."%str(t))
+                return [_project(x, t.__args__[0], tree[ALL], opts) for x in obj]
+            projection = {}
+            for i, subtree in tree.items():
+                if not isinstance(i, int):
+                    raise TypeError("Path segment %s is not an index (t=%s)."%(str(i), str(t)))
+                if i >= len(obj):
+                    raise TypeError("Index %d out of range for object %s (t=%s)."%(i, short_str(obj), str(t)))
+                projection[i] = _project(obj[i], t.__args__[0] if variadic else t.__args__[i], subtree, opts)
+            return projection
+        if t.__origin__ in (dict, OrderedDict, Mapping):
+            if not isinstance(obj, (dict, OrderedDict)):
+                raise TypeError("Object %s is not dict or OrderedDict (t=%s)."%(short_str(obj), str(t)))
+            if ALL in tree:
+                if len(tree) > 1:
+                    raise TypeError("Wildcard cannot be combined with other segments (t=%s)."%str(t))
+                return {key: _project(val, t.__args__[1], tree[ALL], opts) for key, val in obj.items()}
+            projection = {}
+            for segment, subtree in tree.items():
+                if not isinstance(segment, str):
+                    raise TypeError("Path segment %s is not a key (t=%s)."%(str(segment), str(t)))
+                if segment not in obj:
+                    raise TypeError("Key %s missing from object %s (t=%s)."%(segment, short_str(obj), str(t)))
+                projection[segment] = _project(obj[segment], t.__args__[1], subtree, opts)
+            return projection
+    raise TypeError("Cannot select paths %s inside values of type %s."%(str(list(tree.keys())), str(t)))
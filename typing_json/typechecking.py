@@ -14,12 +14,16 @@ from collections import deque, OrderedDict
 from collections.abc import Mapping
 from decimal import Decimal
 from enum import EnumMeta
+from functools import lru_cache
 import textwrap
-from typing import Any, Callable, Optional, Tuple, Type, Union
+from typing import Any, Callable, Hashable, Optional, Tuple, Type, Union, cast
 
 # external dependencies
 from typing_extensions import Literal
 
+# internal imports
+from typing_json.validation import FULL_VALIDATION, ValidationPolicy, get_validation_policy, is_marked_validated, register_validated
+
 
 JSON_BASE_TYPES: Tuple[type, ...] = (bool, int, float, str, type(None))
 """ Base types for JSON. """
@@ -194,7 +198,7 @@ def _not_instance(message: str, failure_callback: Optional[Callable[[str], None]
     return False
 
 
-def is_instance(obj: Any, t: Type, failure_callback: Optional[Callable[[str], None]] = None, cast_decimal: bool = True) -> bool:
+def is_instance(obj: Any, t: Type, failure_callback: Optional[Callable[[str], None]] = None, cast_decimal: bool = True, validation: Optional[ValidationPolicy] = None) -> bool:
     """
         Checks whether an object `obj` is an instance of type `t`, extending the dynamical typechecking capabilities of the
         builtin `isinstance` to some of the `typing` generics and to certain types constructed with `typing.NamedTuple`.
@@ -225,8 +229,20 @@ def is_instance(obj: Any, t: Type, failure_callback: Optional[Callable[[str], No
         ```
 
         Literals in `typing_extensions.Literal` can only be of one of the JSON basic types `bool`, `int`, `float`, `str`, `NoneType`.
+
+        The optional parameter `validation` can be used to pass a `typing_json.validation.ValidationPolicy`, determining which elements of
+        collections are checked: if `None` (default), the process-wide policy is used (cf.&nbsp;`typing_json.validation.set_validation_policy`).
+
+        Immutable objects marked as valid instances of `t` by `typing_json.typechecking.mark_as_validated` are deemed instances of `t` without further checks.
+        Similarly, the deeply immutable elements of typed containers from `typing_json.containers` are not checked again when the container is checked against
+        a type with the same generic type arguments as the container, since they were validated on insertion.
     """
     # pylint: disable = too-many-return-statements, too-many-branches, too-many-statements
+    if validation is None:
+        validation = get_validation_policy()
+    if isinstance(obj, (tuple, frozenset)) and is_marked_validated(obj, t):
+        # object previously marked as validated for this type
+        return True
     if t in TYPECHECKABLE_BASE_TYPES:
         # for basic types, use builtin `isinstance`.
         if t == int and (obj is True or obj is False):
@@ -266,7 +282,7 @@ def is_instance(obj: Any, t: Type, failure_callback: Optional[Callable[[str], No
                 raise AssertionError(_UNREACHABLE_ERROR_MSG) # pragma: no cover
                 # return _not_instance("Value %s is not of type %s: missing field %s."%(short_str(obj), str(t), field), failure_callback=failure_callback)
             field_val = getattr(obj, field)
-            if not is_instance(field_val, field_types[field], failure_callback=failure_callback, cast_decimal=cast_decimal):
+            if not is_instance(field_val, field_types[field], failure_callback=failure_callback, cast_decimal=cast_decimal, validation=validation):
                 return _not_instance("Value %s is not of type %s: wrong type %s for field %s, expected %s."%(short_str(obj), str(t), str(type(field_val)), field, str(field_types[field])), failure_callback=failure_callback)
         return True
     if is_typed_dict(t, failure_callback=failure_callback):
@@ -280,14 +296,14 @@ def is_instance(obj: Any, t: Type, failure_callback: Optional[Callable[[str], No
                 return _not_instance("Value %s is not of type %s: missing field %s (typed dict is total)."%(short_str(obj), str(t), field), failure_callback=failure_callback)
             if field in obj:
                 field_val = obj[field]
-                if not is_instance(field_val, field_types[field], failure_callback=failure_callback, cast_decimal=cast_decimal):
+                if not is_instance(field_val, field_types[field], failure_callback=failure_callback, cast_decimal=cast_decimal, validation=validation):
                     return _not_instance("Value %s is not of type %s: wrong type %s for field %s, expected %s."%(short_str(obj), str(t), str(type(field_val)), field, str(field_types[field])), failure_callback=failure_callback)
         return True
     if hasattr(t, "__origin__") and hasattr(t, "__args__"):
         # Special cases for `typing` generics.
         if t.__origin__ is Union: # Union[T1, T2, ..., TN] or Optional[T]
             # For `typing.Union` (including `typing.Optional`), check that `obj` is instance of one of the type parameters of `typing.Union`.
-            if any(is_instance(obj, s, failure_callback=failure_callback, cast_decimal=cast_decimal) for s in t.__args__):
+            if any(is_instance(obj, s, failure_callback=failure_callback, cast_decimal=cast_decimal, validation=validation) for s in t.__args__):
                 return True
             return _not_instance("Value %s does not match any of the types in %s."%(short_str(obj), str(t)), failure_callback=failure_callback)
         if t.__origin__ is Literal: # Literal[val1, val2, ..., valN]
@@ -299,7 +315,7 @@ def is_instance(obj: Any, t: Type, failure_callback: Optional[Callable[[str], No
             # For `typing.List`, check that `obj` is a `list` and that all elements of `obj` are instances of the `typing.List` type parameter.
             if not isinstance(obj, list):
                 return _not_instance("Value %s is not a list."%short_str(obj), failure_callback=failure_callback)
-            if all(is_instance(x, t.__args__[0], failure_callback=failure_callback, cast_decimal=cast_decimal) for x in obj):
+            if _is_prevalidated(obj, t, 0) or all(is_instance(x, t.__args__[0], failure_callback=failure_callback, cast_decimal=cast_decimal, validation=validation) for x in validation.elements(obj)):
                 return True
             return _not_instance("Not all elements of %s are of type %s."%(short_str(obj), str(t.__args__[0])), failure_callback=failure_callback)
         if t.__origin__ is tuple: # Tuple[T1, T2, ..., TN] or Tuple[T, ...] (with an actual ellipse `...` as the second type parameter of `typing.Tuple`)
@@ -308,35 +324,35 @@ def is_instance(obj: Any, t: Type, failure_callback: Optional[Callable[[str], No
                 return _not_instance("Value %s is not a tuple."%short_str(obj), failure_callback=failure_callback)
             if len(t.__args__) == 2 and t.__args__[1] is ...: # pylint:disable=no-else-return
                 # for variadic tuples, all elements have to be of the same type.
-                if all(is_instance(x, t.__args__[0], failure_callback=failure_callback, cast_decimal=cast_decimal) for x in obj):
+                if all(is_instance(x, t.__args__[0], failure_callback=failure_callback, cast_decimal=cast_decimal, validation=validation) for x in validation.elements(obj)):
                     return True
                 return _not_instance("Not all elements of %s are of type %s."%(short_str(obj), str(t.__args__[0])), failure_callback=failure_callback)
             else:
                 # for fixed-length tuples, each element has to be of the correct positional type.
                 if len(obj) != len(t.__args__):
                     return _not_instance("Tuple %s is of the wrong length for type %s"%(short_str(obj), str(t)), failure_callback=failure_callback)
-                if all(is_instance(x, t.__args__[i], failure_callback=failure_callback, cast_decimal=cast_decimal) for i, x in enumerate(obj)):
+                if all(is_instance(x, t.__args__[i], failure_callback=failure_callback, cast_decimal=cast_decimal, validation=validation) for i, x in enumerate(obj)):
                     return True
                 return _not_instance("Not all values in %s are of the respective types specified by %s"%(short_str(obj), str(t)), failure_callback=failure_callback)
         if t.__origin__ is set: # Set[T]
             # For `typing.Set`, check that `obj` is a `set` and that all elements of `obj` are instances of the `typing.Set` type parameter.
             if not isinstance(obj, set):
                 return _not_instance("Value %s is not a set."%short_str(obj), failure_callback=failure_callback)
-            if all(is_instance(x, t.__args__[0], failure_callback=failure_callback, cast_decimal=cast_decimal) for x in obj):
+            if _is_prevalidated(obj, t, 0) or all(is_instance(x, t.__args__[0], failure_callback=failure_callback, cast_decimal=cast_decimal, validation=validation) for x in validation.elements(obj)):
                 return True
             return _not_instance("Not all elements of %s are of type %s."%(short_str(obj), str(t.__args__[0])), failure_callback=failure_callback)
         if t.__origin__ is frozenset: # FrozenSet[T]
             # For `typing.FrozenSet`, check that `obj` is a `frozenset` and that all elements of `obj` are instances of the `typing.FrozenSet` type parameter.
             if not isinstance(obj, frozenset):
                 return _not_instance("Value %s is not a frozenset."%short_str(obj), failure_callback=failure_callback)
-            if all(is_instance(x, t.__args__[0], failure_callback=failure_callback, cast_decimal=cast_decimal) for x in obj):
+            if all(is_instance(x, t.__args__[0], failure_callback=failure_callback, cast_decimal=cast_decimal, validation=validation) for x in validation.elements(obj)):
                 return True
             return _not_instance("Not all elements of %s are of type %s."%(short_str(obj), str(t.__args__[0])), failure_callback=failure_callback)
         if t.__origin__ is deque: # Deque[T]
             # For `typing.Deque`, check that `obj` is a `deque` and that all elements of `obj` are instances of the `typing.Deque` type parameter.
             if not isinstance(obj, deque):
                 return _not_instance("Value %s is not a deque."%short_str(obj), failure_callback=failure_callback)
-            if all(is_instance(x, t.__args__[0], failure_callback=failure_callback, cast_decimal=cast_decimal) for x in obj):
+            if _is_prevalidated(obj, t, 0) or all(is_instance(x, t.__args__[0], failure_callback=failure_callback, cast_decimal=cast_decimal, validation=validation) for x in validation.elements(obj)):
                 return True
             return _not_instance("Not all elements of %s are of type %s."%(short_str(obj), str(t.__args__[0])), failure_callback=failure_callback)
         if t.__origin__ is dict: # Dict[K,V]
@@ -345,9 +361,9 @@ def is_instance(obj: Any, t: Type, failure_callback: Optional[Callable[[str], No
             # and check that all values of `obj` are instances of the econd `typing.Dict` type parameter.
             if not isinstance(obj, (dict)):
                 return _not_instance("Value %s is not a dict."%short_str(obj), failure_callback=failure_callback)
-            if not all(is_instance(x, t.__args__[0], failure_callback=failure_callback, cast_decimal=cast_decimal) for x in obj):
+            if not _is_prevalidated(obj, t, 0) and not all(is_instance(x, t.__args__[0], failure_callback=failure_callback, cast_decimal=cast_decimal, validation=validation) for x in validation.elements(obj)):
                 return _not_instance("Not all keys of %s are of type %s."%(short_str(obj), str(t.__args__[0])), failure_callback=failure_callback)
-            if not all(is_instance(obj[x], t.__args__[1], failure_callback=failure_callback, cast_decimal=cast_decimal) for x in obj):
+            if not _is_prevalidated(obj, t, 1) and not all(is_instance(obj[x], t.__args__[1], failure_callback=failure_callback, cast_decimal=cast_decimal, validation=validation) for x in validation.elements(obj)):
                 return _not_instance("Not all values of %s are of type %s."%(short_str(obj), str(t.__args__[1])), failure_callback=failure_callback)
             return True
         if t.__origin__ is OrderedDict: # OrderedDict[K,V]
@@ -356,9 +372,9 @@ def is_instance(obj: Any, t: Type, failure_callback: Optional[Callable[[str], No
             # and check that all values of `obj` are instances of the econd `typing.OrderedDict` type parameter.
             if not isinstance(obj, (OrderedDict)):
                 return _not_instance("Value %s is not an OrderedDict."%short_str(obj), failure_callback=failure_callback)
-            if not all(is_instance(x, t.__args__[0], failure_callback=failure_callback, cast_decimal=cast_decimal) for x in obj):
+            if not all(is_instance(x, t.__args__[0], failure_callback=failure_callback, cast_decimal=cast_decimal, validation=validation) for x in validation.elements(obj)):
                 return _not_instance("Not all keys of %s are of type %s."%(short_str(obj), str(t.__args__[0])), failure_callback=failure_callback)
-            if not all(is_instance(obj[x], t.__args__[1], failure_callback=failure_callback, cast_decimal=cast_decimal) for x in obj):
+            if not all(is_instance(obj[x], t.__args__[1], failure_callback=failure_callback, cast_decimal=cast_decimal, validation=validation) for x in validation.elements(obj)):
                 return _not_instance("Not all values of %s are of type %s."%(short_str(obj), str(t.__args__[1])), failure_callback=failure_callback)
             return True
         if t.__origin__ is Mapping: # Mapping[K,V], used for read-only dictionaries.
@@ -367,9 +383,9 @@ def is_instance(obj: Any, t: Type, failure_callback: Optional[Callable[[str], No
             # and check that all values of `obj` are instances of the econd `typing.Mapping` type parameter.
             if not isinstance(obj, (dict, OrderedDict)):
                 return _not_instance("Value %s is not a dict or OrderedDict."%short_str(obj), failure_callback=failure_callback)
-            if not all(is_instance(x, t.__args__[0], failure_callback=failure_callback, cast_decimal=cast_decimal) for x in obj):
+            if not _is_prevalidated(obj, t, 0) and not all(is_instance(x, t.__args__[0], failure_callback=failure_callback, cast_decimal=cast_decimal, validation=validation) for x in validation.elements(obj)):
                 return _not_instance("Not all keys of %s are of type %s."%(short_str(obj), str(t.__args__[0])), failure_callback=failure_callback)
-            if not all(is_instance(obj[x], t.__args__[1], failure_callback=failure_callback, cast_decimal=cast_decimal) for x in obj):
+            if not _is_prevalidated(obj, t, 1) and not all(is_instance(obj[x], t.__args__[1], failure_callback=failure_callback, cast_decimal=cast_decimal, validation=validation) for x in validation.elements(obj)):
                 return _not_instance("Not all values of %s are of type %s."%(short_str(obj), str(t.__args__[1])), failure_callback=failure_callback)
             return True
     if failure_callback:
@@ -377,6 +393,16 @@ def is_instance(obj: Any, t: Type, failure_callback: Optional[Callable[[str], No
     raise TypeError("Type %s is not supported."%str(t))
 
 
+def _is_prevalidated(obj: Any, t: Type, i: int) -> bool:
+    """
+        Whether `obj` is a typed container (cf.&nbsp;`typing_json.containers`) validated on insertion for the generic type arguments of `t`,
+        whose `i`-th generic type argument is deeply immutable (so that the corresponding elements cannot have been modified since insertion).
+    """
+    if obj.__class__ in (list, set, dict, deque):
+        return False
+    return getattr(obj, "_typed_args", None) == t.__args__ and is_deeply_immutable(t.__args__[i])
+
+
 def _not_namedtuple(message: str, failure_callback: Optional[Callable[[str], None]]) -> Literal[False]:
     """ Utility message to fail (return `False`) by first calling an optional failure callback. """
     if failure_callback:
@@ -444,7 +470,7 @@ def is_namedtuple(t: Type, failure_callback: Optional[Callable[[str], None]] = N
     for n in field_defaults:
         if not n in fields:
             return _not_namedtuple("Field %s appears in _field_defaults but not in _fields for type %s."%(n, str(t)), failure_callback=failure_callback)
-        if check_typecheckable and not is_instance(field_defaults[n], field_types[n], failure_callback=failure_callback, cast_decimal=cast_decimal):
+        if check_typecheckable and not is_instance(field_defaults[n], field_types[n], failure_callback=failure_callback, cast_decimal=cast_decimal, validation=FULL_VALIDATION):
             return _not_namedtuple("Default value for field %s of type %s should be of type %s, found type %s instead."%(n, str(t), str(field_types[n]), str(type(field_defaults[n]))), failure_callback=failure_callback)
     for n in fields:
         if n not in dir(t):
@@ -505,6 +531,83 @@ def is_typed_dict(t: Type, failure_callback: Optional[Callable[[str], None]] = N
         if hasattr(t, n):
             # default value set for this field
             field_default = getattr(t, n)
-            if check_typecheckable and not is_instance(field_default, fields[n], failure_callback=failure_callback, cast_decimal=cast_decimal):
+            if check_typecheckable and not is_instance(field_default, fields[n], failure_callback=failure_callback, cast_decimal=cast_decimal, validation=FULL_VALIDATION):
                 return _not_typed_dict("Default value for field %s of type %s should be of type %s, found type %s instead."%(n, str(t), str(fields[n]), str(type(field_default))), failure_callback=failure_callback)
     return True
+
+
+@lru_cache(maxsize=None)
+def is_deeply_immutable(t: Type) -> bool:
+    """ Whether all instances of the typecheckable type `t` are deeply immutable, so that their validity and their encoding cannot change once computed. """
+    # pylint: disable = too-many-return-statements
+    if t in JSON_BASE_TYPES or t in (Decimal, complex, bytes) or t is None or isinstance(t, EnumMeta):
+        return True
+    if is_namedtuple(t):
+        return all(is_deeply_immutable(s) for s in getattr(t, "_field_types").values())
+    if hasattr(t, "__origin__") and hasattr(t, "__args__"):
+        if t.__origin__ is Literal:
+            return True
+        if t.__origin__ in (Union, frozenset):
+            return all(is_deeply_immutable(s) for s in t.__args__)
+        if t.__origin__ is tuple:
+            return all(s is ... or is_deeply_immutable(s) for s in t.__args__)
+    return False
+
+
+def contains_type(t: Type, predicate: Callable[[Type], bool]) -> bool:
+    """ Checks whether `predicate` holds for `t` or for any of the types appearing in it (field types, generic type arguments, etc). """
+    if predicate(t):
+        return True
+    if is_namedtuple(t):
+        return any(contains_type(s, predicate) for s in getattr(t, "_field_types").values())
+    if is_typed_dict(t):
+        return any(contains_type(s, predicate) for s in getattr(t, "__annotations__").values())
+    if hasattr(t, "__origin__") and hasattr(t, "__args__") and t.__origin__ is not Literal:
+        return any(contains_type(s, predicate) for s in t.__args__ if s is not ...)
+    return False
+
+
+def mark_as_validated(obj: Any, t: Type) -> int:
+    """
+        Marks `obj` as a valid instance of type `t`, so that `typing_json.typechecking.is_instance` (and hence `typing_json.encoding.to_json_obj`
+        with `typecheck=True`) can later skip re-validating it. No check is performed: the caller is responsible for `obj` being a valid instance of `t`,
+        e.g. because it was returned by `typing_json.decoding.from_json_obj` or produced by a trusted constructor.
+
+        Only deeply immutable objects are marked, so that marks cannot be invalidated by later modifications:
+        if `obj` is a tuple, namedtuple or frozenset and all instances of `t` are deeply immutable, `obj` itself is marked;
+        otherwise, the largest deeply immutable parts of `obj` are marked, by descending into lists, deques, sets, dictionaries,
+        typed dictionaries and optional values (values of other union types are not marked).
+
+        Returns the number of objects marked. The marks are held in a bounded registry (cf. the `typing_json.validation` module).
+    """
+    # pylint: disable = too-many-return-statements, too-many-branches
+    if obj is None:
+        return 0
+    if hasattr(t, "__origin__") and t.__origin__ is Union:
+        non_none_args = [s for s in t.__args__ if s not in (None, type(None))]
+        if len(non_none_args) != 1:
+            return 0
+        # `obj` is an instance of the optional type `t` and is not `None`, so it is an instance of the non-`None` argument (which union encoding/decoding will check)
+        marked = mark_as_validated(obj, non_none_args[0])
+        if marked == 1 and is_deeply_immutable(cast(Hashable, t)) and is_marked_validated(obj, non_none_args[0]):
+            register_validated(obj, t)
+        return marked
+    if is_deeply_immutable(cast(Hashable, t)):
+        if isinstance(obj, (tuple, frozenset)):
+            register_validated(obj, t)
+            return 1
+        return 0
+    if is_typed_dict(t):
+        field_types = getattr(t, "__annotations__")
+        return sum(mark_as_validated(obj[field], field_types[field]) for field in field_types if field in obj)
+    if hasattr(t, "__origin__") and hasattr(t, "__args__"):
+        if t.__origin__ in (list, deque, set, frozenset) or (t.__origin__ is tuple and len(t.__args__) == 2 and t.__args__[1] is ...):
+            return sum(mark_as_validated(x, t.__args__[0]) for x in obj)
+        if t.__origin__ is tuple:
+            return sum(mark_as_validated(x, s) for x, s in zip(obj, t.__args__))
+        if t.__origin__ in (dict, OrderedDict, Mapping):
+            return sum(mark_as_validated(k, t.__args__[0]) + mark_as_validated(v, t.__args__[1]) for k, v in obj.items())
+    if is_namedtuple(t):
+        field_types = getattr(t, "_field_types")
+        return sum(mark_as_validated(getattr(obj, field), field_types[field]) for field in getattr(t, "_fields"))
+    return 0
@@ -0,0 +1,219 @@
+#pylint:disable = line-too-long, invalid-name
+"""
+    The `typing_json.unions` module provides adaptive ordering of the trials performed when encoding/decoding union types.
+
+    By default, `typing_json.encoding.to_json_obj` and `typing_json.decoding.from_json_obj` try the generic type arguments
+    of a `typing.Union` in declaration order, so that values matching the last argument pay for all the previous failed trials.
+    In adaptive mode (enabled process-wide by `typing_json.unions.set_adaptive_unions`, or per call by the `adaptive_unions` parameter),
+    hit statistics are recorded for each union type and the trials are periodically reordered towards the most frequent hits.
+
+    Reordering is constrained so that results are the same as in declaration order: an argument is never tried before an earlier-declared argument
+    that could accept some of the same values (e.g. `float` is never tried before `int`, and `typing.Tuple` is never tried before a namedtuple).
+    Hence adaptive mode only changes the cost of encoding/decoding, never its result, and the trial order does not depend on the history of the process.
+
+    (Version: 0.1.3)
+"""
+
+# standard imports
+from collections import deque, OrderedDict
+from collections.abc import Mapping
+from decimal import Decimal
+from enum import EnumMeta
+import threading
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Tuple, Type, Union
+
+# external dependencies
+from typing_extensions import Literal
+
+# internal imports
+from typing_json.typechecking import is_namedtuple, is_typed_dict
+
+
+_REORDER_INTERVAL = 256
+""" Number of hits recorded for a union type between consecutive recomputations of its trial order. """
+
+
+_NUMBER_CLASSES: FrozenSet[type] = frozenset({bool, int, float, Decimal})
+""" Classes which can compare equal to each other, relevant to the matching of literals. """
+
+
+def _literal_classes(t: Type) -> FrozenSet[type]:
+    """ Classes of the values matching the literal type `t` (literals are matched by equality, and numbers of different classes can be equal). """
+    classes = frozenset(type(s) for s in t.__args__)
+    if classes & _NUMBER_CLASSES:
+        classes |= _NUMBER_CLASSES
+    return classes
+
+
+def _encoding_classes(t: Type) -> FrozenSet[type]:
+    """ Python classes whose instances may be deemed instances of `t` by `typing_json.typechecking.is_instance`. """
+    # pylint: disable = too-many-return-statements, too-many-branches
+    if t in (None, type(None)):
+        return frozenset({type(None)})
+    if t is int:
+        return frozenset({int, Decimal})
+    if t is float:
+        return frozenset({int, float, Decimal})
+    if t in (bool, str, Decimal) or isinstance(t, EnumMeta):
+        return frozenset({t})
+    if is_namedtuple(t):
+        return frozenset({t})
+    if is_typed_dict(t):
+        return frozenset({dict})
+    if hasattr(t, "__origin__") and hasattr(t, "__args__"):
+        if t.__origin__ is Union:
+            return frozenset().union(*(_encoding_classes(s) for s in t.__args__))
+        if t.__origin__ is Literal:
+            return _literal_classes(t)
+        if t.__origin__ in (list, tuple, set, frozenset, deque, dict, OrderedDict):
+            return frozenset({t.__origin__})
+        if t.__origin__ is Mapping:
+            return frozenset({dict})
+    return frozenset({object})
+
+
+def _decoding_classes(t: Type) -> FrozenSet[type]:
+    """ Classes of the JSON values which may be accepted by `typing_json.decoding.from_json_obj` when decoding into `t`. """
+    # pylint: disable = too-many-return-statements, too-many-branches
+    if t in (None, type(None)):
+        return frozenset({type(None)})
+    if t is int:
+        return frozenset({int, Decimal})
+    if t is float:
+        return frozenset({int, float, Decimal})
+    if t is Decimal:
+        return frozenset({int, float, str, Decimal})
+    if t in (bool, str):
+        return frozenset({t})
+    if isinstance(t, EnumMeta):
+        # enum values can be encoded by name, value or ordinal (cf. `typing_json.enums`)
+        classes = frozenset({str, int}).union(type(m.value) for m in t) # type: ignore
+        if classes & {int, float}:
+            classes |= _NUMBER_CLASSES
+        return classes
+    if is_namedtuple(t):
+        return frozenset({list, dict})
+    if is_typed_dict(t):
+        return frozenset({dict})
+    if hasattr(t, "__origin__") and hasattr(t, "__args__"):
+        if t.__origin__ is Union:
+            return frozenset().union(*(_decoding_classes(s) for s in t.__args__))
+        if t.__origin__ is Literal:
+            return _literal_classes(t)
+        if t.__origin__ in (list, deque) or t.__origin__ is tuple and t.__args__[-1] is ...:
+            if is_namedtuple(t.__args__[0]) or is_typed_dict(t.__args__[0]) and getattr(t.__args__[0], "__total__"):
+                # lists of records can also be decoded from their columnar layout (profiles are shared by calls with and without `columnar`)
+                return frozenset({list, dict})
+            return frozenset({list})
+        if t.__origin__ in (tuple, set, frozenset):
+            return frozenset({list})
+        if t.__origin__ in (dict, OrderedDict, Mapping):
+            return frozenset({dict})
+    return frozenset({object})
+
+
+def _overlap(classes1: FrozenSet[type], classes2: FrozenSet[type]) -> bool:
+    """ Whether some object could be an instance of some class in `classes1` and of some class in `classes2` at the same time. """
+    return any(issubclass(c1, c2) or issubclass(c2, c1) for c1 in classes1 for c2 in classes2)
+
+
+class UnionStats(NamedTuple):
+    """
+        Statistics recorded for a union type in adaptive mode:
+
+        - `hits` maps each generic type argument of the union to the number of values it was used to encode/decode;
+        - `order` lists the generic type arguments of the union in the order in which they are currently tried.
+    """
+    hits: Dict[Any, int]
+    order: Tuple[Any, ...]
+
+
+class UnionProfile:
+    """
+        Hit statistics and current trial order for the generic type arguments of a union type `t`,
+        either for encoding or for decoding (the two have different constraints on reordering).
+    """
+
+    __slots__ = ("t", "hits", "order", "_blockers", "_countdown")
+
+    def __init__(self, t: Type, encoding: bool):
+        members = t.__args__
+        classes = [_encoding_classes(s) if encoding else _decoding_classes(s) for s in members]
+        self.t = t
+        self.hits = [0 for _ in members]
+        self.order: Tuple[int, ...] = tuple(range(len(members)))
+        # `_blockers[i]` lists the earlier-declared arguments which must be tried before argument `i`
+        self._blockers = [tuple(j for j in range(i) if _overlap(classes[j], classes[i])) for i in range(len(members))]
+        self._countdown = _REORDER_INTERVAL
+
+    def record(self, i: int) -> None:
+        """ Records a hit for the `i`-th generic type argument, periodically recomputing the trial order. """
+        self.hits[i] += 1
+        self._countdown -= 1
+        if self._countdown <= 0:
+            self._countdown = _REORDER_INTERVAL
+            self.reorder()
+
+    def reorder(self) -> None:
+        """
+            Recomputes the trial order, by repeatedly picking the argument with the most hits (ties broken by declaration order)
+            amongst those whose blockers have already been picked.
+        """
+        hits = list(self.hits)
+        order: List[int] = []
+        remaining = list(range(len(hits)))
+        while remaining:
+            candidates = [i for i in remaining if all(j in order for j in self._blockers[i])]
+            best = max(candidates, key=lambda i: (hits[i], -i))
+            order.append(best)
+            remaining.remove(best)
+        self.order = tuple(order)
+
+    def stats(self) -> UnionStats:
+        """ Returns a snapshot of the statistics for this union type. """
+        members = self.t.__args__
+        return UnionStats({members[i]: h for i, h in enumerate(self.hits)}, tuple(members[i] for i in self.order))
+
+
+_adaptive_unions: bool = False
+_profiles_lock = threading.Lock()
+_encoding_profiles: Dict[Any, UnionProfile] = {}
+_decoding_profiles: Dict[Any, UnionProfile] = {}
+
+
+def set_adaptive_unions(enabled: bool) -> None:
+    """ Enables/disables adaptive mode process-wide, for all calls which do not explicitly set the `adaptive_unions` parameter. """
+    global _adaptive_unions # pylint: disable = global-statement
+    _adaptive_unions = enabled
+
+
+def adaptive_unions_enabled() -> bool:
+    """ Whether adaptive mode is enabled process-wide (cf. `typing_json.unions.set_adaptive_unions`). """
+    return _adaptive_unions
+
+
+def union_profile(t: Type, encoding: bool) -> UnionProfile:
+    """ Returns the profile of union type `t` for encoding (if `encoding` is `True`) or decoding (if `encoding` is `False`), creating it if necessary. """
+    profiles = _encoding_profiles if encoding else _decoding_profiles
+    profile = profiles.get(t)
+    if profile is None:
+        with _profiles_lock:
+            profile = profiles.get(t)
+            if profile is None:
+                profile = UnionProfile(t, encoding)
+                profiles[t] = profile
+    return profile
+
+
+def union_stats(encoding: bool = False) -> Dict[Any, UnionStats]:
+    """ Returns the statistics recorded so far for all union types, for encoding (if `encoding` is `True`) or decoding (if `encoding` is `False`). """
+    profiles = _encoding_profiles if encoding else _decoding_profiles
+    with _profiles_lock:
+        return {t: profile.stats() for t, profile in profiles.items()}
+
+
+def reset_union_stats() -> None:
+    """ Discards all statistics recorded so far, restoring declaration order for all union types. """
+    with _profiles_lock:
+        _encoding_profiles.clear()
+        _decoding_profiles.clear()
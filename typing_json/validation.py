@@ -0,0 +1,165 @@
+#pylint:disable = line-too-long, invalid-name
+"""
+    The `typing_json.validation` module provides validation policies, controlling which elements of collections are validated.
+
+    By default, `typing_json.typechecking.is_instance`, `typing_json.encoding.to_json_obj` (with `typecheck=True`) and
+    `typing_json.decoding.from_json_obj` validate every element of every collection.
+    A `typing_json.validation.ValidationPolicy` can be passed to these functions (and to `typing_json.dump`, `typing_json.dumps`,
+    `typing_json.load` and `typing_json.loads`) via the optional `validation` parameter, or set process-wide using
+    `typing_json.validation.set_validation_policy`, to validate only some of the elements of each collection:
+
+    - `typing_json.validation.FULL_VALIDATION` validates all elements (the default);
+    - `typing_json.validation.sampled_validation(rate, seed)` validates a deterministic sample of the elements, of size `rate` times the size of the collection (rounded up);
+    - `typing_json.validation.first_n_validation(n)` validates the first `n` elements of each collection (in iteration order);
+    - `typing_json.validation.NO_VALIDATION` validates no elements.
+
+    Policies only apply to the elements of lists, tuples of variable length, sets, frozensets, deques and to the entries of dictionaries/mappings:
+    all other checks (the class of values, the fields of namedtuples and typed dictionaries, unions and literals) are always performed.
+    When decoding, elements of collections which are not validated are only skipped if their type is a JSON basic type or a literal type
+    (numbers are still cast to the required type, but no other check is performed, and non-integral numbers raise `TypeError` rather than being truncated to `int`):
+    other elements need to be decoded anyway, and are hence validated.
+
+    Sampling is deterministic: the elements validated in a collection only depend on the size of the collection and on the seed,
+    so that validation failures can be reproduced by using the same seed.
+
+    This module also holds a bounded registry of immutable objects (tuples, namedtuples and frozensets) which are known to be valid instances of given types,
+    so that `typing_json.typechecking.is_instance` can skip re-validating them: objects are marked by `typing_json.typechecking.mark_as_validated`
+    (or by passing `mark_validated=True` to `typing_json.decoding.from_json_obj`), and marks can be discarded with `typing_json.validation.clear_validated_marks`.
+    The registry holds strong references to the marked objects (tuples cannot be weakly referenced), up to a capacity set by
+    `typing_json.validation.set_validated_marks_capacity`: when the capacity is exceeded, the least recently marked objects are evicted.
+
+    (Version: 0.1.3)
+"""
+
+# standard imports
+from collections import OrderedDict
+from itertools import islice
+from math import ceil
+import threading
+from typing import Any, Iterable, NamedTuple, Tuple, Type
+
+
+_MIX_MULTIPLIER = 0x9E3779B97F4A7C15
+""" Multiplier used to mix the seed and the collection size into the offset of a sample. """
+
+
+class ValidationPolicy(NamedTuple):
+    """
+        A validation policy for elements of collections, with one of the following modes:
+
+        - `"full"`, all elements are validated;
+        - `"sampled"`, `ceil(n*rate)` evenly spaced elements of a collection of size `n` are validated, starting from an offset determined by `seed` and `n`;
+        - `"first"`, the first `limit` elements are validated;
+        - `"off"`, no elements are validated.
+
+        Rather than constructing instances directly, use the constants `typing_json.validation.FULL_VALIDATION` and `typing_json.validation.NO_VALIDATION`,
+        or the functions `typing_json.validation.sampled_validation` and `typing_json.validation.first_n_validation`.
+    """
+    mode: str
+    rate: float = 1.0
+    limit: int = 0
+    seed: int = 0
+
+    def indices(self, n: int) -> range:
+        """ Returns the range of the (iteration) indices of elements to be validated in a collection of size `n`. """
+        if self.mode == "full":
+            return range(n)
+        if self.mode == "first":
+            return range(min(n, self.limit))
+        if self.mode == "sampled":
+            if n == 0:
+                return range(0)
+            # validate ceil(n*rate) evenly spaced elements, so that the validated fraction is never below the rate
+            count = ceil(n*self.rate)
+            step = n//count
+            offset = ((self.seed*_MIX_MULTIPLIER)^(n*_MIX_MULTIPLIER>>7))%(n-(count-1)*step)
+            return range(offset, offset+count*step, step)
+        return range(0)
+
+    def elements(self, collection: Iterable) -> Iterable:
+        """ Returns an iterable over the elements of `collection` to be validated (the keys, for a mapping). """
+        if self.mode == "full":
+            return collection
+        r = self.indices(len(collection)) # type: ignore
+        return islice(collection, r.start, r.stop, r.step)
+
+
+FULL_VALIDATION = ValidationPolicy("full")
+""" Policy validating all elements of collections. """
+
+NO_VALIDATION = ValidationPolicy("off")
+""" Policy validating no elements of collections. """
+
+
+def sampled_validation(rate: float, seed: int = 0) -> ValidationPolicy:
+    """
+        Returns a policy validating a fraction `rate` of the elements of each collection (rounded up), where `0 < rate <= 1`.
+        The elements validated in a collection are determined by the `seed` and by the size of the collection.
+    """
+    if not 0 < rate <= 1:
+        raise ValueError("Sampling rate must be in the interval (0, 1], found %s instead."%str(rate))
+    return ValidationPolicy("sampled", rate=rate, seed=seed)
+
+
+def first_n_validation(n: int) -> ValidationPolicy:
+    """ Returns a policy validating the first `n` elements of each collection (in iteration order). """
+    if n < 0:
+        raise ValueError("Number of elements must be non-negative, found %d instead."%n)
+    return ValidationPolicy("first", limit=n)
+
+
+_validation_policy: ValidationPolicy = FULL_VALIDATION
+
+
+def set_validation_policy(policy: ValidationPolicy) -> None:
+    """ Sets the process-wide validation policy, used by all calls which do not explicitly set the `validation` parameter. """
+    global _validation_policy # pylint: disable = global-statement
+    _validation_policy = policy
+
+
+def get_validation_policy() -> ValidationPolicy:
+    """ Returns the process-wide validation policy (cf. `typing_json.validation.set_validation_policy`). """
+    return _validation_policy
+
+
+_validated_marks: "OrderedDict[Tuple[int, Any], Any]" = OrderedDict()
+""" Registry of validated objects, mapping `(id(obj), t)` to `obj` (the strong reference keeps the id from being reused). """
+
+_validated_marks_lock = threading.Lock()
+_validated_marks_capacity: int = 4096
+
+
+def register_validated(obj: Any, t: Type) -> None:
+    """
+        Registers the immutable object `obj` as a valid instance of type `t`, without any check
+        (use `typing_json.typechecking.mark_as_validated`, which only registers deeply immutable objects).
+    """
+    key = (id(obj), t)
+    with _validated_marks_lock:
+        if key in _validated_marks:
+            _validated_marks.move_to_end(key)
+        _validated_marks[key] = obj
+        while len(_validated_marks) > _validated_marks_capacity:
+            _validated_marks.popitem(last=False)
+
+
+def is_marked_validated(obj: Any, t: Type) -> bool:
+    """ Whether `obj` is currently registered as a valid instance of type `t` (cheap when no objects are registered). """
+    return bool(_validated_marks) and _validated_marks.get((id(obj), t)) is obj
+
+
+def clear_validated_marks() -> None:
+    """ Discards all validated marks, releasing the references to the marked objects. """
+    with _validated_marks_lock:
+        _validated_marks.clear()
+
+
+def set_validated_marks_capacity(capacity: int) -> None:
+    """ Sets the maximum number of validated marks held at any time (default: 4096), evicting the least recently marked objects if necessary. """
+    global _validated_marks_capacity # pylint: disable = global-statement
+    if capacity < 0:
+        raise ValueError("Capacity must be non-negative, found %d instead."%capacity)
+    with _validated_marks_lock:
+        _validated_marks_capacity = capacity
+        while len(_validated_marks) > capacity:
+            _validated_marks.popitem(last=False)